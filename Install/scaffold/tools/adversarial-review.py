@@ -8,6 +8,9 @@ Commands:
     respond      Continue conversation within an iteration (inner loop exchange).
     consensus    Request final consensus summary after discussion.
     check-config Verify configuration and API key.
+    batch-submit  Submit many reviews as one provider batch (OpenAI / Anthropic).
+    batch-status  Poll a submitted batch.
+    batch-results Fetch a finished batch's reviews (--wait to poll until done).
 
 Conversation Model:
     Outer loop (iterations): Fresh review of the document after changes applied.
@@ -18,37 +21,79 @@ Conversation Model:
     ...up to max_iterations or until reviewer finds no issues.
 
 Conversation state is saved to .reviews/ so exchanges can continue across calls.
-No pip dependencies — uses urllib only.
+Review prompts put the stable part (system prompt, scope, glossary, document,
+context) first so providers can serve it from their prompt cache across the
+sections of a document; token usage, including cached tokens, is recorded per
+call in the conversation's "usage" list ("prompt_cache": false disables the
+Anthropic cache markers). Follow-up calls send a compacted history once the
+discussion outgrows "compaction.max_history_tokens" (see History Compaction).
+No pip dependencies — standard library only (http.client via http_pool.py).
+
+Library API:
+    The same operations are importable (the module name is hyphenated, so load
+    it with importlib). review(), respond(), consensus() and check_config()
+    return dicts — failures come back as {"error": ...} rather than exiting.
+    iterate.py calls these directly instead of spawning this script.
+    batch_submit(), batch_status() and batch_results() drive the providers'
+    asynchronous batch endpoints for whole-range reviews (iterate.py batch-*).
 
 Environment:
     OPENAI_API_KEY or ANTHROPIC_API_KEY — set via .env file in project root or env var.
 """
 
 import json
+import math
 import os
+import queue
 import sys
 import argparse
 import hashlib
 import re
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
 
+import http_pool
+import rate_limit
+import review_cache
+import sse_stream
+
 # ---------------------------------------------------------------------------
 # Configuration & Auth
 # ---------------------------------------------------------------------------
 
+CONFIG_PATH = Path(__file__).parent / "review_config.json"
+
+# In-process cache of the parsed config file, keyed by mtime/size
+_config_cache = {}
+
+
 def load_config(profile=None):
     """Load review_config.json, optionally merging a named profile.
 
     Profiles (e.g., "code_review") override provider, model, and fallback_order
     settings from the top-level config. API keys are inherited from the top level.
     """
-    config_path = Path(__file__).parent / "review_config.json"
-    if not config_path.exists():
-        print(json.dumps({"error": "review_config.json not found", "path": str(config_path)}))
+    config = _read_config(profile)
+    if config is None:
+        print(json.dumps({"error": "review_config.json not found", "path": str(CONFIG_PATH)}))
         sys.exit(1)
-    with open(config_path, encoding="utf-8") as f:
-        base_config = json.load(f)
+    return config
+
+
+def _read_config(profile=None):
+    """Load and merge the config. Returns None if review_config.json is missing."""
+    try:
+        st = CONFIG_PATH.stat()
+    except OSError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    if _config_cache.get("stamp") != stamp:
+        with open(CONFIG_PATH, encoding="utf-8") as f:
+            _config_cache.update(stamp=stamp, data=json.load(f))
+    # Deep copy so callers (and profile merges) never mutate the cached config
+    base_config = json.loads(json.dumps(_config_cache["data"]))
 
     if not profile or profile not in base_config:
         return base_config
@@ -73,6 +118,15 @@ def load_config(profile=None):
 
 def get_api_key(config):
     """Resolve API key from environment variable or .env file."""
+    key = _resolve_api_key(config)
+    if not key:
+        print(json.dumps(_api_key_error(config)))
+        sys.exit(1)
+    return key
+
+
+def _resolve_api_key(config):
+    """API key for the primary provider, or None if not configured."""
     provider = config.get("provider", "openai")
     provider_config = config.get(provider, {})
     env_var = provider_config.get("api_key_env", "OPENAI_API_KEY")
@@ -96,18 +150,31 @@ def get_api_key(config):
                         break
             if key:
                 break
-
-    if not key:
-        print(json.dumps({
-            "error": "API key not found",
-            "provider": provider,
-            "checked": [f"Environment variable: {env_var}", ".env file in scaffold/", ".env file in project root"],
-            "fix": f"Set {env_var} in your environment or create .env in project root with:\n{env_var}=your-key-here"
-        }))
-        sys.exit(1)
     return key
 
 
+def _api_key_error(config):
+    provider = config.get("provider", "openai")
+    env_var = config.get(provider, {}).get("api_key_env", "OPENAI_API_KEY")
+    return {
+        "error": "API key not found",
+        "provider": provider,
+        "checked": [f"Environment variable: {env_var}", ".env file in scaffold/", ".env file in project root"],
+        "fix": f"Set {env_var} in your environment or create .env in project root with:\n{env_var}=your-key-here"
+    }
+
+
+def _load_config_and_key(profile=None):
+    """Returns (config, api_key, None) or (None, None, error_dict)."""
+    config = _read_config(profile)
+    if config is None:
+        return None, None, {"error": "review_config.json not found", "path": str(CONFIG_PATH)}
+    api_key = _resolve_api_key(config)
+    if not api_key:
+        return None, None, _api_key_error(config)
+    return config, api_key, None
+
+
 # ---------------------------------------------------------------------------
 # Conversation State
 # ---------------------------------------------------------------------------
@@ -127,6 +194,8 @@ def conv_path(doc_path, iteration):
 
 
 def save_conversation(path, data):
+    if "messages" in data:
+        data["history_tokens"] = _message_tokens(data["messages"])
     with open(path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
 
@@ -435,43 +504,273 @@ def get_max_tokens(config, provider):
 
 
 # ---------------------------------------------------------------------------
-# API Calls — OpenAI
+# HTTP Transport
 # ---------------------------------------------------------------------------
 
-def call_openai(api_key, config, messages):
-    """Call OpenAI API with JSON response format. Used for review and consensus."""
-    import urllib.request
+def _post_json(provider, url, payload, headers, timeout=180, stream=False, on_issue=None):
+    """POST a JSON payload and return the decoded response body.
+
+    Paces the request through the shared per-provider rate limiter and feeds
+    it the response's rate-limit headers. Sent over a pooled keep-alive
+    connection (http_pool.py); urllib errors propagate to the caller's
+    handlers.
+
+    With stream=True the response is read as server-sent events
+    (sse_stream.py) and reassembled into the non-streaming body shape;
+    on_issue(issue) is called for each issue as soon as it is complete. A
+    stream that stops early comes back with "_interrupted": {"error", "text"}."""
     import urllib.error
 
-    provider_config = config.get("openai", {})
-    model = provider_config.get("model", "gpt-4o")
+    if stream:
+        url, payload = sse_stream.prepare(provider, url, payload)
+    data = json.dumps(payload).encode("utf-8")
+    rate_limit.acquire(provider, tokens=rate_limit.estimate_tokens(data))
+    try:
+        if stream:
+            status, resp_headers, lines = http_pool.post_stream(url, data, headers, timeout=timeout)
+        else:
+            status, resp_headers, body = http_pool.post(url, data, headers, timeout=timeout)
+    except urllib.error.HTTPError as e:
+        rate_limit.observe(provider, e.headers, e.code)
+        raise
+    rate_limit.observe(provider, resp_headers, status)
+    if not stream:
+        return json.loads(body.decode("utf-8"))
+
+    if on_issue:
+        parser = sse_stream.issue_parser()
+
+        def on_text(chunk):
+            for issue in sse_stream.feed(parser, chunk):
+                on_issue(issue)
+    else:
+        on_text = None
+
+    usage = {}
+    text, error = sse_stream.read(provider, lines, on_text, usage)
+    body = sse_stream.assemble(provider, text, usage)
+    if error:
+        body["_interrupted"] = {"error": error, "text": text}
+    return body
 
-    url = "https://api.openai.com/v1/chat/completions"
+
+def _interrupted_result(body, json_mode=True):
+    """Result for a stream that stopped early: the issues that arrived
+    complete (marked "_partial"), or an error if there are none."""
+    info = body["_interrupted"]
+    issues = sse_stream.complete_issues(info["text"]) if json_mode else []
+    if issues:
+        print(f"[STREAM] {info['error']} — keeping {len(issues)} complete issue(s)", file=sys.stderr)
+        return {"issues": issues, "_partial": True, "_interrupted": info["error"]}
+    return {"error": f"Reviewer response incomplete: {info['error']}",
+            "partial_content": info["text"]}
+
+
+# ---------------------------------------------------------------------------
+# Prompt Caching
+# ---------------------------------------------------------------------------
+
+# Every section review of a document repeats the system prompt, glossary,
+# document and context; only the section and its questions change. A user
+# message may carry "cache_breakpoints" — character offsets where that stable
+# prefix ends (see _review_messages). OpenAI and Google cache shared prefixes
+# automatically, so for them the prompt order is what matters (OpenAI also
+# gets a prompt_cache_key so requests sharing a prefix reach the same cache);
+# Anthropic caches only up to blocks marked with cache_control.
+
+def prompt_cache_enabled(config=None):
+    return bool((config or {}).get("prompt_cache", True))
+
+
+def _api_messages(messages):
+    """Messages with only the fields the provider APIs accept."""
+    return [{"role": m["role"], "content": m["content"]} for m in messages]
+
+
+def _prompt_cache_key(messages):
+    """Stable routing key for the first cached prefix, or None."""
+    for msg in messages:
+        if msg.get("cache_breakpoints"):
+            prefix = msg["content"][:msg["cache_breakpoints"][0]]
+            return "review-" + hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:32]
+    return None
+
+
+def _cache_blocks(text, breakpoints, mark_end=False):
+    """Split text into Anthropic content blocks at the breakpoints, marking
+    each cached prefix (and the whole text if mark_end) with cache_control."""
+    blocks, start = [], 0
+    for end in breakpoints:
+        if start < end <= len(text):
+            blocks.append({"type": "text", "text": text[start:end],
+                           "cache_control": {"type": "ephemeral"}})
+            start = end
+    if start < len(text):
+        blocks.append({"type": "text", "text": text[start:]})
+        if mark_end:
+            blocks[-1]["cache_control"] = {"type": "ephemeral"}
+    return blocks
+
+
+def _usage(provider, body):
+    """Token usage of a response body, normalised across providers, or None.
+    input_tokens counts the whole prompt; cached_tokens is the part read
+    from the prompt cache and cache_write_tokens the part newly cached."""
+    if provider == "anthropic":
+        u = body.get("usage") or {}
+        if not u:
+            return None
+        cached = u.get("cache_read_input_tokens") or 0
+        written = u.get("cache_creation_input_tokens") or 0
+        return {"input_tokens": (u.get("input_tokens") or 0) + cached + written,
+                "cached_tokens": cached, "cache_write_tokens": written,
+                "output_tokens": u.get("output_tokens") or 0}
+    if provider == "google":
+        u = body.get("usageMetadata") or {}
+        if not u:
+            return None
+        return {"input_tokens": u.get("promptTokenCount") or 0,
+                "cached_tokens": u.get("cachedContentTokenCount") or 0,
+                "cache_write_tokens": 0,
+                "output_tokens": u.get("candidatesTokenCount") or 0}
+    u = body.get("usage") or {}
+    if not u:
+        return None
+    return {"input_tokens": u.get("prompt_tokens") or 0,
+            "cached_tokens": (u.get("prompt_tokens_details") or {}).get("cached_tokens") or 0,
+            "cache_write_tokens": 0,
+            "output_tokens": u.get("completion_tokens") or 0}
+
+
+def _with_usage(result, provider, body):
+    """Attach the response's token usage to a parsed result as "_usage"."""
+    usage = _usage(provider, body)
+    if usage and isinstance(result, dict) and "error" not in result:
+        result["_usage"] = usage
+    return result
+
+
+def _record_usage(conv_state, result, exchange):
+    """Move a result's "_usage" into the conversation state. Returns it."""
+    usage = result.pop("_usage", None)
+    if usage:
+        conv_state.setdefault("usage", []).append({"exchange": exchange, **usage})
+    return usage
+
+
+# ---------------------------------------------------------------------------
+# History Compaction
+# ---------------------------------------------------------------------------
+
+# respond and consensus resend the whole conversation. The saved
+# conversation keeps every turn, but what is sent is compacted: the opening
+# request (the cached document prefix) and the reviewer's first answer — the
+# issue ids everything else refers to — are always sent, as are the most
+# recent turns. Once the turns after the first answer pass
+# max_history_tokens, the ones in between go out as a single digest message
+# of short excerpts, so each exchange costs about the same.
+COMPACTION_DEFAULTS = {
+    "enabled": True,
+    "max_history_tokens": 8000,
+    "keep_recent_messages": 4,
+    "excerpt_chars": 300,
+}
+
+
+def _compaction_settings(config):
+    merged = dict(COMPACTION_DEFAULTS)
+    merged.update(config.get("compaction", {}) or {})
+    return merged
+
+
+def _message_tokens(messages):
+    """Approximate prompt tokens for a list of messages."""
+    return sum(rate_limit.estimate_tokens(m["content"]) for m in messages)
+
+
+def _compact_history(config, messages):
+    """Messages to send for a follow-up call. Returns (messages, record):
+    record describes what was elided, or is None if nothing was."""
+    settings = _compaction_settings(config)
+    if not settings["enabled"]:
+        return messages, None
+    first_answer = next((i for i, m in enumerate(messages) if m["role"] == "assistant"), None)
+    if first_answer is None:
+        return messages, None
+    head, tail = messages[:first_answer + 1], messages[first_answer + 1:]
+    tail_tokens = _message_tokens(tail)
+    if tail_tokens <= settings["max_history_tokens"]:
+        return messages, None
+
+    # tail runs user, assistant, ..., user: keep an even count so the kept
+    # turns start with the reviewer and roles still alternate after the digest
+    keep = max(2, settings["keep_recent_messages"] + settings["keep_recent_messages"] % 2)
+    if len(tail) <= keep + 1:
+        return messages, None
+    elided, recent = tail[:-keep], tail[-keep:]
+
+    limit = settings["excerpt_chars"]
+    lines = [f"[Earlier discussion compacted: {len(elided)} message(s) shortened to excerpts.]"]
+    for m in elided:
+        text = " ".join(m["content"].split())
+        speaker = "Author" if m["role"] == "user" else "Reviewer"
+        lines.append(f"{speaker}: {text[:limit]}{'...' if len(text) > limit else ''}")
+    digest = {"role": "user", "content": "\n\n".join(lines)}
+
+    compacted = head + [digest] + recent
+    record = {
+        "elided_messages": len(elided),
+        "tokens_before": _message_tokens(head) + tail_tokens,
+        "tokens_after": _message_tokens(compacted),
+    }
+    return compacted, record
+
+
+def _record_compaction(conv_state, record, exchange):
+    if record:
+        conv_state.setdefault("compactions", []).append({"exchange": exchange, **record})
+        print(f"[COMPACT] Sending {record['tokens_after']} of {record['tokens_before']} history tokens "
+              f"({record['elided_messages']} message(s) elided)", file=sys.stderr)
+
+
+# ---------------------------------------------------------------------------
+# API Calls — OpenAI
+# ---------------------------------------------------------------------------
+
+def _openai_payload(config, messages, json_mode=True):
     payload = {
-        "model": model,
+        "model": config.get("openai", {}).get("model", "gpt-4o"),
         "temperature": config.get("temperature", 0.3),
         "max_completion_tokens": get_max_tokens(config, "openai"),
-        "response_format": {"type": "json_object"},
-        "messages": messages,
+        "messages": _api_messages(messages),
     }
+    if json_mode:
+        payload["response_format"] = {"type": "json_object"}
+    cache_key = _prompt_cache_key(messages) if prompt_cache_enabled(config) else None
+    if cache_key:
+        payload["prompt_cache_key"] = cache_key
+    return payload
+
+
+def call_openai(api_key, config, messages, on_issue=None):
+    """Call OpenAI API with JSON response format. Used for review and consensus."""
+    import urllib.error
+
+    url = "https://api.openai.com/v1/chat/completions"
+    payload = _openai_payload(config, messages)
 
     headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {api_key}",
     }
 
-    req = urllib.request.Request(
-        url,
-        data=json.dumps(payload).encode("utf-8"),
-        headers=headers,
-        method="POST",
-    )
-
     try:
-        with urllib.request.urlopen(req, timeout=180) as resp:
-            body = json.loads(resp.read().decode("utf-8"))
-            content = body["choices"][0]["message"]["content"]
-            return json.loads(content)
+        body = _post_json("openai", url, payload, headers,
+                          stream=sse_stream.enabled(config), on_issue=on_issue)
+        if "_interrupted" in body:
+            return _interrupted_result(body)
+        content = body["choices"][0]["message"]["content"]
+        return _with_usage(json.loads(content), "openai", body)
     except urllib.error.HTTPError as e:
         error_body = e.read().decode("utf-8") if e.fp else ""
         try:
@@ -489,37 +788,22 @@ def call_openai(api_key, config, messages):
 
 def call_openai_raw(api_key, config, messages):
     """Call OpenAI API returning raw text (not JSON-forced). Used for inner loop exchanges."""
-    import urllib.request
     import urllib.error
 
-    provider_config = config.get("openai", {})
-    model = provider_config.get("model", "gpt-4o")
-
     url = "https://api.openai.com/v1/chat/completions"
-    payload = {
-        "model": model,
-        "temperature": config.get("temperature", 0.3),
-        "max_completion_tokens": get_max_tokens(config, "openai"),
-        "messages": messages,
-    }
+    payload = _openai_payload(config, messages, json_mode=False)
 
     headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {api_key}",
     }
 
-    req = urllib.request.Request(
-        url,
-        data=json.dumps(payload).encode("utf-8"),
-        headers=headers,
-        method="POST",
-    )
-
     try:
-        with urllib.request.urlopen(req, timeout=180) as resp:
-            body = json.loads(resp.read().decode("utf-8"))
-            content = body["choices"][0]["message"]["content"]
-            return {"content": content}
+        body = _post_json("openai", url, payload, headers, stream=sse_stream.enabled(config))
+        if "_interrupted" in body:
+            return _interrupted_result(body, json_mode=False)
+        content = body["choices"][0]["message"]["content"]
+        return _with_usage({"content": content}, "openai", body)
     except urllib.error.HTTPError as e:
         error_body = e.read().decode("utf-8") if e.fp else ""
         try:
@@ -536,14 +820,7 @@ def call_openai_raw(api_key, config, messages):
 # API Calls — Anthropic
 # ---------------------------------------------------------------------------
 
-def call_anthropic(api_key, config, messages):
-    """Call Anthropic Messages API with JSON response. Used for review and consensus."""
-    import urllib.request
-    import urllib.error
-
-    provider_config = config.get("anthropic", {})
-    model = provider_config.get("model", "claude-sonnet-4-20250514")
-
+def _anthropic_payload(config, messages):
     # Anthropic uses a separate system param; extract from messages
     system_text = ""
     api_messages = []
@@ -551,17 +828,37 @@ def call_anthropic(api_key, config, messages):
         if msg["role"] == "system":
             system_text = msg["content"]
         else:
-            api_messages.append(msg)
+            api_messages.append({"role": msg["role"], "content": msg["content"]})
+
+    if prompt_cache_enabled(config):
+        # Cache the marked prefixes (they cover the system prompt too); in a
+        # running conversation also the latest turn, so the next exchange
+        # reads the whole history from cache
+        sources = [m for m in messages if m["role"] != "system"]
+        last = len(api_messages) - 1
+        for i, msg in enumerate(api_messages):
+            breakpoints = sources[i].get("cache_breakpoints", [])
+            mark_end = i == last and i > 0
+            if breakpoints or mark_end:
+                msg["content"] = _cache_blocks(msg["content"], breakpoints, mark_end)
 
-    url = "https://api.anthropic.com/v1/messages"
     payload = {
-        "model": model,
+        "model": config.get("anthropic", {}).get("model", "claude-sonnet-4-20250514"),
         "max_tokens": get_max_tokens(config, "anthropic"),
         "temperature": config.get("temperature", 0.3),
         "messages": api_messages,
     }
     if system_text:
         payload["system"] = system_text
+    return payload
+
+
+def call_anthropic(api_key, config, messages, on_issue=None):
+    """Call Anthropic Messages API with JSON response. Used for review and consensus."""
+    import urllib.error
+
+    url = "https://api.anthropic.com/v1/messages"
+    payload = _anthropic_payload(config, messages)
 
     headers = {
         "Content-Type": "application/json",
@@ -569,19 +866,14 @@ def call_anthropic(api_key, config, messages):
         "anthropic-version": "2023-06-01",
     }
 
-    req = urllib.request.Request(
-        url,
-        data=json.dumps(payload).encode("utf-8"),
-        headers=headers,
-        method="POST",
-    )
-
     try:
-        with urllib.request.urlopen(req, timeout=180) as resp:
-            body = json.loads(resp.read().decode("utf-8"))
-            content = body["content"][0]["text"]
-            # Try to extract JSON from response
-            return _extract_json(content)
+        body = _post_json("anthropic", url, payload, headers,
+                          stream=sse_stream.enabled(config), on_issue=on_issue)
+        if "_interrupted" in body:
+            return _interrupted_result(body)
+        content = body["content"][0]["text"]
+        # Try to extract JSON from response
+        return _with_usage(_extract_json(content), "anthropic", body)
     except urllib.error.HTTPError as e:
         error_body = e.read().decode("utf-8") if e.fp else ""
         try:
@@ -596,29 +888,10 @@ def call_anthropic(api_key, config, messages):
 
 def call_anthropic_raw(api_key, config, messages):
     """Call Anthropic Messages API returning raw text. Used for inner loop exchanges."""
-    import urllib.request
     import urllib.error
 
-    provider_config = config.get("anthropic", {})
-    model = provider_config.get("model", "claude-sonnet-4-20250514")
-
-    system_text = ""
-    api_messages = []
-    for msg in messages:
-        if msg["role"] == "system":
-            system_text = msg["content"]
-        else:
-            api_messages.append(msg)
-
     url = "https://api.anthropic.com/v1/messages"
-    payload = {
-        "model": model,
-        "max_tokens": get_max_tokens(config, "anthropic"),
-        "temperature": config.get("temperature", 0.3),
-        "messages": api_messages,
-    }
-    if system_text:
-        payload["system"] = system_text
+    payload = _anthropic_payload(config, messages)
 
     headers = {
         "Content-Type": "application/json",
@@ -626,18 +899,12 @@ def call_anthropic_raw(api_key, config, messages):
         "anthropic-version": "2023-06-01",
     }
 
-    req = urllib.request.Request(
-        url,
-        data=json.dumps(payload).encode("utf-8"),
-        headers=headers,
-        method="POST",
-    )
-
     try:
-        with urllib.request.urlopen(req, timeout=180) as resp:
-            body = json.loads(resp.read().decode("utf-8"))
-            content = body["content"][0]["text"]
-            return {"content": content}
+        body = _post_json("anthropic", url, payload, headers, stream=sse_stream.enabled(config))
+        if "_interrupted" in body:
+            return _interrupted_result(body, json_mode=False)
+        content = body["content"][0]["text"]
+        return _with_usage({"content": content}, "anthropic", body)
     except urllib.error.HTTPError as e:
         error_body = e.read().decode("utf-8") if e.fp else ""
         try:
@@ -654,9 +921,8 @@ def call_anthropic_raw(api_key, config, messages):
 # API Calls — Google (Gemini)
 # ---------------------------------------------------------------------------
 
-def call_google(api_key, config, messages):
+def call_google(api_key, config, messages, on_issue=None):
     """Call Google Gemini API with JSON response. Used for review and consensus."""
-    import urllib.request
     import urllib.error
 
     provider_config = config.get("google", {})
@@ -687,18 +953,13 @@ def call_google(api_key, config, messages):
 
     headers = {"Content-Type": "application/json"}
 
-    req = urllib.request.Request(
-        url,
-        data=json.dumps(payload).encode("utf-8"),
-        headers=headers,
-        method="POST",
-    )
-
     try:
-        with urllib.request.urlopen(req, timeout=180) as resp:
-            body = json.loads(resp.read().decode("utf-8"))
-            content = body["candidates"][0]["content"]["parts"][0]["text"]
-            return _extract_json(content)
+        body = _post_json("google", url, payload, headers,
+                          stream=sse_stream.enabled(config), on_issue=on_issue)
+        if "_interrupted" in body:
+            return _interrupted_result(body)
+        content = body["candidates"][0]["content"]["parts"][0]["text"]
+        return _with_usage(_extract_json(content), "google", body)
     except urllib.error.HTTPError as e:
         error_body = e.read().decode("utf-8") if e.fp else ""
         try:
@@ -713,7 +974,6 @@ def call_google(api_key, config, messages):
 
 def call_google_raw(api_key, config, messages):
     """Call Google Gemini API returning raw text. Used for inner loop exchanges."""
-    import urllib.request
     import urllib.error
 
     provider_config = config.get("google", {})
@@ -742,18 +1002,12 @@ def call_google_raw(api_key, config, messages):
 
     headers = {"Content-Type": "application/json"}
 
-    req = urllib.request.Request(
-        url,
-        data=json.dumps(payload).encode("utf-8"),
-        headers=headers,
-        method="POST",
-    )
-
     try:
-        with urllib.request.urlopen(req, timeout=180) as resp:
-            body = json.loads(resp.read().decode("utf-8"))
-            content = body["candidates"][0]["content"]["parts"][0]["text"]
-            return {"content": content}
+        body = _post_json("google", url, payload, headers, stream=sse_stream.enabled(config))
+        if "_interrupted" in body:
+            return _interrupted_result(body, json_mode=False)
+        content = body["candidates"][0]["content"]["parts"][0]["text"]
+        return _with_usage({"content": content}, "google", body)
     except urllib.error.HTTPError as e:
         error_body = e.read().decode("utf-8") if e.fp else ""
         try:
@@ -821,21 +1075,21 @@ def is_billing_error(result):
 # Provider Dispatch
 # ---------------------------------------------------------------------------
 
-def _call_single_provider(provider, api_key, config, messages, json_mode):
+def _call_single_provider(provider, api_key, config, messages, json_mode, on_issue=None):
     """Call a single provider. Returns (result, provider_name)."""
     if provider == "openai":
         if json_mode:
-            return call_openai(api_key, config, messages)
+            return call_openai(api_key, config, messages, on_issue)
         else:
             return call_openai_raw(api_key, config, messages)
     elif provider == "anthropic":
         if json_mode:
-            return call_anthropic(api_key, config, messages)
+            return call_anthropic(api_key, config, messages, on_issue)
         else:
             return call_anthropic_raw(api_key, config, messages)
     elif provider == "google":
         if json_mode:
-            return call_google(api_key, config, messages)
+            return call_google(api_key, config, messages, on_issue)
         else:
             return call_google_raw(api_key, config, messages)
     else:
@@ -867,8 +1121,23 @@ def _get_api_key_for_provider(config, provider):
     return key
 
 
-def call_provider(api_key, config, messages, json_mode=True):
-    """Route to the correct provider's API call, with fallback on billing errors."""
+def call_provider(api_key, config, messages, json_mode=True, use_cache=True, hedges_used=0,
+                  on_issue=None):
+    """Route to the correct provider's API call, with fallback on billing errors.
+
+    Each provider's response is looked up in the response cache
+    (review_cache.py) first; use_cache=False skips the lookup but still
+    stores the fresh response.
+
+    With hedging enabled (config "hedge"), a primary that has not answered
+    within its percentile latency is raced against the next provider in
+    fallback_order and the first good answer wins. A hedge that was sent is
+    reported as result["_hedge"], on error results too; hedges_used is how
+    many this conversation has already spent against hedge.max_extra_requests.
+
+    With streaming enabled (config "stream"), on_issue(issue) is called for
+    each review issue as it arrives. Hedged calls race two streams, so they
+    report issues only through the returned result."""
     fallback_order = config.get("fallback_order", [config.get("provider", "openai")])
     primary = config.get("provider", "openai")
 
@@ -878,9 +1147,15 @@ def call_provider(api_key, config, messages, json_mode=True):
     else:
         fallback_order = [primary] + fallback_order
 
+    hedge = _hedge_settings(config)
     errors_encountered = []
+    tried = set()
+    spent = None  # hedge record, once an extra request has been sent
 
     for provider in fallback_order:
+        if provider in tried:
+            continue  # Already raced as a hedge
+
         # Get API key for this provider
         if provider == primary:
             pkey = api_key
@@ -890,29 +1165,248 @@ def call_provider(api_key, config, messages, json_mode=True):
                 errors_encountered.append(f"{provider}: no API key configured")
                 continue
 
-        result = _call_single_provider(provider, pkey, config, messages, json_mode)
+        result = _cached_response(config, provider, messages, json_mode) if use_cache else None
+        answered_by, hedge_record = provider, None
+        if result is None:
+            partner = None
+            if provider == primary and hedge["enabled"] and hedges_used < hedge["max_extra_requests"]:
+                partner = _hedge_partner(config, fallback_order, primary)
+            if partner:
+                answered_by, result, hedge_record = _call_hedged(
+                    provider, pkey, partner, config, messages, json_mode, hedge)
+                if hedge_record:
+                    tried.add(partner[0])  # Raced already; otherwise it is still a fallback
+                    spent = hedge_record
+            else:
+                result = _timed_call(provider, pkey, config, messages, json_mode, on_issue)
+            _store_response(config, answered_by, messages, json_mode, result)
+        tried.add(provider)
 
         if "error" not in result:
+            if spent:
+                result["_hedge"] = spent
             # Success — annotate which provider was used if it wasn't the primary
-            if provider != primary:
-                result["_fallback_provider"] = provider
-                print(f"[FALLBACK] Primary provider ({primary}) failed, using {provider}", file=sys.stderr)
+            if answered_by != primary:
+                result["_fallback_provider"] = answered_by
+                if hedge_record:
+                    print(f"[HEDGE] {answered_by} answered before {primary}", file=sys.stderr)
+                else:
+                    print(f"[FALLBACK] Primary provider ({primary}) failed, using {answered_by}", file=sys.stderr)
             return result
 
         if is_billing_error(result):
-            errors_encountered.append(f"{provider}: {result['error']}")
-            print(f"[FALLBACK] {provider} billing/quota error, trying next provider...", file=sys.stderr)
+            errors_encountered.append(f"{answered_by}: {result['error']}")
+            print(f"[FALLBACK] {answered_by} billing/quota error, trying next provider...", file=sys.stderr)
             continue
         else:
             # Non-billing error (e.g., bad request, server error) — don't fallback, return immediately
-            return result
+            return {**result, "_hedge": spent} if spent else result
 
     # All providers exhausted
-    return {
+    result = {
         "error": "All providers exhausted — billing or quota errors on all configured providers",
         "providers_tried": errors_encountered,
         "fallback": "self-review",
     }
+    return {**result, "_hedge": spent} if spent else result
+
+
+def _cache_key(config, provider, messages, json_mode):
+    model = config.get(provider, {}).get("model", "")
+    return review_cache.key(provider, model, config.get("temperature", 0.3), messages, json_mode)
+
+
+def _cached_response(config, provider, messages, json_mode):
+    """Cached response for this request to provider, or None."""
+    if not review_cache.enabled(config):
+        return None
+    result = review_cache.get(_cache_key(config, provider, messages, json_mode), config)
+    if result is not None:
+        print(f"[CACHE] Reusing cached {provider} response", file=sys.stderr)
+    return result
+
+
+def _store_response(config, provider, messages, json_mode, result):
+    if review_cache.enabled(config):
+        # Token usage belongs to the call that paid for it, not to cache hits
+        result = {k: v for k, v in result.items() if k != "_usage"}
+        review_cache.put(_cache_key(config, provider, messages, json_mode), result, config,
+                         provider, config.get(provider, {}).get("model", ""))
+
+
+# ---------------------------------------------------------------------------
+# Hedged Requests
+# ---------------------------------------------------------------------------
+
+HEDGE_DEFAULTS = {
+    "enabled": False,
+    "percentile": 90,             # hedge once the primary is slower than this share of its past calls
+    "min_delay_seconds": 10,
+    "default_delay_seconds": 90,  # used until min_samples latencies are known
+    "min_samples": 5,
+    "max_extra_requests": 3,      # per conversation (review + respond + consensus)
+}
+
+LATENCY_SAMPLES = 50
+
+_latency_lock = threading.Lock()
+
+
+def _hedge_settings(config):
+    merged = dict(HEDGE_DEFAULTS)
+    merged.update(config.get("hedge", {}) or {})
+    return merged
+
+
+def _latency_path():
+    return get_conv_dir() / "provider-latency.json"
+
+
+def _load_latencies():
+    try:
+        return json.loads(_latency_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _record_latency(provider, json_mode, seconds):
+    """Keep the last LATENCY_SAMPLES successful call durations per provider and mode.
+    Written atomically (temp file + rename) — other CLIs may be reading it."""
+    key = f"{provider}:{'json' if json_mode else 'raw'}"
+    with _latency_lock:
+        data = _load_latencies()
+        data[key] = (data.get(key, []) + [round(seconds, 2)])[-LATENCY_SAMPLES:]
+        path = _latency_path()
+        tmp = path.with_name(f"{path.name}.tmp{os.getpid()}")
+        try:
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+
+def _hedge_delay(provider, json_mode, hedge):
+    """Seconds to wait for the primary before hedging: its latency percentile."""
+    samples = sorted(_load_latencies().get(f"{provider}:{'json' if json_mode else 'raw'}", []))
+    if len(samples) < hedge["min_samples"]:
+        return float(hedge["default_delay_seconds"])
+    idx = min(len(samples) - 1, max(0, math.ceil(hedge["percentile"] / 100 * len(samples)) - 1))
+    return max(float(hedge["min_delay_seconds"]), samples[idx])
+
+
+def _hedge_partner(config, fallback_order, primary):
+    """(provider, api_key) of the first fallback provider that has a key."""
+    for provider in fallback_order:
+        if provider == primary:
+            continue
+        key = _get_api_key_for_provider(config, provider)
+        if key:
+            return provider, key
+    return None
+
+
+def _timed_call(provider, api_key, config, messages, json_mode, on_issue=None):
+    started = time.monotonic()
+    result = _call_single_provider(provider, api_key, config, messages, json_mode, on_issue)
+    if "error" not in result and not result.get("_partial"):
+        _record_latency(provider, json_mode, time.monotonic() - started)
+    return result
+
+
+def _call_hedged(primary, api_key, partner, config, messages, json_mode, hedge):
+    """Call the primary; if it is still running after its hedge delay, send
+    the same request to partner as well and take the first good answer.
+    Returns (provider, result, hedge_record or None)."""
+    answers = queue.Queue()
+
+    def run(provider, key):
+        answers.put((provider, _timed_call(provider, key, config, messages, json_mode)))
+
+    # Daemon threads: an abandoned slower call must not hold the process open
+    threading.Thread(target=run, args=(primary, api_key), daemon=True).start()
+    delay = _hedge_delay(primary, json_mode, hedge)
+    try:
+        provider, result = answers.get(timeout=delay)
+        return provider, result, None
+    except queue.Empty:
+        pass
+
+    partner_name, partner_key = partner
+    print(f"[HEDGE] {primary} has not answered in {delay:.1f}s, also asking {partner_name}", file=sys.stderr)
+    threading.Thread(target=run, args=(partner_name, partner_key), daemon=True).start()
+    record = {
+        "primary": primary,
+        "hedge": partner_name,
+        "delay_seconds": round(delay, 1),
+        "sent": datetime.now().isoformat(),
+    }
+
+    provider, result = answers.get()
+    if "error" in result:
+        # First answer failed — the other request may still succeed
+        other, other_result = answers.get()
+        if "error" not in other_result:
+            provider, result = other, other_result
+    record["winner"] = provider
+    return provider, result, record
+
+
+# ---------------------------------------------------------------------------
+# Routing Self-Check
+# ---------------------------------------------------------------------------
+
+def _routing_case(name, hedge, responses, expect_provider, expect_calls):
+    """Run call_provider against canned per-provider responses (no network,
+    no cache, no latency file). responses: provider -> (delay, result)."""
+    calls = []
+
+    def fake_call(provider, api_key, config, messages, json_mode, on_issue=None):
+        calls.append(provider)
+        delay, result = responses[provider]
+        time.sleep(delay)
+        return dict(result)
+
+    config = {"provider": "openai", "fallback_order": ["openai", "anthropic"],
+              "hedge": hedge, "cache": {"enabled": False}}
+    stubs = {
+        "_call_single_provider": fake_call,
+        "_get_api_key_for_provider": lambda config, provider: "check-key",
+        "_load_latencies": dict,
+        "_record_latency": lambda provider, json_mode, seconds: None,
+    }
+    saved = {k: globals()[k] for k in stubs}
+    globals().update(stubs)
+    try:
+        result = call_provider("check-key", config, [], json_mode=True, use_cache=False)
+    finally:
+        globals().update(saved)
+
+    provider = result.get("_fallback_provider", "openai") if "error" not in result else None
+    ok = provider == expect_provider and sorted(calls) == sorted(expect_calls)
+    return {"case": name, "ok": ok, "answered_by": provider, "calls": calls,
+            **({"error": result["error"]} if "error" in result else {})}
+
+
+def check_routing():
+    """Offline check of provider fallback and hedging in call_provider."""
+    quota = (0, {"error": "OpenAI API error (429): rate limited"})
+    good = {"issues": [], "verdict": "approve"}
+    hedged = {"enabled": True, "default_delay_seconds": 0.2, "min_delay_seconds": 0}
+    cases = [
+        _routing_case("quota error falls back", {"enabled": False},
+                      {"openai": quota, "anthropic": (0, good)}, "anthropic", ["openai", "anthropic"]),
+        _routing_case("quota error falls back while hedging", hedged,
+                      {"openai": quota, "anthropic": (0, good)}, "anthropic", ["openai", "anthropic"]),
+        _routing_case("slow primary is hedged", hedged,
+                      {"openai": (1.0, good), "anthropic": (0, good)}, "anthropic", ["openai", "anthropic"]),
+        _routing_case("fast primary is not hedged", hedged,
+                      {"openai": (0, good), "anthropic": (0, good)}, "openai", ["openai"]),
+    ]
+    failed = [c["case"] for c in cases if not c["ok"]]
+    result = {"status": "error" if failed else "ok", "cases": cases}
+    if failed:
+        result["error"] = f"Routing check failed: {', '.join(failed)}"
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -965,8 +1459,13 @@ Always respond with valid JSON when starting a review or providing a final summa
 In discussion exchanges, you may use natural language with embedded JSON for clarity."""
 
 
-def build_review_prompt(doc_content, doc_type, context="", focus="", glossary=""):
-    """Build the initial review prompt with scope, criteria, and the document."""
+def review_prompt_parts(doc_content, doc_type, context="", focus="", glossary=""):
+    """Build the initial review prompt as [document prefix, context, request].
+
+    The first part (scope, criteria, glossary, the full document) is the same
+    for every review of a document and the second (resolved context) usually
+    is too, so they lead the prompt where provider prompt caching can reuse
+    them; focus and the response format follow as the variable suffix."""
     type_desc = DOC_TYPE_CONTEXT.get(doc_type, f"a {doc_type} document")
     scope = DOC_TYPE_SCOPE.get(doc_type, {"in_scope": [], "out_of_scope": []})
     criteria = DOC_TYPE_CRITERIA.get(doc_type, [])
@@ -991,14 +1490,23 @@ def build_review_prompt(doc_content, doc_type, context="", focus="", glossary=""
     if glossary:
         glossary_text = f"\n\nPROJECT GLOSSARY (flag any deviations from these canonical terms):\n{glossary}"
 
-    return f"""Review this document. It is {type_desc}.
+    document_part = f"""Review this document. It is {type_desc}.
 Pipeline: design doc -> style docs -> systems -> reference docs -> engine docs -> roadmap -> phases -> slices -> specs -> tasks.
-{f"Additional context:{chr(10)}{context}" if context else ""}
 {scope_text}
 {criteria_text}
-{focus_text}
 {glossary_text}
 
+Document:
+
+---
+{doc_content}
+---
+"""
+
+    context_part = f"\nAdditional context:\n{context}\n" if context else ""
+
+    request_part = f"""{focus_text}
+
 Respond with a JSON object:
 {{
     "summary": "1-2 sentence overall assessment",
@@ -1017,13 +1525,14 @@ Respond with a JSON object:
 
 Be specific. Every issue needs a concrete location and actionable suggestion.
 Do NOT raise issues about OUT OF SCOPE items.
-An empty issues array means you found nothing wrong.
+An empty issues array means you found nothing wrong."""
 
-Document:
+    return [document_part, context_part, request_part]
 
----
-{doc_content}
----"""
+
+def build_review_prompt(doc_content, doc_type, context="", focus="", glossary=""):
+    """Build the initial review prompt with scope, criteria, and the document."""
+    return "".join(review_prompt_parts(doc_content, doc_type, context, focus, glossary))
 
 
 def build_consensus_request():
@@ -1052,35 +1561,13 @@ Only set false if a HIGH severity issue remains with genuinely inadequate reason
 
 
 # ---------------------------------------------------------------------------
-# Commands
+# Library API
 # ---------------------------------------------------------------------------
 
-def cmd_review(args):
-    """Start a fresh review iteration. Creates conversation state."""
-    config = load_config(getattr(args, 'profile', None))
-    api_key = get_api_key(config)
-
-    doc_path = Path(args.doc_path)
-    if not doc_path.exists():
-        print(json.dumps({"error": f"Document not found: {doc_path}"}))
-        sys.exit(1)
-
-    doc_content = doc_path.read_text(encoding="utf-8")
-
-    # Detect or use provided doc type
-    doc_type = args.type
-    if not doc_type:
-        doc_type = detect_doc_type(args.doc_path)
-    if not doc_type:
-        print(json.dumps({
-            "error": "Could not detect document type from path",
-            "fix": "Use --type to specify: design, style, system, reference, engine, input, roadmap, phase, slice, spec, task"
-        }))
-        sys.exit(1)
-
-    # Load context files
+def _context_block(context_files=(), context_text=""):
+    """Format context files (and pre-resolved context text) for the prompt."""
     context_parts = []
-    for cf in (args.context_files or []):
+    for cf in (context_files or []):
         cf_path = Path(cf)
         if cf_path.exists():
             context_parts.append(
@@ -1090,36 +1577,88 @@ def cmd_review(args):
             )
         else:
             context_parts.append(f"[Warning: context file not found: {cf}]")
-    context_str = "\n\n".join(context_parts) if context_parts else ""
+    if context_text:
+        context_parts.append(f"--- Context ---\n{context_text}\n--- End Context ---")
+    return "\n\n".join(context_parts) if context_parts else ""
 
-    glossary = load_glossary()
 
-    # Load additional review instructions from file if provided
-    extra_instructions = ""
-    if args.system_prompt_file:
-        prompt_path = Path(args.system_prompt_file)
-        if prompt_path.exists():
-            extra_instructions = prompt_path.read_text(encoding="utf-8")
+def _review_messages(doc_path, doc_type=None, context_files=(), context_text="",
+                     focus="", instructions=""):
+    """Build the review request for a document.
+    Returns (messages, doc_type, None) or (None, None, error_dict)."""
+    doc_key = str(doc_path)
+    doc_path = Path(doc_path)
+    if not doc_path.exists():
+        return None, None, {"error": f"Document not found: {doc_path}"}
+
+    doc_content = doc_path.read_text(encoding="utf-8")
+
+    # Detect or use provided doc type
+    if not doc_type:
+        doc_type = detect_doc_type(doc_key)
+    if not doc_type:
+        return None, None, {
+            "error": "Could not detect document type from path",
+            "fix": "Use --type to specify: design, style, system, reference, engine, input, roadmap, phase, slice, spec, task"
+        }
 
-    # Build messages
+    context_str = _context_block(context_files, context_text)
+    glossary = load_glossary()
+
+    # Build messages: stable prefix first, section-specific request last
     system_msg = build_system_prompt()
-    user_msg = build_review_prompt(
+    document_part, context_part, request_part = review_prompt_parts(
         doc_content, doc_type, context_str,
-        focus=args.focus or "", glossary=glossary
+        focus=focus or "", glossary=glossary
     )
-    if extra_instructions:
-        user_msg += f"\n\n--- Additional Review Instructions ---\n{extra_instructions}"
+    user_msg = document_part + context_part + request_part
+    if instructions:
+        user_msg += f"\n\n--- Additional Review Instructions ---\n{instructions}"
 
+    # Prefix boundaries for provider prompt caching (see _cache_blocks)
+    breakpoints = sorted({len(document_part), len(document_part) + len(context_part)})
     messages = [
         {"role": "system", "content": system_msg},
-        {"role": "user", "content": user_msg},
+        {"role": "user", "content": user_msg, "cache_breakpoints": breakpoints},
     ]
+    return messages, doc_type, None
+
 
-    result = call_provider(api_key, config, messages, json_mode=True)
+def review(doc_path, iteration=1, doc_type=None, context_files=(), context_text="",
+           focus="", instructions="", profile=None, persist=True, use_cache=True, on_issue=None):
+    """Start a fresh review iteration and save the conversation state.
+    Returns the review (summary, issues, _meta) or {"error": ...}.
+    With persist=False the state is returned as "_conversation" instead of
+    written, so concurrent reviews of one document don't overwrite each other.
+    use_cache=False forces a fresh provider call (see review_cache.py).
+    on_issue(issue) sees each issue as it streams in (config "stream")."""
+    config, api_key, error = _load_config_and_key(profile)
+    if error:
+        return error
+
+    messages, doc_type, error = _review_messages(
+        doc_path, doc_type, context_files, context_text, focus, instructions)
+    if error:
+        return error
+
+    result = call_provider(api_key, config, messages, json_mode=True, use_cache=use_cache,
+                           on_issue=on_issue)
 
     if "error" in result:
-        print(json.dumps(result, indent=2))
-        sys.exit(1)
+        # No conversation is saved for a failed review — report the extra request with the error
+        hedge = result.pop("_hedge", None)
+        return {**result, "hedges": [hedge]} if hedge else result
+    return _finish_review(config, doc_path, doc_type, iteration, focus, messages, result, persist)
+
+
+def _finish_review(config, doc_path, doc_type, iteration, focus, messages, result, persist=True):
+    """Record a review result as the iteration's conversation and add _meta."""
+    doc_key = str(doc_path)  # conversation files are keyed by the path as given
+    doc_path = Path(doc_path)
+    hedge = result.pop("_hedge", None)
+    partial = result.pop("_partial", False)
+    interrupted = result.pop("_interrupted", None)
+    usage = result.pop("_usage", None)
 
     # Get tier info
     tier_name, tier_config = get_tier(doc_type)
@@ -1131,19 +1670,25 @@ def cmd_review(args):
         "document": str(doc_path),
         "type": doc_type,
         "tier": tier_name,
-        "iteration": args.iteration,
+        "iteration": iteration,
         "exchange": 1,
         "provider": config.get("provider", "openai"),
         "model": config.get(config.get("provider", "openai"), {}).get("model", "unknown"),
-        "focus": args.focus or None,
+        "focus": focus or None,
         "started": datetime.now().isoformat(),
         "messages": messages,
         "initial_review": result,
         "consensus": None,
+        "hedges": [hedge] if hedge else [],
+        "usage": [{"exchange": 1, **usage}] if usage else [],
     }
 
-    state_path = conv_path(args.doc_path, args.iteration)
-    save_conversation(state_path, conv_state)
+    state_path = conv_path(doc_key, iteration)
+    if persist:
+        save_conversation(state_path, conv_state)
+    else:
+        # Snapshot before _meta is added (conv_state["initial_review"] is result)
+        conversation = json.loads(json.dumps(conv_state))
 
     # Add meta to output
     result["_meta"] = {
@@ -1153,55 +1698,72 @@ def cmd_review(args):
         "tier_max_iterations": tier_config["max_iterations"],
         "tier_max_exchanges": tier_config["max_exchanges"],
         "tier_severity_filter": tier_config["severity_filter"],
-        "iteration": args.iteration,
+        "iteration": iteration,
         "exchange": 1,
         "provider": config.get("provider", "openai"),
         "model": conv_state["model"],
         "conversation_file": str(state_path),
         "issue_count": len(result.get("issues", [])),
     }
-
-    print(json.dumps(result, indent=2))
-
-
-def cmd_respond(args):
-    """Continue the conversation within an iteration."""
-    config = load_config(getattr(args, 'profile', None))
-    api_key = get_api_key(config)
-
-    state_path = conv_path(args.doc_path, args.iteration)
+    if usage:
+        result["_meta"]["usage"] = usage
+    if partial:
+        # Stream stopped early — only the issues that arrived complete
+        result["_meta"]["partial"] = True
+        result["_meta"]["interrupted"] = interrupted
+    if not persist:
+        result["_conversation"] = conversation
+    return result
+
+
+def _record_hedge(conv_state, result):
+    """Move a hedge record from a provider result into the conversation state."""
+    hedge = result.pop("_hedge", None)
+    if hedge:
+        conv_state.setdefault("hedges", []).append(hedge)
+
+
+def _record_failed_hedge(state_path, result):
+    """A call that failed after hedging still spent an extra request: count it
+    in the saved conversation, which is otherwise left as it was."""
+    hedge = result.pop("_hedge", None)
+    if hedge:
+        conv_state = load_conversation(state_path)
+        conv_state.setdefault("hedges", []).append(hedge)
+        save_conversation(state_path, conv_state)
+    return result
+
+
+def respond(doc_path, iteration, message, profile=None):
+    """Send the author's reply within an iteration and return the reviewer's
+    response ({"reviewer_response", "_meta"}) or {"error": ...}."""
+    config, api_key, error = _load_config_and_key(profile)
+    if error:
+        return error
+
+    state_path = conv_path(doc_path, iteration)
     conv_state = load_conversation(state_path)
 
     if not conv_state:
-        print(json.dumps({
-            "error": f"No conversation found for iteration {args.iteration}",
-            "fix": f"Run 'review' first: python adversarial-review.py review {args.doc_path} --iteration {args.iteration}"
-        }))
-        sys.exit(1)
-
-    # Load Claude's response
-    if args.message:
-        claude_message = args.message
-    elif args.message_file:
-        msg_path = Path(args.message_file)
-        if not msg_path.exists():
-            print(json.dumps({"error": f"Message file not found: {msg_path}"}))
-            sys.exit(1)
-        claude_message = msg_path.read_text(encoding="utf-8")
-    else:
-        print(json.dumps({"error": "Provide --message or --message-file"}))
-        sys.exit(1)
+        return {
+            "error": f"No conversation found for iteration {iteration}",
+            "fix": f"Run 'review' first: python adversarial-review.py review {doc_path} --iteration {iteration}"
+        }
 
     # Append Claude's message to conversation
-    conv_state["messages"].append({"role": "user", "content": claude_message})
+    conv_state["messages"].append({"role": "user", "content": message})
     conv_state["exchange"] += 1
 
-    # Call provider with full conversation history (raw text mode)
-    result = call_provider(api_key, config, conv_state["messages"], json_mode=False)
+    # Call provider with the (compacted) conversation history (raw text mode)
+    messages, compaction = _compact_history(config, conv_state["messages"])
+    result = call_provider(api_key, config, messages, json_mode=False,
+                           hedges_used=len(conv_state.get("hedges", [])))
 
     if "error" in result:
-        print(json.dumps(result, indent=2))
-        sys.exit(1)
+        return _record_failed_hedge(state_path, result)
+    _record_hedge(conv_state, result)
+    _record_compaction(conv_state, compaction, conv_state["exchange"])
+    usage = _record_usage(conv_state, result, conv_state["exchange"])
 
     reviewer_response = result["content"]
 
@@ -1211,41 +1773,47 @@ def cmd_respond(args):
     # Save updated state
     save_conversation(state_path, conv_state)
 
-    output = {
+    return {
         "reviewer_response": reviewer_response,
         "_meta": {
             "document": conv_state["document"],
             "iteration": conv_state["iteration"],
             "exchange": conv_state["exchange"],
             "total_messages": len(conv_state["messages"]),
+            "sent_tokens": _message_tokens(messages),
             "conversation_file": str(state_path),
+            **({"usage": usage} if usage else {}),
+            **({"compacted": compaction} if compaction else {}),
         }
     }
 
-    print(json.dumps(output, indent=2))
-
 
-def cmd_consensus(args):
-    """Ask reviewer for final consensus summary after discussion."""
-    config = load_config(getattr(args, 'profile', None))
-    api_key = get_api_key(config)
+def consensus(doc_path, iteration, profile=None):
+    """Ask the reviewer for its final consensus summary for an iteration.
+    Returns the consensus dict or {"error": ...}."""
+    config, api_key, error = _load_config_and_key(profile)
+    if error:
+        return error
 
-    state_path = conv_path(args.doc_path, args.iteration)
+    state_path = conv_path(doc_path, iteration)
     conv_state = load_conversation(state_path)
 
     if not conv_state:
-        print(json.dumps({"error": f"No conversation found for iteration {args.iteration}"}))
-        sys.exit(1)
+        return {"error": f"No conversation found for iteration {iteration}"}
 
     # Append consensus request
     conv_state["messages"].append({"role": "user", "content": build_consensus_request()})
 
     # Force JSON response for consensus
-    result = call_provider(api_key, config, conv_state["messages"], json_mode=True)
+    messages, compaction = _compact_history(config, conv_state["messages"])
+    result = call_provider(api_key, config, messages, json_mode=True,
+                           hedges_used=len(conv_state.get("hedges", [])))
 
     if "error" in result:
-        print(json.dumps(result, indent=2))
-        sys.exit(1)
+        return _record_failed_hedge(state_path, result)
+    _record_hedge(conv_state, result)
+    _record_compaction(conv_state, compaction, "consensus")
+    usage = _record_usage(conv_state, result, "consensus")
 
     # Save consensus
     conv_state["messages"].append({"role": "assistant", "content": json.dumps(result)})
@@ -1258,13 +1826,16 @@ def cmd_consensus(args):
         "exchanges": conv_state["exchange"],
         "conversation_file": str(state_path),
     }
-
-    print(json.dumps(result, indent=2))
+    if usage:
+        result["_meta"]["usage"] = usage
+    return result
 
 
-def cmd_check_config(args):
-    """Verify configuration, API key, and glossary availability."""
-    config = load_config(getattr(args, 'profile', None))
+def check_config(profile=None):
+    """Report configuration, API key, and glossary availability."""
+    config = _read_config(profile)
+    if config is None:
+        return {"error": "review_config.json not found", "path": str(CONFIG_PATH)}
     provider = config.get("provider", "openai")
     provider_config = config.get(provider, {})
     env_var = provider_config.get("api_key_env", "OPENAI_API_KEY")
@@ -1317,12 +1888,371 @@ def cmd_check_config(args):
             "severity_filter": cfg["severity_filter"],
             "types": cfg["types"],
         } for name, cfg in TIERS.items()},
+        "response_cache": {**review_cache.settings(config), **review_cache.stats()},
+        "hedge": _hedge_settings(config),
+        "prompt_cache": prompt_cache_enabled(config),
+        "compaction": _compaction_settings(config),
     }
 
     if not has_key:
         result["warning"] = f"API key not found. Set {env_var} in your environment or create scaffold/.env with:\n{env_var}=your-key-here"
 
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Batch Reviews
+# ---------------------------------------------------------------------------
+
+# Provider batch APIs: requests are queued and answered asynchronously
+# (within 24h) at a lower price. Used for whole-range reviews where latency
+# per document does not matter.
+BATCH_DEFAULTS = {
+    "base_url": "",        # override both providers' API host (e.g. batch_standin.py)
+    "poll_seconds": 60,
+    "max_wait_seconds": 86400,
+}
+
+_BATCH_HOSTS = {"openai": "https://api.openai.com", "anthropic": "https://api.anthropic.com"}
+
+
+def _batch_settings(config):
+    merged = dict(BATCH_DEFAULTS)
+    merged.update(config.get("batch", {}) or {})
+    return merged
+
+
+def _batch_dir():
+    path = get_conv_dir() / "batches"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _batch_headers(provider, api_key):
+    if provider == "anthropic":
+        return {"x-api-key": api_key, "anthropic-version": "2023-06-01"}
+    return {"Authorization": f"Bearer {api_key}"}
+
+
+def _batch_http(method, url, headers, payload=None, data=None, raw=False):
+    """Send one batch API request. Returns (decoded JSON — or the body bytes
+    if raw — and None) or (None, error_dict)."""
+    import urllib.error
+
+    if payload is not None:
+        data = json.dumps(payload).encode("utf-8")
+        headers = {**headers, "Content-Type": "application/json"}
+    try:
+        _, _, body = http_pool.request(method, url, data, headers)
+    except urllib.error.HTTPError as e:
+        error_body = e.read().decode("utf-8") if e.fp else ""
+        try:
+            msg = json.loads(error_body).get("error", {}).get("message", error_body)
+        except (json.JSONDecodeError, AttributeError):
+            msg = error_body
+        return None, {"error": f"Batch API error ({e.code}): {msg}"}
+    except urllib.error.URLError as e:
+        return None, {"error": f"Network error: {e.reason}"}
+    if raw:
+        return body, None
+    return json.loads(body.decode("utf-8")), None
+
+
+def _multipart(fields, filename, content):
+    """multipart/form-data body for an OpenAI file upload. Returns (body, content_type)."""
+    boundary = hashlib.sha256(content).hexdigest()[:32]
+    parts = []
+    for name, value in fields.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode())
+    parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+                 f'Content-Type: application/jsonl\r\n\r\n'.encode() + content + b"\r\n")
+    parts.append(f"--{boundary}--\r\n".encode())
+    return b"".join(parts), f"multipart/form-data; boundary={boundary}"
+
+
+def batch_submit(requests, profile=None):
+    """Submit many document reviews as one provider batch.
+
+    requests: [{"doc_path", "iteration", "doc_type", "context_files",
+    "context_text", "focus", "instructions"}] (as for review()). Returns
+    {"batch_id", "provider", "custom_ids"} — custom_ids in request order —
+    or {"error": ...}. The request manifest is kept in
+    .reviews/batches/<batch_id>.json for batch_results()."""
+    config, api_key, error = _load_config_and_key(profile)
+    if error:
+        return error
+    provider = config.get("provider", "openai")
+    if provider not in _BATCH_HOSTS:
+        return {"error": f"Batch mode is not supported for provider '{provider}'",
+                "fix": "Use openai or anthropic, or review synchronously"}
+    if not requests:
+        return {"error": "No review requests to submit"}
+
+    settings = _batch_settings(config)
+    base = (settings["base_url"] or _BATCH_HOSTS[provider]).rstrip("/")
+    headers = _batch_headers(provider, api_key)
+
+    manifest = {}
+    lines = []
+    for n, req in enumerate(requests):
+        messages, doc_type, error = _review_messages(
+            req["doc_path"], req.get("doc_type"), req.get("context_files", ()),
+            req.get("context_text", ""), req.get("focus", ""), req.get("instructions", ""))
+        if error:
+            return {**error, "request": n}
+        custom_id = f"review-{n:05d}"
+        manifest[custom_id] = {
+            "doc_path": str(req["doc_path"]),
+            "doc_type": doc_type,
+            "iteration": req.get("iteration", 1),
+            "focus": req.get("focus", ""),
+            "messages": messages,
+        }
+        if provider == "openai":
+            lines.append({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions",
+                          "body": _openai_payload(config, messages)})
+        else:
+            lines.append({"custom_id": custom_id, "params": _anthropic_payload(config, messages)})
+
+    if provider == "openai":
+        content = "".join(json.dumps(line) + "\n" for line in lines).encode("utf-8")
+        body, content_type = _multipart({"purpose": "batch"}, "reviews.jsonl", content)
+        uploaded, error = _batch_http("POST", f"{base}/v1/files",
+                                      {**headers, "Content-Type": content_type}, data=body)
+        if error:
+            return error
+        remote, error = _batch_http("POST", f"{base}/v1/batches", headers, payload={
+            "input_file_id": uploaded["id"],
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h",
+        })
+    else:
+        remote, error = _batch_http("POST", f"{base}/v1/messages/batches", headers,
+                                    payload={"requests": lines})
+    if error:
+        return error
+
+    batch_id = remote["id"]
+    record = {
+        "batch_id": batch_id,
+        "provider": provider,
+        "profile": profile,
+        "base_url": base,
+        "submitted": datetime.now().isoformat(),
+        "requests": manifest,
+    }
+    (_batch_dir() / f"{batch_id}.json").write_text(json.dumps(record), encoding="utf-8")
+    print(f"[BATCH] Submitted {len(lines)} review(s) to {provider} as {batch_id}", file=sys.stderr)
+    return {"batch_id": batch_id, "provider": provider, "custom_ids": list(manifest)}
+
+
+def _load_batch(batch_id):
+    path = _batch_dir() / f"{batch_id}.json"
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def batch_status(batch_id, profile=None):
+    """Poll a submitted batch. Returns {"batch_id", "status", "counts"} with
+    status "pending", "ended" or "failed", or {"error": ...}."""
+    record = _load_batch(batch_id)
+    if record is None:
+        return {"error": f"Unknown batch: {batch_id}"}
+    config, api_key, error = _load_config_and_key(record.get("profile", profile))
+    if error:
+        return error
+    provider, base = record["provider"], record["base_url"]
+    headers = _batch_headers(provider, api_key)
+
+    if provider == "openai":
+        remote, error = _batch_http("GET", f"{base}/v1/batches/{batch_id}", headers)
+        if error:
+            return error
+        state = remote.get("status", "")
+        status = ("ended" if state == "completed" else
+                  "failed" if state in ("failed", "expired", "cancelled") else "pending")
+        counts = remote.get("request_counts", {})
+        record["remote"] = {"output_file_id": remote.get("output_file_id"),
+                            "error_file_id": remote.get("error_file_id")}
+    else:
+        remote, error = _batch_http("GET", f"{base}/v1/messages/batches/{batch_id}", headers)
+        if error:
+            return error
+        status = "ended" if remote.get("processing_status") == "ended" else "pending"
+        counts = remote.get("request_counts", {})
+        record["remote"] = {"results_url": remote.get("results_url")}
+
+    (_batch_dir() / f"{batch_id}.json").write_text(json.dumps(record), encoding="utf-8")
+    return {"batch_id": batch_id, "provider": provider, "status": status, "counts": counts}
+
+
+def _batch_lines(raw):
+    return [json.loads(line) for line in raw.decode("utf-8").splitlines() if line.strip()]
+
+
+def batch_results(batch_id, wait=False, profile=None):
+    """Fetch a batch's reviews once it has ended (polling until then if wait).
+
+    Returns {"batch_id", "status", "results": {custom_id: review}} where
+    each review is what review(..., persist=False) returns — including
+    "_conversation" — or {"error": ...} for a request that failed. While
+    the batch is still running, "results" is absent."""
+    record = _load_batch(batch_id)
+    if record is None:
+        return {"error": f"Unknown batch: {batch_id}"}
+    config, api_key, error = _load_config_and_key(record.get("profile", profile))
+    if error:
+        return error
+    settings = _batch_settings(config)
+    deadline = time.time() + settings["max_wait_seconds"]
+
+    while True:
+        status = batch_status(batch_id, profile)
+        if "error" in status or status["status"] != "pending" or not wait:
+            break
+        if time.time() >= deadline:
+            return {**status, "error": "Timed out waiting for batch"}
+        time.sleep(settings["poll_seconds"])
+    if "error" in status or status["status"] == "pending":
+        return status
+
+    record = _load_batch(batch_id)
+    provider, base = record["provider"], record["base_url"]
+    headers = _batch_headers(provider, api_key)
+    raw_results = {}  # custom_id -> response body or {"error": ...}
+
+    if provider == "openai":
+        for key in ("output_file_id", "error_file_id"):
+            file_id = record.get("remote", {}).get(key)
+            if not file_id:
+                continue
+            raw, error = _batch_http("GET", f"{base}/v1/files/{file_id}/content", headers, raw=True)
+            if error:
+                return error
+            for line in _batch_lines(raw):
+                response = line.get("response") or {}
+                if line.get("error") or response.get("status_code") != 200:
+                    err = line.get("error") or response.get("body", {}).get("error", {})
+                    raw_results[line["custom_id"]] = {"error": f"Batch request failed: {err}"}
+                else:
+                    raw_results[line["custom_id"]] = response["body"]
+    else:
+        url = record.get("remote", {}).get("results_url") or f"{base}/v1/messages/batches/{batch_id}/results"
+        raw, error = _batch_http("GET", url, headers, raw=True)
+        if error:
+            return error
+        for line in _batch_lines(raw):
+            result = line.get("result", {})
+            if result.get("type") == "succeeded":
+                raw_results[line["custom_id"]] = result["message"]
+            else:
+                raw_results[line["custom_id"]] = {
+                    "error": f"Batch request {result.get('type', 'failed')}: {result.get('error', '')}"}
+
+    results = {}
+    for custom_id, req in record["requests"].items():
+        body = raw_results.get(custom_id, {"error": "No result returned for request"})
+        if "error" in body:
+            results[custom_id] = body
+            continue
+        if provider == "openai":
+            content = body["choices"][0]["message"]["content"]
+        else:
+            content = body["content"][0]["text"]
+        result = _with_usage(_extract_json(content), provider, body)
+        if "error" in result:
+            results[custom_id] = result
+            continue
+        _store_response(config, provider, req["messages"], True, result)
+        results[custom_id] = _finish_review(
+            config, req["doc_path"], req["doc_type"], req["iteration"], req["focus"],
+            req["messages"], result, persist=False)
+    return {**status, "results": results}
+
+
+# ---------------------------------------------------------------------------
+# Commands
+# ---------------------------------------------------------------------------
+
+def _print_result(result):
+    """Print an API result; exit non-zero if it is an error."""
     print(json.dumps(result, indent=2))
+    if "error" in result:
+        sys.exit(1)
+
+
+def cmd_review(args):
+    """Start a fresh review iteration. Creates conversation state."""
+    # Load additional review instructions from file if provided
+    instructions = ""
+    if args.system_prompt_file:
+        prompt_path = Path(args.system_prompt_file)
+        if prompt_path.exists():
+            instructions = prompt_path.read_text(encoding="utf-8")
+
+    _print_result(review(
+        args.doc_path, iteration=args.iteration, doc_type=args.type,
+        context_files=args.context_files, focus=args.focus,
+        instructions=instructions, profile=getattr(args, 'profile', None),
+        use_cache=not args.no_cache,
+    ))
+
+
+def cmd_respond(args):
+    """Continue the conversation within an iteration."""
+    # Load Claude's response
+    if args.message:
+        claude_message = args.message
+    elif args.message_file:
+        msg_path = Path(args.message_file)
+        if not msg_path.exists():
+            print(json.dumps({"error": f"Message file not found: {msg_path}"}))
+            sys.exit(1)
+        claude_message = msg_path.read_text(encoding="utf-8")
+    else:
+        print(json.dumps({"error": "Provide --message or --message-file"}))
+        sys.exit(1)
+
+    _print_result(respond(args.doc_path, args.iteration, claude_message,
+                          profile=getattr(args, 'profile', None)))
+
+
+def cmd_consensus(args):
+    """Ask reviewer for final consensus summary after discussion."""
+    _print_result(consensus(args.doc_path, args.iteration, profile=getattr(args, 'profile', None)))
+
+
+def cmd_check_config(args):
+    """Verify configuration, API key, and glossary availability."""
+    _print_result(check_config(getattr(args, 'profile', None)))
+
+
+def cmd_check_routing(args):
+    """Check provider fallback and hedging offline, with stubbed providers."""
+    _print_result(check_routing())
+
+
+def cmd_batch_submit(args):
+    """Submit the review requests listed in a JSON file as one batch."""
+    req_path = Path(args.requests_file)
+    if not req_path.exists():
+        _print_result({"error": f"Requests file not found: {req_path}"})
+    requests = json.loads(req_path.read_text(encoding="utf-8"))
+    _print_result(batch_submit(requests, profile=getattr(args, 'profile', None)))
+
+
+def cmd_batch_status(args):
+    """Show whether a batch has finished."""
+    _print_result(batch_status(args.batch_id, profile=getattr(args, 'profile', None)))
+
+
+def cmd_batch_results(args):
+    """Print a finished batch's reviews."""
+    result = batch_results(args.batch_id, wait=args.wait, profile=getattr(args, 'profile', None))
+    for review_result in result.get("results", {}).values():
+        review_result.pop("_conversation", None)
+    _print_result(result)
 
 
 # ---------------------------------------------------------------------------
@@ -1350,6 +2280,7 @@ def main():
     p_review.add_argument("--context-files", nargs="*", default=[], help="Supporting document paths")
     p_review.add_argument("--focus", default="", help="Review focus area")
     p_review.add_argument("--system-prompt-file", default="", help="File containing additional review questions/instructions to append to the prompt")
+    p_review.add_argument("--no-cache", action="store_true", help="Force a fresh review instead of reusing a cached response")
 
     # respond — continue conversation within an iteration
     p_respond = subparsers.add_parser("respond", help="Continue conversation (send Claude's response)")
@@ -1365,6 +2296,16 @@ def main():
 
     # check-config
     subparsers.add_parser("check-config", help="Verify configuration and API key")
+    subparsers.add_parser("check-routing", help="Check provider fallback and hedging offline")
+
+    # batch — asynchronous provider batch API
+    p_bsub = subparsers.add_parser("batch-submit", help="Submit many reviews as one provider batch")
+    p_bsub.add_argument("requests_file", help="JSON list of review requests (doc_path, iteration, doc_type, context_files, focus, instructions)")
+    p_bstat = subparsers.add_parser("batch-status", help="Poll a submitted batch")
+    p_bstat.add_argument("batch_id")
+    p_bres = subparsers.add_parser("batch-results", help="Fetch a finished batch's reviews")
+    p_bres.add_argument("batch_id")
+    p_bres.add_argument("--wait", action="store_true", help="Poll until the batch has ended")
 
     args = parser.parse_args()
 
@@ -1376,6 +2317,14 @@ def main():
         cmd_consensus(args)
     elif args.command == "check-config":
         cmd_check_config(args)
+    elif args.command == "check-routing":
+        cmd_check_routing(args)
+    elif args.command == "batch-submit":
+        cmd_batch_submit(args)
+    elif args.command == "batch-status":
+        cmd_batch_status(args)
+    elif args.command == "batch-results":
+        cmd_batch_results(args)
     else:
         parser.print_help()
         sys.exit(1)
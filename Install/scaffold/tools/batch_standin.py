@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Batch stand-in — local imitation of the OpenAI and Anthropic batch APIs.
+
+Lets batch reviews (adversarial-review.py batch-*, iterate.py batch-*) be
+exercised end to end without network access or API spend. Each request in a
+batch is answered with a canned review: a summary naming the section under
+review and `--issues` placeholder issues. A batch reports as in progress
+for `--delay` seconds after submission, then as ended.
+
+Point the reviewer at it in review_config.json (any API key value works):
+    "batch": {"base_url": "http://127.0.0.1:8790", "poll_seconds": 1}
+
+Endpoints:
+    OpenAI     POST /v1/files, POST /v1/batches, GET /v1/batches/<id>,
+               GET /v1/files/<id>/content
+    Anthropic  POST /v1/messages/batches, GET /v1/messages/batches/<id>,
+               GET /v1/messages/batches/<id>/results
+
+Usage:
+    python scaffold/tools/batch_standin.py serve [--port 8790] [--delay 2] [--issues 1]
+"""
+
+import argparse
+import json
+import re
+import sys
+import threading
+import time
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+_lock = threading.Lock()
+_files = {}    # file id -> bytes
+_batches = {}  # batch id -> {"kind", "created", "results": [...]}
+_options = {"delay": 2.0, "issues": 1}
+
+
+# ---------------------------------------------------------------------------
+# Canned Reviews
+# ---------------------------------------------------------------------------
+
+def _review_text(messages):
+    """Canned review JSON for one request's messages."""
+    prompt = next((m.get("content", "") for m in messages if m.get("role") == "user"), "")
+    if isinstance(prompt, list):  # Anthropic content blocks (prompt caching)
+        prompt = "".join(block.get("text", "") for block in prompt)
+    # Name the section under review (iterate.py instructions), else the document
+    start = prompt.find("--- Section Under Review ---")
+    heading = re.search(r"^#+ .+$", prompt[max(start, 0):], re.MULTILINE)
+    title = heading.group(0).lstrip("# ").strip() if heading else "document"
+    issues = [{
+        "id": f"STANDIN-{n + 1}",
+        "severity": "LOW",
+        "category": "quality",
+        "section": title,
+        "description": f"Stand-in issue {n + 1} for {title}",
+        "suggestion": "No change needed (stand-in reviewer).",
+    } for n in range(_options["issues"])]
+    return json.dumps({"summary": f"Stand-in review of {title}", "issues": issues})
+
+
+def _openai_line(line):
+    body = line.get("body", {})
+    return {
+        "id": f"resp_{line['custom_id']}",
+        "custom_id": line["custom_id"],
+        "response": {"status_code": 200, "body": {
+            "model": body.get("model", ""),
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": _review_text(body.get("messages", []))}}],
+        }},
+        "error": None,
+    }
+
+
+def _anthropic_line(request):
+    params = request.get("params", {})
+    return {
+        "custom_id": request["custom_id"],
+        "result": {"type": "succeeded", "message": {
+            "type": "message", "role": "assistant", "model": params.get("model", ""),
+            "stop_reason": "end_turn",
+            "content": [{"type": "text", "text": _review_text(params.get("messages", []))}],
+        }},
+    }
+
+
+# ---------------------------------------------------------------------------
+# Batches
+# ---------------------------------------------------------------------------
+
+def _new_batch(kind, results):
+    with _lock:
+        batch_id = f"{'batch' if kind == 'openai' else 'msgbatch'}_standin{len(_batches) + 1:04d}"
+        _batches[batch_id] = {"kind": kind, "created": time.time(), "results": results}
+    return batch_id
+
+
+def _ended(batch):
+    return time.time() - batch["created"] >= _options["delay"]
+
+
+def _openai_batch(batch_id):
+    batch = _batches[batch_id]
+    done = _ended(batch)
+    out = {"id": batch_id, "object": "batch", "endpoint": "/v1/chat/completions",
+           "status": "completed" if done else "in_progress",
+           "request_counts": {"total": len(batch["results"]),
+                              "completed": len(batch["results"]) if done else 0, "failed": 0},
+           "output_file_id": None, "error_file_id": None}
+    if done:
+        file_id = f"file-{batch_id}-output"
+        _files.setdefault(file_id, "".join(json.dumps(r) + "\n" for r in batch["results"]).encode())
+        out["output_file_id"] = file_id
+    return out
+
+
+def _anthropic_batch(batch_id, host):
+    batch = _batches[batch_id]
+    done = _ended(batch)
+    count = len(batch["results"])
+    return {"id": batch_id, "type": "message_batch",
+            "processing_status": "ended" if done else "in_progress",
+            "request_counts": {"processing": 0 if done else count, "succeeded": count if done else 0,
+                               "errored": 0, "canceled": 0, "expired": 0},
+            "results_url": f"http://{host}/v1/messages/batches/{batch_id}/results" if done else None}
+
+
+# ---------------------------------------------------------------------------
+# HTTP
+# ---------------------------------------------------------------------------
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status, body, content_type="application/json"):
+        data = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _not_found(self):
+        self._send(404, {"error": {"type": "not_found_error", "message": f"No route for {self.path}"}})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path == "/v1/files":
+            message = BytesParser().parsebytes(
+                b"Content-Type: " + self.headers["Content-Type"].encode() + b"\r\n\r\n" + body)
+            content = next((part.get_payload(decode=True) for part in message.get_payload()
+                            if part.get_param("name", header="content-disposition") == "file"), b"")
+            with _lock:
+                file_id = f"file-standin{len(_files) + 1:04d}"
+                _files[file_id] = content
+            self._send(200, {"id": file_id, "object": "file", "purpose": "batch", "bytes": len(content)})
+        elif self.path == "/v1/batches":
+            req = json.loads(body)
+            lines = [json.loads(l) for l in _files.get(req.get("input_file_id"), b"").decode().splitlines() if l.strip()]
+            batch_id = _new_batch("openai", [_openai_line(l) for l in lines])
+            self._send(200, _openai_batch(batch_id))
+        elif self.path == "/v1/messages/batches":
+            req = json.loads(body)
+            batch_id = _new_batch("anthropic", [_anthropic_line(r) for r in req.get("requests", [])])
+            self._send(200, _anthropic_batch(batch_id, self.headers.get("Host", "")))
+        else:
+            self._not_found()
+
+    def do_GET(self):
+        parts = self.path.strip("/").split("/")
+        if parts[:2] == ["v1", "batches"] and len(parts) == 3 and parts[2] in _batches:
+            self._send(200, _openai_batch(parts[2]))
+        elif parts[:2] == ["v1", "files"] and len(parts) == 4 and parts[3] == "content" and parts[2] in _files:
+            self._send(200, _files[parts[2]], "application/jsonl")
+        elif parts[:3] == ["v1", "messages", "batches"] and len(parts) >= 4 and parts[3] in _batches:
+            if len(parts) == 4:
+                self._send(200, _anthropic_batch(parts[3], self.headers.get("Host", "")))
+            elif parts[4:] == ["results"] and _ended(_batches[parts[3]]):
+                results = _batches[parts[3]]["results"]
+                self._send(200, "".join(json.dumps(r) + "\n" for r in results).encode(), "application/x-jsonl")
+            else:
+                self._not_found()
+        else:
+            self._not_found()
+
+    def log_message(self, fmt, *args):
+        print(f"[standin] {self.command} {self.path}", file=sys.stderr)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def serve(port=8790, delay=2.0, issues=1):
+    _options.update(delay=delay, issues=issues)
+    server = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+    print(f"Batch stand-in listening on http://127.0.0.1:{port} (delay {delay}s, {issues} issue(s) per review)",
+          file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for provider batch APIs")
+    sub = parser.add_subparsers(dest="command")
+    p_serve = sub.add_parser("serve", help="Run the stand-in server")
+    p_serve.add_argument("--port", type=int, default=8790)
+    p_serve.add_argument("--delay", type=float, default=2.0, help="Seconds before a batch reports as ended")
+    p_serve.add_argument("--issues", type=int, default=1, help="Placeholder issues per review")
+
+    args = parser.parse_args()
+    if args.command == "serve":
+        serve(args.port, args.delay, args.issues)
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -23,7 +23,13 @@ Topic Model:
     The --iterate option repeats all 7 topics on the updated code.
 
 Conversation state is saved to .reviews/ so exchanges can continue across calls.
-No pip dependencies — uses urllib only.
+No pip dependencies — standard library only (http.client via http_pool.py).
+
+Library API:
+    The same operations are importable (the module name is hyphenated, so load
+    it with importlib). review(), respond(), consensus() and check_config()
+    return dicts — failures come back as {"error": ...} rather than exiting.
+    iterate.py calls these directly instead of spawning this script.
 
 Environment:
     OPENAI_API_KEY or ANTHROPIC_API_KEY — set via .env file in project root or env var.
@@ -35,15 +41,25 @@ import sys
 import argparse
 import hashlib
 import re
-import time
 from pathlib import Path
 from datetime import datetime
 
+import http_pool
+import rate_limit
+import review_cache
+import sse_stream
+
 
 # ---------------------------------------------------------------------------
 # Configuration & Auth
 # ---------------------------------------------------------------------------
 
+CONFIG_PATH = Path(__file__).parent / "review_config.json"
+
+# In-process cache of the parsed config file, keyed by mtime/size
+_config_cache = {}
+
+
 def load_config(profile=None):
     """Load review_config.json, optionally merging a named profile.
 
@@ -51,12 +67,25 @@ def load_config(profile=None):
     provider settings, temperature, and token limits. Profiles (e.g.,
     "code_review") override provider/model settings from the top level.
     """
-    config_path = Path(__file__).parent / "review_config.json"
-    if not config_path.exists():
-        print(json.dumps({"error": "review_config.json not found", "path": str(config_path)}))
+    config = _read_config(profile)
+    if config is None:
+        print(json.dumps({"error": "review_config.json not found", "path": str(CONFIG_PATH)}))
         sys.exit(1)
-    with open(config_path, encoding="utf-8") as f:
-        base_config = json.load(f)
+    return config
+
+
+def _read_config(profile=None):
+    """Load and merge the config. Returns None if review_config.json is missing."""
+    try:
+        st = CONFIG_PATH.stat()
+    except OSError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    if _config_cache.get("stamp") != stamp:
+        with open(CONFIG_PATH, encoding="utf-8") as f:
+            _config_cache.update(stamp=stamp, data=json.load(f))
+    # Deep copy so callers (and profile merges) never mutate the cached config
+    base_config = json.loads(json.dumps(_config_cache["data"]))
 
     if not profile or profile not in base_config:
         return base_config
@@ -83,6 +112,15 @@ def get_api_key(config):
         1. Environment variable (e.g., OPENAI_API_KEY)
         2. scaffold/.env file (key=value pairs)
     """
+    key = _resolve_api_key(config)
+    if not key:
+        print(json.dumps(_api_key_error(config)))
+        sys.exit(1)
+    return key
+
+
+def _resolve_api_key(config):
+    """API key for the configured provider, or None if not configured."""
     provider = config.get("provider", "openai")
     provider_config = config.get(provider, {})
     env_var = provider_config.get("api_key_env", "OPENAI_API_KEY")
@@ -105,18 +143,31 @@ def get_api_key(config):
                         break
             if key:
                 break
-
-    if not key:
-        print(json.dumps({
-            "error": "API key not found",
-            "provider": provider,
-            "checked": [f"Environment variable: {env_var}", ".env file in scaffold root"],
-            "fix": f"Set {env_var} in your environment or create scaffold/.env with:\n{env_var}=your-key-here"
-        }))
-        sys.exit(1)
     return key
 
 
+def _api_key_error(config):
+    provider = config.get("provider", "openai")
+    env_var = config.get(provider, {}).get("api_key_env", "OPENAI_API_KEY")
+    return {
+        "error": "API key not found",
+        "provider": provider,
+        "checked": [f"Environment variable: {env_var}", ".env file in scaffold root"],
+        "fix": f"Set {env_var} in your environment or create scaffold/.env with:\n{env_var}=your-key-here"
+    }
+
+
+def _load_config_and_key():
+    """Returns (config, api_key, None) or (None, None, error_dict)."""
+    config = _read_config("code_review")
+    if config is None:
+        return None, None, {"error": "review_config.json not found", "path": str(CONFIG_PATH)}
+    api_key = _resolve_api_key(config)
+    if not api_key:
+        return None, None, _api_key_error(config)
+    return config, api_key, None
+
+
 # ---------------------------------------------------------------------------
 # Conversation State
 # ---------------------------------------------------------------------------
@@ -325,29 +376,42 @@ def _parse_retry_after(error_message):
     return None
 
 
-def _make_api_request(url, payload, headers, timeout=180):
+def _make_api_request(provider, url, payload, headers, timeout=180, stream=False, on_issue=None):
     """Make an HTTP POST request with automatic retry on rate limit (429) errors.
 
+    Sent over a pooled keep-alive connection (http_pool.py) and paced by the
+    shared per-provider limiter (rate_limit.py), which learns from each
+    response's rate-limit headers; a 429 blocks the provider for the
+    advertised wait and the retry goes through acquire().
+
     Returns the parsed JSON response body on success.
     Raises urllib.error.HTTPError for non-429 errors.
     Raises urllib.error.URLError for network errors.
     Returns a dict with an "error" key if retries are exhausted.
+
+    With stream=True the response is read as server-sent events
+    (sse_stream.py) and reassembled into the non-streaming body shape;
+    on_issue(issue) is called for each issue as soon as it is complete. A
+    stream that stops early comes back with "_interrupted": {"error", "text"}.
     """
-    import urllib.request
     import urllib.error
 
+    if stream:
+        url, payload = sse_stream.prepare(provider, url, payload)
+    data = json.dumps(payload).encode("utf-8")
     for attempt in range(1, MAX_RATE_LIMIT_RETRIES + 1):
-        req = urllib.request.Request(
-            url,
-            data=json.dumps(payload).encode("utf-8"),
-            headers=headers,
-            method="POST",
-        )
+        rate_limit.acquire(provider, tokens=rate_limit.estimate_tokens(data))
 
         try:
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
-                return json.loads(resp.read().decode("utf-8"))
+            if stream:
+                status, resp_headers, lines = http_pool.post_stream(url, data, headers, timeout=timeout)
+                rate_limit.observe(provider, resp_headers, status)
+                return _read_stream(provider, lines, on_issue)
+            status, resp_headers, body = http_pool.post(url, data, headers, timeout=timeout)
+            rate_limit.observe(provider, resp_headers, status)
+            return json.loads(body.decode("utf-8"))
         except urllib.error.HTTPError as e:
+            rate_limit.observe(provider, e.headers, e.code)
             if e.code == 429:
                 # Rate limited — parse wait time and retry
                 error_body = e.read().decode("utf-8") if e.fp else ""
@@ -357,7 +421,9 @@ def _make_api_request(url, payload, headers, timeout=180):
                 except json.JSONDecodeError:
                     msg = error_body
 
-                wait_time = _parse_retry_after(msg)
+                wait_time = rate_limit.retry_after(e.headers)
+                if wait_time is None:
+                    wait_time = _parse_retry_after(msg)
                 if wait_time is None:
                     wait_time = DEFAULT_RATE_LIMIT_WAIT
                 else:
@@ -370,7 +436,7 @@ def _make_api_request(url, payload, headers, timeout=180):
                         f"Waiting {wait_time:.1f}s before retry...",
                         file=sys.stderr,
                     )
-                    time.sleep(wait_time)
+                    rate_limit.block(provider, wait_time)
                     continue
                 else:
                     # Exhausted retries
@@ -380,11 +446,41 @@ def _make_api_request(url, payload, headers, timeout=180):
                 raise
 
 
+def _read_stream(provider, lines, on_issue=None):
+    """Read an SSE response into the provider's non-streaming body shape."""
+    if on_issue:
+        parser = sse_stream.issue_parser()
+
+        def on_text(chunk):
+            for issue in sse_stream.feed(parser, chunk):
+                on_issue(issue)
+    else:
+        on_text = None
+
+    text, error = sse_stream.read(provider, lines, on_text)
+    body = sse_stream.assemble(provider, text)
+    if error:
+        body["_interrupted"] = {"error": error, "text": text}
+    return body
+
+
+def _interrupted_result(body, json_mode=True):
+    """Result for a stream that stopped early: the issues that arrived
+    complete (marked "_partial"), or an error if there are none."""
+    info = body["_interrupted"]
+    issues = sse_stream.complete_issues(info["text"]) if json_mode else []
+    if issues:
+        print(f"[STREAM] {info['error']} — keeping {len(issues)} complete issue(s)", file=sys.stderr)
+        return {"issues": issues, "_partial": True, "_interrupted": info["error"]}
+    return {"error": f"Reviewer response incomplete: {info['error']}",
+            "partial_content": info["text"]}
+
+
 # ---------------------------------------------------------------------------
 # API Calls — OpenAI
 # ---------------------------------------------------------------------------
 
-def call_openai(api_key, config, messages):
+def call_openai(api_key, config, messages, on_issue=None):
     """Call OpenAI API with JSON response format. Used for review and consensus."""
     import urllib.error
 
@@ -406,9 +502,12 @@ def call_openai(api_key, config, messages):
     }
 
     try:
-        body = _make_api_request(url, payload, headers)
+        body = _make_api_request("openai", url, payload, headers,
+                                 stream=sse_stream.enabled(config), on_issue=on_issue)
         if "error" in body:
             return body  # Rate limit exhausted or other error from helper
+        if "_interrupted" in body:
+            return _interrupted_result(body)
         content = body["choices"][0]["message"]["content"]
         return json.loads(content)
     except urllib.error.HTTPError as e:
@@ -447,9 +546,11 @@ def call_openai_raw(api_key, config, messages):
     }
 
     try:
-        body = _make_api_request(url, payload, headers)
+        body = _make_api_request("openai", url, payload, headers, stream=sse_stream.enabled(config))
         if "error" in body:
             return body  # Rate limit exhausted or other error from helper
+        if "_interrupted" in body:
+            return _interrupted_result(body, json_mode=False)
         content = body["choices"][0]["message"]["content"]
         return {"content": content}
     except urllib.error.HTTPError as e:
@@ -468,7 +569,7 @@ def call_openai_raw(api_key, config, messages):
 # API Calls — Anthropic
 # ---------------------------------------------------------------------------
 
-def call_anthropic(api_key, config, messages):
+def call_anthropic(api_key, config, messages, on_issue=None):
     """Call Anthropic Messages API with JSON response. Used for review and consensus."""
     import urllib.error
 
@@ -501,9 +602,12 @@ def call_anthropic(api_key, config, messages):
     }
 
     try:
-        body = _make_api_request(url, payload, headers)
+        body = _make_api_request("anthropic", url, payload, headers,
+                                 stream=sse_stream.enabled(config), on_issue=on_issue)
         if "error" in body:
             return body  # Rate limit exhausted or other error from helper
+        if "_interrupted" in body:
+            return _interrupted_result(body)
         content = body["content"][0]["text"]
         # Try to extract JSON from response
         return _extract_json(content)
@@ -551,9 +655,11 @@ def call_anthropic_raw(api_key, config, messages):
     }
 
     try:
-        body = _make_api_request(url, payload, headers)
+        body = _make_api_request("anthropic", url, payload, headers, stream=sse_stream.enabled(config))
         if "error" in body:
             return body  # Rate limit exhausted or other error from helper
+        if "_interrupted" in body:
+            return _interrupted_result(body, json_mode=False)
         content = body["content"][0]["text"]
         return {"content": content}
     except urllib.error.HTTPError as e:
@@ -597,21 +703,40 @@ def _extract_json(text):
 # Provider Dispatch
 # ---------------------------------------------------------------------------
 
-def call_provider(api_key, config, messages, json_mode=True):
-    """Route to the correct provider's API call.
+def call_provider(api_key, config, messages, json_mode=True, use_cache=True, on_issue=None):
+    """Route to the correct provider's API call, through the response cache.
 
     json_mode=True: forces structured JSON response (for review and consensus).
     json_mode=False: returns raw text (for inner loop exchanges).
+    use_cache=False: skip the cache lookup (the fresh response is still stored).
+    on_issue: called with each issue as it streams in (config "stream").
     """
     provider = config.get("provider", "openai")
+    if not review_cache.enabled(config):
+        return _call_single_provider(provider, api_key, config, messages, json_mode, on_issue)
+
+    model = config.get(provider, {}).get("model", "")
+    cache_key = review_cache.key(provider, model, config.get("temperature", 0.3), messages, json_mode)
+    if use_cache:
+        result = review_cache.get(cache_key, config)
+        if result is not None:
+            print(f"[CACHE] Reusing cached {provider} response", file=sys.stderr)
+            return result
+    result = _call_single_provider(provider, api_key, config, messages, json_mode, on_issue)
+    review_cache.put(cache_key, result, config, provider, model)
+    return result
+
+
+def _call_single_provider(provider, api_key, config, messages, json_mode, on_issue=None):
+    """Call the configured provider once."""
     if provider == "openai":
         if json_mode:
-            return call_openai(api_key, config, messages)
+            return call_openai(api_key, config, messages, on_issue)
         else:
             return call_openai_raw(api_key, config, messages)
     elif provider == "anthropic":
         if json_mode:
-            return call_anthropic(api_key, config, messages)
+            return call_anthropic(api_key, config, messages, on_issue)
         else:
             return call_anthropic_raw(api_key, config, messages)
     else:
@@ -752,39 +877,60 @@ Revise the score if the discussion revealed the code is better or worse than ini
 
 
 # ---------------------------------------------------------------------------
-# Commands
+# Library API
 # ---------------------------------------------------------------------------
 
-def cmd_review(args):
-    """Start a fresh review for a specific topic. Creates conversation state.
+def _context_block(context_files=(), context_text=""):
+    """Format context files (and pre-resolved context text) for the prompt."""
+    context_parts = []
+    for cf in (context_files or []):
+        cf_path = Path(cf)
+        if cf_path.exists():
+            context_parts.append(
+                f"--- Context: {cf_path.name} ---\n"
+                f"{cf_path.read_text(encoding='utf-8')}\n"
+                f"--- End {cf_path.name} ---"
+            )
+        else:
+            context_parts.append(f"[Warning: context file not found: {cf}]")
+    if context_text:
+        context_parts.append(f"--- Context ---\n{context_text}\n--- End Context ---")
+    return "\n\n".join(context_parts) if context_parts else ""
+
+
+def review(code_path, topic, iteration=1, files=(), context_files=(), context_text="",
+           focus="", instructions="", persist=True, use_cache=True, on_issue=None):
+    """Start a fresh review for a topic and save the conversation state.
 
     Reads the code file (or multiple files), sends to the reviewer with the
-    topic-specific prompt, and saves the conversation state for follow-up.
+    topic-specific prompt. Returns the review (summary, issues, _meta) or
+    {"error": ...}. With persist=False the conversation state is returned as
+    "_conversation" instead of written to disk; use_cache=False forces a
+    fresh provider call. on_issue(issue) sees each issue as it streams in.
     """
-    config = load_config("code_review")
-    api_key = get_api_key(config)
+    config, api_key, error = _load_config_and_key()
+    if error:
+        return error
 
     # Validate topic number
-    topic_num = args.topic
-    if topic_num not in TOPICS:
-        print(json.dumps({
-            "error": f"Invalid topic: {topic_num}",
+    if topic not in TOPICS:
+        return {
+            "error": f"Invalid topic: {topic}",
             "valid_topics": {k: v["name"] for k, v in TOPICS.items()},
-        }))
-        sys.exit(1)
+        }
 
     # Read primary code file
-    code_path = Path(args.code_path)
+    code_key = str(code_path)  # conversation files are keyed by the path as given
+    code_path = Path(code_path)
     if not code_path.exists():
-        print(json.dumps({"error": f"Code file not found: {code_path}"}))
-        sys.exit(1)
+        return {"error": f"Code file not found: {code_path}"}
 
     # Build code content — may include multiple files
     code_parts = []
     code_parts.append(f"=== File: {code_path.name} ===\n{code_path.read_text(encoding='utf-8')}")
 
     # Include additional files if provided (e.g., header + split implementation files)
-    for extra in (args.files or []):
+    for extra in (files or []):
         extra_path = Path(extra)
         if extra_path.exists():
             code_parts.append(f"\n\n=== File: {extra_path.name} ===\n{extra_path.read_text(encoding='utf-8')}")
@@ -793,118 +939,103 @@ def cmd_review(args):
 
     code_content = "\n".join(code_parts)
 
-    # Load context files (architecture docs, design docs, etc.)
-    context_parts = []
-    for cf in (args.context_files or []):
-        cf_path = Path(cf)
-        if cf_path.exists():
-            context_parts.append(
-                f"--- Context: {cf_path.name} ---\n"
-                f"{cf_path.read_text(encoding='utf-8')}\n"
-                f"--- End {cf_path.name} ---"
-            )
-        else:
-            context_parts.append(f"[Warning: context file not found: {cf}]")
-    context_str = "\n\n".join(context_parts) if context_parts else ""
+    # Context documents (architecture docs, design docs, etc.)
+    context_str = _context_block(context_files, context_text)
 
     # Build messages
     system_msg = build_system_prompt()
     user_msg = build_review_prompt(
-        code_content, topic_num, context_str,
-        focus=args.focus or ""
+        code_content, topic, context_str,
+        focus=focus or ""
     )
+    if instructions:
+        user_msg += f"\n\n--- Additional Review Instructions ---\n{instructions}"
 
     messages = [
         {"role": "system", "content": system_msg},
         {"role": "user", "content": user_msg},
     ]
 
-    result = call_provider(api_key, config, messages, json_mode=True)
+    result = call_provider(api_key, config, messages, json_mode=True, use_cache=use_cache,
+                           on_issue=on_issue)
 
     if "error" in result:
-        print(json.dumps(result, indent=2))
-        sys.exit(1)
+        return result
+    partial = result.pop("_partial", False)
+    interrupted = result.pop("_interrupted", None)
 
     # Save conversation state
     messages.append({"role": "assistant", "content": json.dumps(result)})
 
     conv_state = {
         "code_path": str(code_path),
-        "additional_files": args.files or [],
-        "topic": topic_num,
-        "topic_name": TOPICS[topic_num]["name"],
-        "iteration": args.iteration,
+        "additional_files": list(files or []),
+        "topic": topic,
+        "topic_name": TOPICS[topic]["name"],
+        "iteration": iteration,
         "exchange": 1,
         "provider": config.get("provider", "openai"),
         "model": config.get(config.get("provider", "openai"), {}).get("model", "unknown"),
-        "focus": args.focus or None,
+        "focus": focus or None,
         "started": datetime.now().isoformat(),
         "messages": messages,
         "initial_review": result,
         "consensus": None,
     }
 
-    state_path = conv_path(args.code_path, topic_num, args.iteration)
-    save_conversation(state_path, conv_state)
+    state_path = conv_path(code_key, topic, iteration)
+    if persist:
+        save_conversation(state_path, conv_state)
+    else:
+        # Snapshot before _meta is added (conv_state["initial_review"] is result)
+        conversation = json.loads(json.dumps(conv_state))
 
     # Add meta to output
     result["_meta"] = {
         "code_path": str(code_path),
-        "topic": topic_num,
-        "topic_name": TOPICS[topic_num]["name"],
-        "iteration": args.iteration,
+        "topic": topic,
+        "topic_name": TOPICS[topic]["name"],
+        "iteration": iteration,
         "exchange": 1,
         "provider": config.get("provider", "openai"),
         "model": conv_state["model"],
         "conversation_file": str(state_path),
         "issue_count": len(result.get("issues", [])),
     }
-
-    print(json.dumps(result, indent=2))
-
-
-def cmd_respond(args):
-    """Continue the conversation within a topic's review.
-
-    Loads Claude's evaluation of the reviewer's issues from a message or file,
-    appends it to the conversation, and gets the reviewer's counter-response.
-    """
-    config = load_config("code_review")
-    api_key = get_api_key(config)
-
-    state_path = conv_path(args.code_path, args.topic, args.iteration)
+    if partial:
+        # Stream stopped early — only the issues that arrived complete
+        result["_meta"]["partial"] = True
+        result["_meta"]["interrupted"] = interrupted
+    if not persist:
+        result["_conversation"] = conversation
+    return result
+
+
+def respond(code_path, topic, iteration, message):
+    """Send the author's reply within a topic's review and return the
+    reviewer's response ({"reviewer_response", "_meta"}) or {"error": ...}."""
+    config, api_key, error = _load_config_and_key()
+    if error:
+        return error
+
+    state_path = conv_path(code_path, topic, iteration)
     conv_state = load_conversation(state_path)
 
     if not conv_state:
-        print(json.dumps({
-            "error": f"No conversation found for topic {args.topic}, iteration {args.iteration}",
-            "fix": f"Run 'review' first: python code-review.py review {args.code_path} --topic {args.topic} --iteration {args.iteration}"
-        }))
-        sys.exit(1)
-
-    # Load Claude's response
-    if args.message:
-        claude_message = args.message
-    elif args.message_file:
-        msg_path = Path(args.message_file)
-        if not msg_path.exists():
-            print(json.dumps({"error": f"Message file not found: {msg_path}"}))
-            sys.exit(1)
-        claude_message = msg_path.read_text(encoding="utf-8")
-    else:
-        print(json.dumps({"error": "Provide --message or --message-file"}))
-        sys.exit(1)
+        return {
+            "error": f"No conversation found for topic {topic}, iteration {iteration}",
+            "fix": f"Run 'review' first: python code-review.py review {code_path} --topic {topic} --iteration {iteration}"
+        }
 
     # Append Claude's message to conversation
-    conv_state["messages"].append({"role": "user", "content": claude_message})
+    conv_state["messages"].append({"role": "user", "content": message})
     conv_state["exchange"] += 1
 
     # Call provider with full conversation history (raw text mode for discussion)
     result = call_provider(api_key, config, conv_state["messages"], json_mode=False)
 
     if "error" in result:
-        print(json.dumps(result, indent=2))
-        sys.exit(1)
+        return result
 
     reviewer_response = result["content"]
 
@@ -914,7 +1045,7 @@ def cmd_respond(args):
     # Save updated state
     save_conversation(state_path, conv_state)
 
-    output = {
+    return {
         "reviewer_response": reviewer_response,
         "_meta": {
             "code_path": conv_state["code_path"],
@@ -927,24 +1058,19 @@ def cmd_respond(args):
         }
     }
 
-    print(json.dumps(output, indent=2))
 
+def consensus(code_path, topic, iteration):
+    """Ask the reviewer for its final consensus summary on a topic.
+    Returns the consensus dict or {"error": ...}."""
+    config, api_key, error = _load_config_and_key()
+    if error:
+        return error
 
-def cmd_consensus(args):
-    """Ask reviewer for final consensus summary after discussion on a topic.
-
-    Appends the consensus request to the conversation, forces a JSON response,
-    and saves the result.
-    """
-    config = load_config("code_review")
-    api_key = get_api_key(config)
-
-    state_path = conv_path(args.code_path, args.topic, args.iteration)
+    state_path = conv_path(code_path, topic, iteration)
     conv_state = load_conversation(state_path)
 
     if not conv_state:
-        print(json.dumps({"error": f"No conversation found for topic {args.topic}, iteration {args.iteration}"}))
-        sys.exit(1)
+        return {"error": f"No conversation found for topic {topic}, iteration {iteration}"}
 
     # Append consensus request
     conv_state["messages"].append({"role": "user", "content": build_consensus_request()})
@@ -953,8 +1079,7 @@ def cmd_consensus(args):
     result = call_provider(api_key, config, conv_state["messages"], json_mode=True)
 
     if "error" in result:
-        print(json.dumps(result, indent=2))
-        sys.exit(1)
+        return result
 
     # Save consensus
     conv_state["messages"].append({"role": "assistant", "content": json.dumps(result)})
@@ -969,13 +1094,14 @@ def cmd_consensus(args):
         "exchanges": conv_state["exchange"],
         "conversation_file": str(state_path),
     }
-
-    print(json.dumps(result, indent=2))
+    return result
 
 
-def cmd_check_config(args):
-    """Verify configuration, API key, and list available topics."""
-    config = load_config("code_review")
+def check_config():
+    """Report configuration, API key, and available topics."""
+    config = _read_config("code_review")
+    if config is None:
+        return {"error": "review_config.json not found", "path": str(CONFIG_PATH)}
     provider = config.get("provider", "openai")
     provider_config = config.get(provider, {})
     env_var = provider_config.get("api_key_env", "OPENAI_API_KEY")
@@ -1012,12 +1138,63 @@ def cmd_check_config(args):
         "api_key_source": key_source if has_key else "not found",
         "env_file_exists": has_env_file,
         "topics": {k: {"name": v["name"], "description": v["description"]} for k, v in TOPICS.items()},
+        "response_cache": {**review_cache.settings(config), **review_cache.stats()},
     }
 
     if not has_key:
         result["warning"] = f"API key not found. Set {env_var} in your environment or create scaffold/.env with:\n{env_var}=your-key-here"
 
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Commands
+# ---------------------------------------------------------------------------
+
+def _print_result(result):
+    """Print an API result; exit non-zero if it is an error."""
     print(json.dumps(result, indent=2))
+    if "error" in result:
+        sys.exit(1)
+
+
+def cmd_review(args):
+    """Start a fresh review for a specific topic. Creates conversation state."""
+    _print_result(review(
+        args.code_path, args.topic, iteration=args.iteration, files=args.files,
+        context_files=args.context_files, focus=args.focus, use_cache=not args.no_cache,
+    ))
+
+
+def cmd_respond(args):
+    """Continue the conversation within a topic's review.
+
+    Loads Claude's evaluation of the reviewer's issues from a message or file,
+    appends it to the conversation, and gets the reviewer's counter-response.
+    """
+    if args.message:
+        claude_message = args.message
+    elif args.message_file:
+        msg_path = Path(args.message_file)
+        if not msg_path.exists():
+            print(json.dumps({"error": f"Message file not found: {msg_path}"}))
+            sys.exit(1)
+        claude_message = msg_path.read_text(encoding="utf-8")
+    else:
+        print(json.dumps({"error": "Provide --message or --message-file"}))
+        sys.exit(1)
+
+    _print_result(respond(args.code_path, args.topic, args.iteration, claude_message))
+
+
+def cmd_consensus(args):
+    """Ask reviewer for final consensus summary after discussion on a topic."""
+    _print_result(consensus(args.code_path, args.topic, args.iteration))
+
+
+def cmd_check_config(args):
+    """Verify configuration, API key, and list available topics."""
+    _print_result(check_config())
 
 
 # ---------------------------------------------------------------------------
@@ -1044,6 +1221,8 @@ def main():
                           help="Supporting context document paths (architecture.md, etc.)")
     p_review.add_argument("--focus", default="",
                           help="Narrow the review focus within this topic")
+    p_review.add_argument("--no-cache", action="store_true",
+                          help="Force a fresh review instead of reusing a cached response")
 
     # respond — continue conversation within a topic
     p_respond = subparsers.add_parser("respond", help="Continue conversation (send Claude's response)")
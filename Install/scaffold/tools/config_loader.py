@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+Config loader — shared, cached YAML loading for the orchestrator configs.
+
+iterate.py, local-review.py, seed.py, revise.py and validate.py each read a
+layer/scope config from configs/<family>/<name>.yaml on every invocation
+(validate --scope all reads ~20). This module parses each file once: the
+result is stored as a marshal blob keyed by a hash of the file's bytes, so
+later loads — in any process — skip YAML parsing entirely until the file
+changes. Within one process the blob is also kept in memory.
+
+Parsing uses PyYAML (its C loader when built) if installed, otherwise a
+single-pass indentation parser covering the YAML subset the configs use:
+block mappings and sequences, "- key: value" items, quoted keys and
+scalars, [flow, lists], {} and inline comments.
+
+Each config is checked against its family's schema (required keys, types
+of known keys) when the cache entry is built, so a malformed config is
+rejected when a session starts rather than failing partway through one.
+load() returns (config, errors); the result is cached either way.
+
+Cache: scaffold/.reviews/config-cache/<key>.bin
+
+Usage:
+    import config_loader
+
+    config, errors = config_loader.load(path, "iterate")   # (None, []) if missing
+    data = config_loader.load_yaml(path)                   # no schema
+
+Commands:
+    check [family ...]   Validate every config (default: all families).
+    clear                Delete the cache.
+"""
+
+import argparse
+import hashlib
+import json
+import marshal
+import os
+import re
+import sys
+import threading
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).parent
+SCAFFOLD_DIR = TOOLS_DIR.parent
+CONFIGS_DIR = TOOLS_DIR / "configs"
+CACHE_DIR = SCAFFOLD_DIR / ".reviews" / "config-cache"
+
+# Bump when the parser or schemas change, so old cache entries are ignored
+CACHE_VERSION = 1
+
+_lock = threading.Lock()
+_memo = {}  # (path, mtime_ns, size, family) -> marshal blob
+_parser = None  # "pyyaml" or "fallback", see _parser_name()
+
+
+# ---------------------------------------------------------------------------
+# Schemas
+# ---------------------------------------------------------------------------
+
+# Top-level keys each family must have, and the types its known keys must
+# have when present. The orchestrators read these with config.get(key,
+# default) and then index into them, so a key left empty (None) or given
+# the wrong shape otherwise surfaces as a crash mid-session.
+SCHEMAS = {
+    "iterate": {
+        "required": ["layer", "display_name"],
+        "types": {
+            "layer": str, "display_name": str, "target_type": str, "target": str,
+            "target_pattern": str, "target_docs": list, "reviewer": str,
+            "preflight": dict, "context": dict, "defaults": dict, "l1_questions": list,
+            "l2_sections": dict, "l3_sections": dict, "per_doc": dict, "scope_guard": dict,
+            "adjudication": dict, "review_lock": dict, "report": dict, "rules": list,
+            "identity_check": dict, "linked_sections": dict, "bias_pack": list,
+        },
+    },
+    "fix": {
+        "required": ["layer", "display_name"],
+        "types": {
+            "layer": str, "display_name": str, "target_type": str, "target": str,
+            "target_pattern": str, "target_docs": list, "template": str,
+            "preflight": dict, "context": dict, "defaults": dict,
+            "editable_files": list, "editable_files_pattern": str,
+            "mechanical_checks": dict, "judgment_checks": dict, "signals": dict,
+            "report": dict, "rules": list,
+        },
+    },
+    "revise": {
+        "required": ["layer", "display_name"],
+        "types": {
+            "layer": str, "display_name": str, "preflight": dict,
+            "editable_files": list, "editable_files_pattern": str,
+            "feedback_sources": list, "safe_patterns": list, "escalation_patterns": list,
+            "dispatch_order": list,
+        },
+    },
+    "seed": {
+        "required": ["layer", "display_name"],
+        "types": {
+            "layer": str, "display_name": str, "template": (str, type(None)),
+            "index_file": (str, type(None)), "target": str, "target_type": str,
+            "preflight": dict, "upstream_sources": list, "project_context": dict,
+            "dependency_checks": list, "coverage_rules": list, "output_pattern": str,
+            "output_files": list, "id_pattern": str, "id_prefix": str,
+            "propose_rules": dict,
+        },
+    },
+    "validate": {
+        "required": ["scope", "display_name", "checks"],
+        "types": {
+            "scope": str, "display_name": str, "glob_pattern": str,
+            "activation": dict, "checks": dict,
+        },
+    },
+}
+
+
+def _type_name(types):
+    types = types if isinstance(types, tuple) else (types,)
+    names = {dict: "a mapping", list: "a list", str: "a string", type(None): "empty"}
+    return " or ".join(names.get(t, t.__name__) for t in types)
+
+
+def validate(config, family):
+    """Schema errors for a parsed config (empty list when valid)."""
+    schema = SCHEMAS.get(family)
+    if schema is None:
+        return []
+    if not isinstance(config, dict):
+        return ["top level must be a mapping"]
+    errors = [f"missing required key '{k}'" for k in schema["required"] if k not in config]
+    for key, types in schema["types"].items():
+        if key in config and not isinstance(config[key], types):
+            found = "empty" if config[key] is None else type(config[key]).__name__
+            errors.append(f"'{key}' must be {_type_name(types)} (found {found})")
+    return errors
+
+
+# ---------------------------------------------------------------------------
+# Fallback Parser (single pass, no dependencies)
+# ---------------------------------------------------------------------------
+
+_INT = re.compile(r"[-+]?(?:0|[1-9][0-9_]*)")
+_FLOAT = re.compile(r"[-+]?(?:[0-9][0-9_]*)?\.[0-9_]*(?:[eE][-+][0-9]+)?")
+_BOOLS = {
+    "true": True, "True": True, "TRUE": True, "yes": True, "Yes": True, "YES": True,
+    "on": True, "On": True, "ON": True,
+    "false": False, "False": False, "FALSE": False, "no": False, "No": False, "NO": False,
+    "off": False, "Off": False, "OFF": False,
+}
+_NULLS = {"", "~", "null", "Null", "NULL"}
+
+
+def _strip_comment(text):
+    """Drop a trailing " # comment" outside quotes."""
+    quote, escaped = None, False
+    for i, c in enumerate(text):
+        if quote:
+            if escaped:
+                escaped = False
+            elif c == "\\" and quote == '"':
+                escaped = True
+            elif c == quote:
+                quote = None
+        elif c in "\"'" and (i == 0 or text[i - 1] in " [{,:"):
+            quote = c
+        elif c == "#" and (i == 0 or text[i - 1] in " \t"):
+            return text[:i].rstrip()
+    return text
+
+
+def _unquote(text):
+    if text[0] == '"':
+        try:
+            return json.loads(text)
+        except ValueError:
+            return text[1:-1]
+    return text[1:-1].replace("''", "'")
+
+
+def _split_flow(inner):
+    """Split the inside of a [flow] or {flow} collection on top-level commas."""
+    parts, depth, quote, escaped, start = [], 0, None, False, 0
+    for i, c in enumerate(inner):
+        if quote:
+            if escaped:
+                escaped = False
+            elif c == "\\" and quote == '"':
+                escaped = True
+            elif c == quote:
+                quote = None
+        elif c in "\"'":
+            quote = c
+        elif c in "[{":
+            depth += 1
+        elif c in "]}":
+            depth -= 1
+        elif c == "," and depth == 0:
+            parts.append(inner[start:i])
+            start = i + 1
+    parts.append(inner[start:])
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _scalar(text):
+    """Parse a scalar or flow collection (already comment-stripped)."""
+    text = text.strip()
+    if text in _NULLS:
+        return None
+    if text[0] in "\"'" and len(text) > 1 and text[-1] == text[0]:
+        return _unquote(text)
+    if text[0] == "[" and text[-1] == "]":
+        return [_scalar(p) for p in _split_flow(text[1:-1])]
+    if text[0] == "{" and text[-1] == "}":
+        out = {}
+        for part in _split_flow(text[1:-1]):
+            key, value = _split_key(part)
+            out[key] = _scalar(value) if value is not None else None
+        return out
+    if text in _BOOLS:
+        return _BOOLS[text]
+    if _INT.fullmatch(text):
+        return int(text.replace("_", ""))
+    if _FLOAT.fullmatch(text) and any(ch.isdigit() for ch in text):
+        return float(text.replace("_", ""))
+    return text
+
+
+def _split_key(text):
+    """(key, rest) for a "key: value" line, or (None, None) if it is not one.
+    rest is "" for a key with nothing after the colon."""
+    if text[0] in "\"'":
+        end = text.find(text[0], 1)
+        while end != -1 and text[0] == "'" and text[end + 1:end + 2] == "'":
+            end = text.find("'", end + 2)
+        while end != -1 and text[0] == '"' and text[end - 1] == "\\":
+            end = text.find('"', end + 1)
+        if end != -1 and text[end + 1:end + 2] == ":":
+            return _unquote(text[:end + 1]), text[end + 2:].strip()
+        return None, None
+    for m in re.finditer(":", text):
+        i = m.start()
+        if i + 1 == len(text) or text[i + 1] in " \t":
+            key = text[:i].strip()
+            return (_scalar(key) if key else key), text[i + 1:].strip()
+    return None, None
+
+
+def parse(text):
+    """Parse YAML text (the config subset) in a single pass over its lines."""
+    root = None
+    stack = []        # [indent, container] — innermost last
+    pending = None    # (container, key, indent): a key/item whose value is on later lines
+    last = None       # (container, key, indent) of the last plain scalar, for continuation lines
+
+    for raw in text.splitlines():
+        stripped = raw.strip()
+        if not stripped or stripped.startswith("#") or stripped in ("---", "..."):
+            continue
+        indent = len(raw) - len(raw.lstrip(" "))
+        body = _strip_comment(stripped)
+        is_item = body == "-" or body.startswith("- ")
+
+        # Value of a pending key: a nested block, or nothing
+        if pending:
+            parent, key, key_indent = pending
+            pending = None
+            if indent > key_indent or (is_item and indent == key_indent and isinstance(parent, dict)):
+                child = [] if is_item else {}
+                parent[key] = child
+                stack.append([indent, child])
+
+        while stack and (stack[-1][0] > indent or
+                         (stack[-1][0] == indent and isinstance(stack[-1][1], list) and not is_item)):
+            stack.pop()
+
+        # Plain scalar continued on a deeper line
+        if last and indent > last[2] and not is_item and (not stack or stack[-1][0] < indent):
+            container, key, _ = last
+            container[key] = f"{container[key]} {body}"
+            continue
+        last = None
+
+        if root is None:
+            root = [] if is_item else {}
+            stack.append([indent, root])
+        top = stack[-1][1] if stack else root
+
+        if is_item:
+            item = body[1:].strip()
+            top.append(None)
+            index = len(top) - 1
+            if not item:
+                pending = (top, index, indent)
+                continue
+            key, rest = _split_key(item)
+            if key is None:
+                top[index] = _scalar(item)
+                last = (top, index, indent) if item[0] not in "\"'[{" else None
+                continue
+            mapping = {}
+            top[index] = mapping
+            key_indent = indent + 1 + (len(body[1:]) - len(body[1:].lstrip()))
+            stack.append([key_indent, mapping])
+            top, indent = mapping, key_indent
+        else:
+            key, rest = _split_key(body)
+            if key is None:
+                continue  # Not a mapping line — ignored like the old parser did
+        if rest:
+            top[key] = _scalar(rest)
+            last = (top, key, indent) if rest[0] not in "\"'[{" else None
+        else:
+            top[key] = None
+            pending = (top, key, indent)
+    return root
+
+
+# ---------------------------------------------------------------------------
+# Loading & Cache
+# ---------------------------------------------------------------------------
+
+def _parser_name():
+    """Which parser a cache miss would use — found without importing PyYAML,
+    which costs more than a cache hit."""
+    global _parser
+    if _parser is None:
+        import importlib.util
+
+        _parser = "pyyaml" if importlib.util.find_spec("yaml") else "fallback"
+    return _parser
+
+
+def _yaml_parser():
+    """(name, parse function) for the best available parser."""
+    try:
+        import yaml
+    except ImportError:
+        return "fallback", parse
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return f"pyyaml-{loader.__name__}", lambda text: yaml.load(text, Loader=loader)
+
+
+def _cache_path(key):
+    return CACHE_DIR / f"{key}.bin"
+
+
+def load(path, family=None):
+    """Parsed config and its schema errors: (config, errors).
+    (None, []) if the file does not exist."""
+    path = Path(path)
+    try:
+        st = path.stat()
+    except OSError:
+        return None, []
+    memo_key = (str(path), st.st_mtime_ns, st.st_size, family)
+    with _lock:
+        blob = _memo.get(memo_key)
+    if blob is None:
+        blob = _load_blob(path, family)
+        with _lock:
+            _memo[memo_key] = blob
+    entry = marshal.loads(blob)  # A fresh copy — callers may mutate it
+    return entry["config"], entry["errors"]
+
+
+def _load_blob(path, family):
+    data = path.read_bytes()
+    key = hashlib.sha256(
+        f"{CACHE_VERSION}:{_parser_name()}:{family}:".encode() + data).hexdigest()[:32]
+    try:
+        return _cache_path(key).read_bytes()
+    except OSError:
+        pass
+
+    try:
+        config = _yaml_parser()[1](data.decode("utf-8"))
+        errors = validate(config, family)
+    except Exception as e:  # Parser errors vary by backend
+        config, errors = None, [f"could not parse: {e}"]
+    try:
+        blob = marshal.dumps({"config": config, "errors": errors})
+    except ValueError:
+        # Types marshal cannot store (e.g. YAML dates) — use it uncached
+        return marshal.dumps({"config": json.loads(json.dumps(config, default=str)), "errors": errors})
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = _cache_path(key).with_suffix(f".tmp{os.getpid()}.{threading.get_ident()}")
+        tmp.write_bytes(blob)
+        os.replace(tmp, _cache_path(key))
+    except OSError:
+        pass  # the cache is an optimisation — never fail a load over it
+    return blob
+
+
+def load_yaml(path):
+    """Parsed YAML file (cached), or None if it does not exist."""
+    return load(path)[0]
+
+
+def load_config(path, family):
+    """Parsed config, or None if it is missing or fails its schema (the
+    errors are printed to stderr)."""
+    config, errors = load(path, family)
+    for error in errors:
+        print(f"[config] {Path(path).name}: {error}", file=sys.stderr)
+    return None if errors else config
+
+
+def clear():
+    """Delete every cached config. Returns the count removed."""
+    removed = 0
+    if CACHE_DIR.is_dir():
+        for path in CACHE_DIR.glob("*.bin"):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+    with _lock:
+        _memo.clear()
+    return removed
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _output(data):
+    print(json.dumps(data, indent=2))
+
+
+def cmd_check(args):
+    families = args.families or sorted(SCHEMAS)
+    unknown = [f for f in families if f not in SCHEMAS]
+    if unknown:
+        _output({"status": "error", "message": f"Unknown config family: {', '.join(unknown)}",
+                 "families": sorted(SCHEMAS)})
+        sys.exit(1)
+    invalid = {}
+    checked = 0
+    for family in families:
+        for path in sorted((CONFIGS_DIR / family).glob("*.yaml")):
+            checked += 1
+            _, errors = load(path, family)
+            if errors:
+                invalid[f"{family}/{path.name}"] = errors
+    _output({"status": "error" if invalid else "ok", "parser": _yaml_parser()[0],
+             "checked": checked, "invalid": invalid})
+    if invalid:
+        sys.exit(1)
+
+
+def cmd_clear(args):
+    _output({"status": "ok", "removed": clear()})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cached config loader")
+    sub = parser.add_subparsers(dest="command")
+    p_check = sub.add_parser("check", help="Validate every config against its schema")
+    p_check.add_argument("families", nargs="*", metavar="family", help=", ".join(sorted(SCHEMAS)))
+    sub.add_parser("clear", help="Delete the config cache")
+
+    args = parser.parse_args()
+    if args.command == "check":
+        cmd_check(args)
+    elif args.command == "clear":
+        cmd_clear(args)
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,9 +15,17 @@ Each context entry can specify:
   - priority:  1-5 (1 = essential, 5 = nice-to-have). Used for sort order.
   - condition: optional gate (exists, task_type:X, has_section:X)
 
+Budget: if the config sets `context: budget: N` (estimated tokens), loaded
+entries are packed to fit — entries are dropped in _CLASS_DROP_ORDER (then
+lowest priority first), and the last entry cut is truncated instead of
+dropped when that is enough. resolve_packed() reports what was dropped or
+truncated.
+
 YAML config format:
 
     context:
+      budget: 35000                    # estimated tokens (~4 chars each)
+
       base:                            # always loaded
         - file: design/glossary.md
           class: constraint
@@ -52,13 +60,87 @@ YAML config format:
           priority: 4
 """
 
+import os
 import re
 from pathlib import Path
 
+import doc_index
+
 
 SCAFFOLD_DIR = Path(__file__).parent.parent
 
 
+# ---------------------------------------------------------------------------
+# Parsed Document Cache
+# ---------------------------------------------------------------------------
+
+# Process-wide caches. Files are keyed by absolute path and revalidated by
+# mtime/size; parsed heading trees are keyed by the content string itself,
+# so repeated extract_section() calls on the same text are dict lookups.
+_file_cache = {}
+_parse_cache = {}
+_PARSE_CACHE_MAX = 128
+
+_HEADING_LINE = re.compile(r"^(#+)\s+(.*?)\s*$")
+
+
+def _parse_headings(content):
+    """Build the heading tree for a document.
+
+    Returns {"lines": [...], "spans": {(level, text): (start, end)}} where
+    start/end are line indexes of the first heading with that level and text
+    and the next heading of the same or higher level (or EOF)."""
+    lines = content.splitlines()
+    spans = {}
+    open_headings = []  # stack of (level, key, start) awaiting an end line
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped.startswith("#"):
+            continue
+        depth = len(stripped) - len(stripped.lstrip("#"))
+        while open_headings and open_headings[-1][0] >= depth:
+            _, key, start = open_headings.pop()
+            spans.setdefault(key, (start, i))
+        match = _HEADING_LINE.match(stripped)
+        if match:
+            open_headings.append((depth, (depth, match.group(2)), i))
+    for _, key, start in open_headings:
+        spans.setdefault(key, (start, len(lines)))
+    return {"lines": lines, "spans": spans}
+
+
+def _parsed(content):
+    """Return the cached heading tree for content, parsing it on first use."""
+    parsed = _parse_cache.get(content)
+    if parsed is None:
+        if len(_parse_cache) >= _PARSE_CACHE_MAX:
+            del _parse_cache[next(iter(_parse_cache))]
+        parsed = _parse_headings(content)
+        _parse_cache[content] = parsed
+    return parsed
+
+
+def read_doc(abs_path):
+    """Read a file through the process-wide cache. The file is re-read only
+    when its mtime or size changes. Returns None if it cannot be read."""
+    key = str(abs_path)
+    try:
+        st = os.stat(key)
+    except OSError:
+        _file_cache.pop(key, None)
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _file_cache.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    try:
+        content = Path(key).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    _file_cache[key] = (stamp, content)
+    return content
+
+
 # ---------------------------------------------------------------------------
 # Section Extraction
 # ---------------------------------------------------------------------------
@@ -68,32 +150,16 @@ def extract_section(content, heading):
     Returns the heading + content until the next heading of same or higher level.
     Returns None if heading not found."""
     # Determine heading level from the pattern
-    stripped = heading.lstrip("# ")
+    stripped = heading.lstrip("# ").rstrip()
     level = len(heading) - len(heading.lstrip("#"))
     if level == 0:
         level = 2  # default to ## if no # prefix
 
-    pattern = rf"^{'#' * level}\s+{re.escape(stripped)}\s*$"
-    lines = content.splitlines()
-    start = None
-    for i, line in enumerate(lines):
-        if re.match(pattern, line.strip()):
-            start = i
-            break
-
-    if start is None:
+    parsed = _parsed(content)
+    span = parsed["spans"].get((level, stripped))
+    if span is None:
         return None
-
-    end = len(lines)
-    for i in range(start + 1, len(lines)):
-        line = lines[i].strip()
-        if line.startswith("#"):
-            match = re.match(r"^(#+)", line)
-            if match and len(match.group(1)) <= level:
-                end = i
-                break
-
-    return "\n".join(lines[start:end])
+    return "\n".join(parsed["lines"][span[0]:span[1]])
 
 
 def extract_sections(content, headings):
@@ -111,30 +177,20 @@ def extract_sections(content, headings):
 # ---------------------------------------------------------------------------
 
 def _extract_metadata(target_path):
-    """Read a scaffold doc and extract its metadata fields."""
+    """Look up a scaffold doc's metadata fields in the doc index."""
     abs_path = SCAFFOLD_DIR / target_path if not Path(target_path).is_absolute() else Path(target_path)
     if not abs_path.exists():
         return {}
 
-    content = abs_path.read_text(encoding="utf-8")
-    meta = {"_content": content, "_path": str(abs_path)}
-
-    # Standard fields
-    patterns = {
-        "system": r">\s*\*\*System:\*\*\s*(\S+)",
-        "secondary_systems": r">\s*\*\*Secondary Systems:\*\*\s*(.+)",
-        "implements": r">\s*\*\*Implements:\*\*\s*(\S+)",
-        "depends_on": r">\s*\*\*Depends on:\*\*\s*(.+)",
-        "phase": r">\s*\*\*Phase:\*\*\s*(\S+)",
-        "task_type": r">\s*\*\*Task Type:\*\*\s*(.+)",
-        "layer": r">\s*\*\*Layer:\*\*\s*(.+)",
-        "status": r">\s*\*\*Status:\*\*\s*(\w+)",
-    }
+    entry = doc_index.get_doc(abs_path)
+    if entry is None:
+        # Outside the scaffold tree (or not markdown) — parse it directly
+        entry = doc_index.parse_doc(abs_path.read_text(encoding="utf-8"), abs_path.name)
 
-    for key, pattern in patterns.items():
-        match = re.search(pattern, content)
-        if match:
-            meta[key] = match.group(1).strip()
+    meta = {"_refs": entry["refs"], "_path": str(abs_path)}
+    meta.update(entry["meta"])
+    if entry["status"]:
+        meta["status"] = entry["status"]
 
     return meta
 
@@ -143,8 +199,7 @@ def _resolve_doc_ref(ref_id, doc_type_prefix, glob_dir):
     """Resolve a doc reference like SYS-001 or SPEC-003 to a file path."""
     if not ref_id or ref_id == "—":
         return None
-    matches = sorted(SCAFFOLD_DIR.glob(f"{glob_dir}/{ref_id}-*.md"))
-    return str(matches[0].relative_to(SCAFFOLD_DIR)) if matches else None
+    return doc_index.find_doc(ref_id, glob_dir)
 
 
 # ---------------------------------------------------------------------------
@@ -205,15 +260,13 @@ def _resolve_per_target(entries, meta):
         elif target_type == "parent_slice":
             # Find slice that contains this spec/task
             doc_id = None
-            content = meta.get("_content", "")
             for id_match in re.finditer(r"(SPEC|TASK)-\d+", Path(meta.get("_path", "")).name):
                 doc_id = id_match.group()
                 break
             if doc_id:
-                for slice_file in sorted(SCAFFOLD_DIR.glob("slices/SLICE-*-*.md")):
-                    sc = slice_file.read_text(encoding="utf-8")
-                    if doc_id in sc:
-                        resolved_path = str(slice_file.relative_to(SCAFFOLD_DIR))
+                for rel in doc_index.referencing(doc_id, "slices"):
+                    if Path(rel).name.startswith("SLICE-"):
+                        resolved_path = rel
                         break
 
         elif target_type == "parent_phase":
@@ -222,8 +275,7 @@ def _resolve_per_target(entries, meta):
 
         elif target_type == "interaction_partners":
             # Find systems referenced in dependency/consequence tables
-            content = meta.get("_content", "")
-            partner_ids = set(re.findall(r"SYS-\d+", content))
+            partner_ids = {r for r in meta.get("_refs", []) if r.startswith("SYS-")}
             # Remove self
             self_id = re.search(r"(SYS-\d+)", Path(meta.get("_path", "")).name)
             if self_id:
@@ -282,11 +334,10 @@ def _load_entry(entry):
     if not file_path:
         return None
 
-    abs_path = SCAFFOLD_DIR / file_path
-    if not abs_path.exists():
+    content = read_doc(SCAFFOLD_DIR / file_path)
+    if content is None:
         return None
 
-    content = abs_path.read_text(encoding="utf-8")
     sections = entry.get("sections", [])
 
     if sections:
@@ -303,11 +354,73 @@ def _load_entry(entry):
 # Main Resolver
 # ---------------------------------------------------------------------------
 
-# Class drop order (last dropped first)
+# Class drop order (first listed is dropped first)
 _CLASS_DROP_ORDER = ["evidence", "adjacent", "constraint", "upstream", "canonical"]
 
+# Rough chars-per-token ratio for budget estimates
+_CHARS_PER_TOKEN = 4
+
+# Below this many tokens a truncated entry is not worth keeping — drop it instead
+_MIN_TRUNCATED_TOKENS = 200
+
+_TRUNCATION_MARKER = "\n[... truncated to fit context budget ...]"
+
+
+def estimate_tokens(text):
+    """Estimate the token count of text (~4 characters per token)."""
+    return (len(text) + _CHARS_PER_TOKEN - 1) // _CHARS_PER_TOKEN
+
+
+def _truncate(text, max_tokens):
+    """Cut text to roughly max_tokens, at a line boundary where possible."""
+    limit = max(0, max_tokens * _CHARS_PER_TOKEN - len(_TRUNCATION_MARKER))
+    cut = text[:limit]
+    newline = cut.rfind("\n")
+    if newline > limit // 2:
+        cut = cut[:newline]
+    return cut + _TRUNCATION_MARKER
+
+
+def _pack(results, budget):
+    """Fit loaded entries into budget (estimated tokens), in place.
+    Returns (dropped, truncated) report lists."""
+    dropped, truncated = [], []
+    total = sum(r["tokens"] for r in results)
+    if not budget or total <= budget:
+        return dropped, truncated
+
+    class_rank = {c: i for i, c in enumerate(_CLASS_DROP_ORDER)}
+    # Cut order: class drop order, then lowest priority, then latest loaded
+    victims = sorted(range(len(results)), key=lambda i: (
+        class_rank.get(results[i]["class"], 2),
+        -results[i]["priority"],
+        -i,
+    ))
+    removed = set()
+    for i in victims:
+        excess = total - budget
+        if excess <= 0:
+            break
+        entry = results[i]
+        keep = entry["tokens"] - excess
+        info = {"file": entry["file"], "sections": entry["sections"],
+                "class": entry["class"], "priority": entry["priority"]}
+        if keep >= _MIN_TRUNCATED_TOKENS:
+            entry["text"] = _truncate(entry["text"], keep)
+            new_tokens = estimate_tokens(entry["text"])
+            truncated.append({**info, "tokens_before": entry["tokens"], "tokens": new_tokens})
+            total -= entry["tokens"] - new_tokens
+            entry["tokens"] = new_tokens
+        else:
+            dropped.append({**info, "tokens": entry["tokens"]})
+            total -= entry["tokens"]
+            removed.add(i)
 
-def resolve(config, target_path, section_heading=None, extra_meta=None):
+    results[:] = [r for i, r in enumerate(results) if i not in removed]
+    return dropped, truncated
+
+
+def resolve(config, target_path, section_heading=None, extra_meta=None, budget=None):
     """Resolve context for a review call.
 
     Args:
@@ -315,11 +428,24 @@ def resolve(config, target_path, section_heading=None, extra_meta=None):
         target_path: path to the doc being reviewed (relative to scaffold/)
         section_heading: specific heading being reviewed (e.g., "### Purpose")
         extra_meta: additional metadata to merge (e.g., from implement.py)
+        budget: token budget override (default: config's context.budget; 0 = unlimited)
+
+    Returns:
+        list of {"file": path, "text": content, "class": class, "priority": N, ...}
+    """
+    return resolve_packed(config, target_path, section_heading, extra_meta, budget)["entries"]
+
+
+def resolve_packed(config, target_path, section_heading=None, extra_meta=None, budget=None):
+    """Resolve context and pack it into the token budget.
 
     Returns:
-        list of {"file": path, "text": content, "class": class, "priority": N}
+        {"entries": [...], "budget": N or None, "tokens": N, "tokens_before": N,
+         "dropped": [...], "truncated": [...]}
     """
     ctx_config = config.get("context", {})
+    if budget is None:
+        budget = ctx_config.get("budget")
 
     # Extract target metadata
     meta = _extract_metadata(target_path)
@@ -372,24 +498,36 @@ def resolve(config, target_path, section_heading=None, extra_meta=None):
         if text:
             results.append({
                 "file": entry.get("file", ""),
+                "sections": list(entry.get("sections", [])),
                 "text": text,
                 "class": entry.get("class", ""),
                 "priority": entry.get("priority", 3),
+                "tokens": estimate_tokens(text),
             })
 
-    return results
+    tokens_before = sum(r["tokens"] for r in results)
+    dropped, truncated = _pack(results, budget)
+
+    return {
+        "entries": results,
+        "budget": budget or None,
+        "tokens": sum(r["tokens"] for r in results),
+        "tokens_before": tokens_before,
+        "dropped": dropped,
+        "truncated": truncated,
+    }
 
 
-def resolve_as_text(config, target_path, section_heading=None, extra_meta=None):
+def resolve_as_text(config, target_path, section_heading=None, extra_meta=None, budget=None):
     """Resolve context and return as a single concatenated string."""
-    entries = resolve(config, target_path, section_heading, extra_meta)
+    entries = resolve(config, target_path, section_heading, extra_meta, budget)
     return "\n\n".join(e["text"] for e in entries)
 
 
-def resolve_as_files(config, target_path, section_heading=None, extra_meta=None):
+def resolve_as_files(config, target_path, section_heading=None, extra_meta=None, budget=None):
     """Resolve context and return as a list of file paths (for CLI --context-files).
     Note: this loses section extraction — use resolve_as_text for precise context."""
-    entries = resolve(config, target_path, section_heading, extra_meta)
+    entries = resolve(config, target_path, section_heading, extra_meta, budget)
     seen = set()
     files = []
     for e in entries:
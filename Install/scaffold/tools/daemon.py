@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+"""
+Orchestrator daemon — optional long-lived process that serves tool commands.
+
+Every dispatcher step normally runs `python iterate.py resolve ...` as a fresh
+process and pays for interpreter startup, module imports, config parsing and a
+doc-index refresh each time. While the daemon is running, the orchestrator
+CLIs become thin clients: they forward their argv over a Unix socket and the
+daemon runs the tool's main() in-process. Imported modules, the doc index and
+the context / glossary caches stay warm between calls, and review.py runs its
+sub-orchestrators in-process instead of spawning them.
+
+The daemon is purely an accelerator. If it is not running, the platform has no
+Unix sockets, or SCAFFOLD_NO_DAEMON=1 is set, the CLIs run in-process exactly
+as before. Requests are handled one at a time, so tools see the same sequential
+semantics as separate processes; each request runs with the client's argv,
+working directory and its FORWARDED_ENV variables (API keys, SCAFFOLD_*).
+The doc index is re-validated only when the doc tree's mtimes change. When
+any tool source file changes the daemon declines further requests and exits,
+so clients never run stale code.
+
+Served commands:
+    iterate, local-review, seed, revise, review:  preflight, next-action, resolve
+    validate:                                     preflight, run
+
+implement.py is not served. Its sessions run build/test steps of up to
+300s, and `implement.py schedule` runs several sessions side by side; in a
+one-request-at-a-time daemon each build would stall every other session.
+
+Commands:
+    start    Start the daemon in the background.
+    serve    Run the daemon in the foreground.
+    stop     Ask a running daemon to exit.
+    status   Show pid, uptime, requests served and loaded tools.
+
+The socket lives at scaffold/.reviews/daemon.sock (or a temp-dir path if that
+is too long for AF_UNIX). No pip dependencies — uses Python standard library only.
+"""
+
+# Client-side imports only — tools import this module before their own imports,
+# so server-only modules are imported inside the functions that need them.
+# socket is imported only once a daemon socket file exists.
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+
+# ---------------------------------------------------------------------------
+# Paths
+# ---------------------------------------------------------------------------
+
+TOOLS_DIR = Path(__file__).parent
+SCAFFOLD_DIR = TOOLS_DIR.parent
+REVIEWS_DIR = SCAFFOLD_DIR / ".reviews"
+LOG_FILE = REVIEWS_DIR / "daemon.log"
+
+_LIFECYCLE = {"preflight", "next-action", "resolve"}
+SERVED = {
+    "iterate": _LIFECYCLE,
+    "local-review": _LIFECYCLE,
+    "seed": _LIFECYCLE,
+    "revise": _LIFECYCLE,
+    "review": _LIFECYCLE,
+    "validate": {"preflight", "run"},
+}
+
+# Client environment variables a request runs with: API keys and scaffold
+# switches. Everything else (PATH, HOME, ...) is the daemon's own.
+FORWARDED_ENV_PREFIXES = ("SCAFFOLD_",)
+FORWARDED_ENV_SUFFIXES = ("_API_KEY",)
+
+DEFAULT_IDLE_TIMEOUT = 3600  # seconds
+CONNECT_TIMEOUT = 0.5
+_MAX_SOCKET_PATH = 100  # AF_UNIX paths are limited to ~104-108 bytes
+
+# Daemon-side state (only populated inside the daemon process)
+_daemon = {
+    "active": False,
+    "started": 0.0,
+    "requests": 0,
+    "modules": {},
+    "source_stamp": None,
+    "doc_stamp": None,
+}
+
+
+def socket_path():
+    """Path of the daemon's Unix socket for this scaffold."""
+    path = REVIEWS_DIR / "daemon.sock"
+    if len(str(path)) <= _MAX_SOCKET_PATH:
+        return path
+    import hashlib
+    import tempfile
+
+    digest = hashlib.md5(str(SCAFFOLD_DIR.resolve()).encode()).hexdigest()[:12]
+    return Path(tempfile.gettempdir()) / f"scaffold-daemon-{digest}.sock"
+
+
+def _output(data):
+    print(json.dumps(data, indent=2))
+
+
+def _forwarded(name):
+    return name.startswith(FORWARDED_ENV_PREFIXES) or name.endswith(FORWARDED_ENV_SUFFIXES)
+
+
+def forwarded_env():
+    """The FORWARDED_ENV_* variables of this process."""
+    return {k: v for k, v in os.environ.items() if _forwarded(k)}
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+def _available():
+    if os.environ.get("SCAFFOLD_NO_DAEMON") or not socket_path().exists():
+        return False
+    import socket
+
+    return hasattr(socket, "AF_UNIX")
+
+
+def _connect():
+    """Connect to the daemon socket. Returns a socket or None."""
+    import socket
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(str(socket_path()))
+    except OSError:
+        sock.close()
+        return None
+    sock.settimeout(None)
+    return sock
+
+
+def _send(sock, data):
+    import socket
+
+    sock.sendall(json.dumps(data).encode("utf-8") + b"\n")
+    sock.shutdown(socket.SHUT_WR)
+
+
+def _recv(sock):
+    chunks = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return json.loads(b"".join(chunks).decode("utf-8"))
+
+
+def request(data):
+    """Send one request to the daemon. Returns the response dict, or None if
+    no daemon is listening."""
+    if not _available():
+        return None
+    sock = _connect()
+    if sock is None:
+        return None
+    with sock:
+        _send(sock, data)
+        return _recv(sock)
+
+
+def forward(tool, argv):
+    """Run a tool command through the daemon if one is listening.
+
+    Returns the command's exit code, or None if the caller should run the
+    command in-process (no daemon, unserved command, or daemon declined)."""
+    if _daemon["active"] or tool not in SERVED or not argv or argv[0] not in SERVED[tool]:
+        return None
+    if not _available():
+        return None
+    sock = _connect()
+    if sock is None:
+        return None
+    with sock:
+        try:
+            _send(sock, {"op": "run", "tool": tool, "argv": list(argv),
+                         "cwd": os.getcwd(), "env": forwarded_env()})
+            response = _recv(sock)
+        except (OSError, ValueError) as e:
+            # The request may already have run — never silently run it twice
+            _output({"status": "error", "message": f"Lost connection to scaffold daemon: {e}"})
+            return 1
+    if response.get("status") != "ok":
+        return None
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    sys.stdout.flush()
+    sys.stderr.flush()
+    return response.get("exit_code", 0)
+
+
+def forward_cli(tool):
+    """Thin-client fast path for served tools, called before their other imports.
+    If a daemon served the command, exit with its status; otherwise return
+    so the tool runs in-process."""
+    exit_code = forward(tool, sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+
+def run_inline(tool, argv, cwd=None):
+    """Inside the daemon, run another tool in-process instead of spawning it.
+    Returns (exit_code, stdout, stderr), or None outside the daemon."""
+    if not _daemon["active"] or tool not in SERVED:
+        return None
+    return _run_tool(tool, argv, cwd=cwd)
+
+
+def run_in_process(tool, argv, cwd=None):
+    """Run a served tool's command in this process, daemon or not, capturing
+    its output. For quick commands (preflight) whose cost as a subprocess is
+    mostly interpreter startup. Returns (exit_code, stdout, stderr)."""
+    return _run_tool(tool, argv, cwd=cwd)
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+def _source_stamp():
+    """Newest mtime across the tool sources — a change means restart."""
+    return max((p.stat().st_mtime_ns for p in TOOLS_DIR.glob("*.py")), default=0)
+
+
+def _load_tool(tool):
+    import importlib.util
+
+    module = _daemon["modules"].get(tool)
+    if module is None:
+        name = tool.replace("-", "_")
+        spec = importlib.util.spec_from_file_location(name, TOOLS_DIR / f"{tool}.py")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        _daemon["modules"][tool] = module
+    return module
+
+
+def _run_tool(tool, argv, cwd=None, env=None):
+    """Run a tool's main() with the given argv, capturing its output. env,
+    if given, replaces this process's forwarded variables for the call.
+    Returns (exit_code, stdout, stderr)."""
+    import io
+    import traceback
+    from contextlib import redirect_stderr, redirect_stdout
+
+    module = _load_tool(tool)
+    out, err = io.StringIO(), io.StringIO()
+    saved_argv, saved_cwd = sys.argv, os.getcwd()
+    saved_env = forwarded_env() if env is not None else None
+    exit_code = 0
+    try:
+        sys.argv = [str(TOOLS_DIR / f"{tool}.py")] + list(argv)
+        if cwd:
+            os.chdir(cwd)
+        if env is not None:
+            _swap_env(saved_env, {k: v for k, v in env.items() if _forwarded(k)})
+        with redirect_stdout(out), redirect_stderr(err):
+            try:
+                module.main()
+            except SystemExit as e:
+                if e.code is None or isinstance(e.code, int):
+                    exit_code = e.code or 0
+                else:
+                    print(e.code, file=sys.stderr)
+                    exit_code = 1
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        sys.argv = saved_argv
+        os.chdir(saved_cwd)
+        if saved_env is not None:
+            _swap_env(forwarded_env(), saved_env)
+    return exit_code, out.getvalue(), err.getvalue()
+
+
+def _swap_env(current, new):
+    """Replace the forwarded variables in os.environ: current out, new in."""
+    for name in current:
+        os.environ.pop(name, None)
+    os.environ.update(new)
+
+
+def _sync_doc_index():
+    """Re-validate the doc index if the doc tree changed since the last
+    request started — edits by other processes, or by that request itself."""
+    import doc_index
+
+    stamp = doc_index.tree_stamp()
+    if stamp != _daemon["doc_stamp"]:
+        doc_index.invalidate()
+        _daemon["doc_stamp"] = stamp
+
+
+def _status():
+    return {
+        "status": "ok",
+        "pid": os.getpid(),
+        "uptime": round(time.time() - _daemon["started"], 1),
+        "requests": _daemon["requests"],
+        "tools_loaded": sorted(_daemon["modules"]),
+        "socket": str(socket_path()),
+    }
+
+
+def _handle(req):
+    """Handle one request. Returns (response, keep_running)."""
+    op = req.get("op")
+    if op == "stop":
+        return {"status": "ok", "message": "Daemon stopping"}, False
+    if _source_stamp() != _daemon["source_stamp"]:
+        return {"status": "stale", "message": "Tool sources changed — daemon exiting"}, False
+    if op == "ping":
+        return _status(), True
+    if op == "run":
+        tool = req.get("tool", "")
+        argv = req.get("argv", [])
+        if tool not in SERVED or not argv or argv[0] not in SERVED[tool]:
+            return {"status": "unsupported", "message": f"Not served: {tool} {' '.join(argv[:1])}"}, True
+        import doc_index
+
+        _daemon["requests"] += 1
+        _sync_doc_index()
+        try:
+            exit_code, stdout, stderr = _run_tool(tool, argv, cwd=req.get("cwd"), env=req.get("env") or {})
+        finally:
+            doc_index.flush()  # CLIs outside the daemon read the stored index
+        return {"status": "ok", "exit_code": exit_code, "stdout": stdout, "stderr": stderr}, True
+    return {"status": "error", "message": f"Unknown op: {op}"}, True
+
+
+def serve(idle_timeout=DEFAULT_IDLE_TIMEOUT):
+    """Accept and handle requests until stopped or idle for idle_timeout seconds."""
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        _output({"status": "error", "message": "Unix sockets are not available on this platform"})
+        sys.exit(1)
+    path = socket_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        probe = _connect()
+        if probe is not None:
+            probe.close()
+            _output({"status": "error", "message": f"Daemon already running on {path}"})
+            sys.exit(1)
+        path.unlink()  # stale socket from a crashed daemon
+
+    sys.path.insert(0, str(TOOLS_DIR))
+    # Tools `import daemon` — make that resolve to this (possibly __main__) module
+    sys.modules["daemon"] = sys.modules[__name__]
+    _daemon.update(active=True, started=time.time(), source_stamp=_source_stamp())
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    os.chmod(path, 0o600)
+    server.listen(8)
+    server.settimeout(1.0)
+    last_activity = time.time()
+    running = True
+    try:
+        while running:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                if idle_timeout and time.time() - last_activity > idle_timeout:
+                    break
+                continue
+            with conn:
+                conn.settimeout(None)
+                try:
+                    req = _recv(conn)
+                    response, running = _handle(req)
+                except (OSError, ValueError) as e:
+                    response = {"status": "error", "message": str(e)}
+                try:
+                    conn.sendall(json.dumps(response).encode("utf-8"))
+                except OSError:
+                    pass
+            last_activity = time.time()
+    finally:
+        server.close()
+        if path.exists():
+            path.unlink()
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def cmd_start(args):
+    import subprocess
+
+    status = request({"op": "ping"})
+    if status and status.get("status") == "ok":
+        _output({**status, "message": "Daemon already running"})
+        return
+    if status:
+        # Stale daemon is exiting — wait for it to release the socket
+        deadline = time.time() + 3
+        while socket_path().exists() and time.time() < deadline:
+            time.sleep(0.05)
+    REVIEWS_DIR.mkdir(parents=True, exist_ok=True)
+    cmd = [sys.executable, str(Path(__file__).resolve()), "serve",
+           "--idle-timeout", str(args.idle_timeout)]
+    with open(LOG_FILE, "a", encoding="utf-8") as log:
+        subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=log, stderr=log,
+                         cwd=str(SCAFFOLD_DIR), start_new_session=True)
+    deadline = time.time() + 5
+    while time.time() < deadline:
+        status = request({"op": "ping"})
+        if status:
+            _output({**status, "message": "Daemon started"})
+            return
+        time.sleep(0.05)
+    _output({"status": "error", "message": f"Daemon did not start — see {LOG_FILE}"})
+    sys.exit(1)
+
+
+def cmd_serve(args):
+    serve(args.idle_timeout)
+
+
+def cmd_stop(args):
+    response = request({"op": "stop"})
+    _output(response or {"status": "ok", "message": "Daemon not running"})
+
+
+def cmd_status(args):
+    response = request({"op": "ping"})
+    _output(response or {"status": "stopped", "socket": str(socket_path())})
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Scaffold orchestrator daemon")
+    sub = parser.add_subparsers(dest="command")
+
+    for name, help_text in (("start", "Start the daemon in the background"),
+                            ("serve", "Run the daemon in the foreground")):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("--idle-timeout", type=int, default=DEFAULT_IDLE_TIMEOUT,
+                       help=f"Exit after this many idle seconds (0 = never, default {DEFAULT_IDLE_TIMEOUT})")
+    sub.add_parser("stop", help="Stop a running daemon")
+    sub.add_parser("status", help="Show daemon status")
+
+    args = parser.parse_args()
+    commands = {
+        "start": cmd_start,
+        "serve": cmd_serve,
+        "stop": cmd_stop,
+        "status": cmd_status,
+    }
+    if args.command not in commands:
+        parser.print_help()
+        sys.exit(1)
+    commands[args.command](args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Dependency graph — ordering, cycles and critical path for Depends-on graphs.
+
+Shared by utils.reorder_tasks (tasks), seed._topological_sort (seed
+candidates) and, through reorder_tasks, implement.py's wave scheduler.
+
+- Ordering is Kahn's algorithm on a deque, O(nodes + edges). Ties keep
+  the caller's node order: a node's ready children are queued in that
+  order, so a sorted node list gives the same order reorder_tasks always
+  produced.
+- Nodes left over by Kahn are in or behind a cycle. Tarjan's strongly
+  connected components on that remainder separate the actual cycle
+  members from nodes that only depend on a cycle.
+- Over the acyclic part, each node gets its earliest and latest start
+  (unit duration unless given), and slack = latest - earliest. Nodes
+  with zero slack lie on a critical path: any delay to them delays the
+  whole graph, so they are what gates throughput.
+
+Dependencies on IDs that are not in the node list are ignored.
+
+Usage:
+    import dep_graph
+
+    graph = dep_graph.analyze(["TASK-001", "TASK-002"], {"TASK-002": ["TASK-001"]})
+    graph["order"]           # ["TASK-001", "TASK-002"]
+    graph["cycles"]          # [["TASK-007", "TASK-009"], ...]
+    graph["slack"]           # {"TASK-001": 0, ...}
+    graph["critical_path"]   # longest dependency chain
+"""
+
+from collections import deque
+
+
+# ---------------------------------------------------------------------------
+# Edges
+# ---------------------------------------------------------------------------
+
+def _edges(nodes, deps):
+    """(prerequisites, children) per node, restricted to known nodes,
+    duplicates dropped, children in node order."""
+    known = set(nodes)
+    prereqs = {n: [d for d in dict.fromkeys(deps.get(n, ())) if d in known] for n in nodes}
+    children = {n: [] for n in nodes}
+    for n in nodes:
+        for d in prereqs[n]:
+            children[d].append(n)
+    return prereqs, children
+
+
+# ---------------------------------------------------------------------------
+# Ordering & Cycles
+# ---------------------------------------------------------------------------
+
+def topological_order(nodes, prereqs, children):
+    """Kahn's algorithm. Returns (order, remaining): remaining are the nodes
+    in or behind a cycle, in node order."""
+    in_degree = {n: len(prereqs[n]) for n in nodes}
+    queue = deque(n for n in nodes if in_degree[n] == 0)
+    order = []
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for child in children[node]:
+            in_degree[child] -= 1
+            if in_degree[child] == 0:
+                queue.append(child)
+    done = set(order)
+    return order, [n for n in nodes if n not in done]
+
+
+def find_cycles(remaining, children):
+    """Strongly connected components of the leftover subgraph that form a
+    cycle (size > 1, or a self-dependency). Iterative Tarjan; each cycle's
+    members are listed in node order."""
+    members = set(remaining)
+    position = {n: i for i, n in enumerate(remaining)}
+    index, low, on_stack, stack = {}, {}, set(), []
+    cycles = []
+    counter = 0
+    for root in remaining:
+        if root in index:
+            continue
+        work = [(root, iter(children[root]))]
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, it = work[-1]
+            advanced = False
+            for child in it:
+                if child not in members:
+                    continue
+                if child not in index:
+                    index[child] = low[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(children[child])))
+                    advanced = True
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            if advanced:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                if len(component) > 1 or node in children[node]:
+                    cycles.append(sorted(component, key=position.get))
+    return sorted(cycles, key=lambda c: position[c[0]])
+
+
+# ---------------------------------------------------------------------------
+# Critical Path
+# ---------------------------------------------------------------------------
+
+def critical_path(order, prereqs, children, durations=None):
+    """Earliest/latest start and slack for each ordered node, the total
+    length, and one longest chain. durations defaults to 1 per node."""
+    def duration(n):
+        return (durations or {}).get(n, 1)
+
+    earliest = {}
+    for n in order:
+        earliest[n] = max((earliest[p] + duration(p) for p in prereqs[n] if p in earliest), default=0)
+    length = max((earliest[n] + duration(n) for n in order), default=0)
+
+    latest = {}
+    for n in reversed(order):
+        latest[n] = min((latest[c] for c in children[n] if c in latest), default=length) - duration(n)
+    slack = {n: latest[n] - earliest[n] for n in order}
+
+    path = []
+    node = next((n for n in order if earliest[n] == 0 and slack[n] == 0), None)
+    while node is not None:
+        path.append(node)
+        end = earliest[node] + duration(node)
+        node = next((c for c in children[node]
+                     if c in slack and slack[c] == 0 and earliest[c] == end), None)
+    return {"earliest": earliest, "latest": latest, "slack": slack, "length": length, "path": path}
+
+
+def analyze(nodes, deps, durations=None):
+    """Order, cycles and critical path of a dependency graph.
+
+    nodes: IDs in tie-break order. deps: ID -> prerequisite IDs.
+    Returns order (acyclic part), blocked (in or behind a cycle), cycles
+    (actual cycle members), earliest, latest, slack, length and
+    critical_path."""
+    nodes = list(dict.fromkeys(nodes))
+    prereqs, children = _edges(nodes, deps)
+    order, remaining = topological_order(nodes, prereqs, children)
+    timing = critical_path(order, prereqs, children, durations)
+    return {
+        "order": order,
+        "blocked": remaining,
+        "cycles": find_cycles(remaining, children) if remaining else [],
+        "earliest": timing["earliest"],
+        "latest": timing["latest"],
+        "slack": timing["slack"],
+        "length": timing["length"],
+        "critical_path": timing["path"],
+    }
@@ -0,0 +1,538 @@
+#!/usr/bin/env python3
+"""
+Document index — persistent metadata index for scaffold docs.
+
+Answers the questions every orchestrator keeps asking about the scaffold
+tree (which file is SPEC-003, what is its Status, which slice lists it)
+without re-globbing and re-reading every doc. The index lives at
+scaffold/.reviews/doc-index.json and is keyed by each file's mtime and size:
+on first use in a process the tree is walked once, only changed files are
+re-parsed, and deleted files are dropped.
+
+Each entry (keyed by POSIX path relative to scaffold/) stores:
+  - id:            doc ID taken from the filename (SPEC-003, TASK-012, ...)
+  - status:        value of the > **Status:** field
+  - meta:          system, secondary_systems, implements, depends_on, phase,
+                   task_type, layer
+  - headings:      heading lines in document order
+  - refs:          outgoing doc ID references (own ID excluded)
+  - section_refs:  outgoing references grouped by the heading they sit under
+
+Tools that write docs call update_doc() / rename_doc() so the in-process
+index stays current; the on-disk copy is flushed at exit.
+
+Reverse-reference graph: on the first graph query the entries are inverted
+into parent -> children maps (by Implements / Phase / System, with each
+child's status), an ID -> paths map and a referenced-ID -> referrers map.
+update_doc() / rename_doc() patch these in place, so find_doc(),
+referencing() and child_statuses() cost O(matches) rather than O(docs).
+
+Usage:
+    import doc_index
+
+    doc_index.find_doc("SPEC-003", "specs")       # "specs/SPEC-003-wall_approved.md"
+    doc_index.get_doc("specs/SPEC-003-...md")     # {"id": ..., "status": ..., ...}
+    doc_index.referencing("SPEC-003", "slices")   # slices that mention SPEC-003
+    doc_index.children("SPEC-003", "implements", "tasks")
+    doc_index.child_statuses("SPEC-003", "implements", "tasks")  # {path: status}
+
+Commands:
+    rebuild   Discard the stored index and rebuild it from the tree.
+    stats     Show entry counts per directory.
+    show      Print the index entry for a doc ID or path.
+"""
+
+import argparse
+import atexit
+import fnmatch
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).parent
+SCAFFOLD_DIR = TOOLS_DIR.parent
+
+INDEX_FILE = "doc-index.json"
+INDEX_VERSION = 1
+
+ID_PREFIXES = ("SYS", "SPEC", "TASK", "SLICE", "PHASE", "ADR", "KI", "DD", "PF", "PT", "XC", "CR")
+
+_ID_PATTERN = re.compile(r"\b(?:" + "|".join(ID_PREFIXES) + r")-\d+\b")
+_FILENAME_ID_PATTERN = re.compile(r"^(?:" + "|".join(ID_PREFIXES) + r")-\d+")
+_STATUS_PATTERN = re.compile(r">\s*\*\*Status:\*\*\s*(\w+)")
+
+META_PATTERNS = {
+    "system": re.compile(r">\s*\*\*System:\*\*\s*(\S+)"),
+    "secondary_systems": re.compile(r">\s*\*\*Secondary Systems:\*\*\s*(.+)"),
+    "implements": re.compile(r">\s*\*\*Implements:\*\*\s*(\S+)"),
+    "depends_on": re.compile(r">\s*\*\*Depends on:\*\*\s*(.+)"),
+    "phase": re.compile(r">\s*\*\*Phase:\*\*\s*(\S+)"),
+    "task_type": re.compile(r">\s*\*\*Task Type:\*\*\s*(.+)"),
+    "layer": re.compile(r">\s*\*\*Layer:\*\*\s*(.+)"),
+}
+
+_SKIP_DIRS = {"__pycache__", "node_modules"}
+
+# Metadata fields that point at a parent doc — indexed in the reverse graph
+GRAPH_FIELDS = ("implements", "phase", "system")
+
+# Process-wide state, keyed by resolved scaffold dir:
+#   {"root": Path, "docs": {rel: entry}, "dirty": bool, "refreshed": bool,
+#    "graph": None | {"by_id", "referrers", "children"}}
+_indexes = {}
+
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+
+def parse_doc(content, filename=""):
+    """Parse a doc's text into an index entry (without stat fields)."""
+    id_match = _FILENAME_ID_PATTERN.match(filename)
+    doc_id = id_match.group() if id_match else None
+
+    status_match = _STATUS_PATTERN.search(content)
+    meta = {}
+    for key, pattern in META_PATTERNS.items():
+        match = pattern.search(content)
+        if match:
+            meta[key] = match.group(1).strip()
+
+    headings = []
+    refs = []
+    seen_refs = set()
+    section_refs = {}
+    current = None
+    for line in content.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("#"):
+            headings.append(stripped)
+            current = stripped
+        if "-" not in line:
+            continue
+        for ref in _ID_PATTERN.findall(line):
+            if ref == doc_id:
+                continue
+            if ref not in seen_refs:
+                seen_refs.add(ref)
+                refs.append(ref)
+            if current is not None:
+                bucket = section_refs.setdefault(current, [])
+                if ref not in bucket:
+                    bucket.append(ref)
+
+    return {
+        "id": doc_id,
+        "status": status_match.group(1) if status_match else None,
+        "meta": meta,
+        "headings": headings,
+        "refs": refs,
+        "section_refs": section_refs,
+    }
+
+
+def first_id(value):
+    """Return the first doc ID in a metadata value, or None ('—', 'None', '')."""
+    if not value:
+        return None
+    match = _ID_PATTERN.search(value)
+    return match.group() if match else None
+
+
+# ---------------------------------------------------------------------------
+# Index Lifecycle
+# ---------------------------------------------------------------------------
+
+def _state(scaffold_dir=None):
+    """Return the process-wide index state for a scaffold dir, refreshed once."""
+    root = Path(scaffold_dir) if scaffold_dir else SCAFFOLD_DIR
+    key = str(root.resolve())
+    state = _indexes.get(key)
+    if state is None:
+        state = {"root": root, "docs": _load(root), "dirty": False, "refreshed": False, "graph": None}
+        _indexes[key] = state
+    if not state["refreshed"]:
+        _refresh(state)
+        state["refreshed"] = True
+        if state["dirty"]:
+            _save(state)
+    return state
+
+
+def _index_path(root):
+    return root / ".reviews" / INDEX_FILE
+
+
+def _load(root):
+    """Load the stored index. Returns {} if missing, corrupt, or from another version."""
+    path = _index_path(root)
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return {}
+    docs = data.get("docs", {})
+    return docs if isinstance(docs, dict) else {}
+
+
+def _save(state):
+    """Write the index atomically (temp file + rename)."""
+    path = _index_path(state["root"])
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".tmp{os.getpid()}")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "docs": state["docs"]}, f, separators=(",", ":"))
+        os.replace(tmp, path)
+        state["dirty"] = False
+    except OSError:
+        pass  # index is an optimisation — never fail the caller over it
+
+
+def flush():
+    """Write every loaded index that has pending changes."""
+    for state in _indexes.values():
+        if state["dirty"]:
+            _save(state)
+
+
+atexit.register(flush)
+
+
+def _walk(root):
+    """Yield (rel_path, stat) for every markdown file under root, skipping dot dirs."""
+    root_str = str(root)
+    for dirpath, dirnames, filenames in os.walk(root_str):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".") and d not in _SKIP_DIRS]
+        rel_dir = os.path.relpath(dirpath, root_str)
+        for name in filenames:
+            if not name.endswith(".md"):
+                continue
+            try:
+                st = os.stat(os.path.join(dirpath, name))
+            except OSError:
+                continue
+            rel = name if rel_dir == "." else f"{rel_dir}/{name}".replace(os.sep, "/")
+            yield rel, st
+
+
+def _build_entry(root, rel, st, content=None):
+    if content is None:
+        try:
+            content = (root / rel).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+    entry = parse_doc(content, rel.rsplit("/", 1)[-1])
+    entry["mtime"] = st.st_mtime
+    entry["size"] = st.st_size
+    return entry
+
+
+def _refresh(state):
+    """Re-parse files whose mtime/size changed; drop entries for deleted files."""
+    root = state["root"]
+    docs = state["docs"]
+    seen = set()
+    for rel, st in _walk(root):
+        seen.add(rel)
+        entry = docs.get(rel)
+        if entry and entry.get("mtime") == st.st_mtime and entry.get("size") == st.st_size:
+            continue
+        _put(state, rel, _build_entry(root, rel, st))
+    for rel in [r for r in docs if r not in seen]:
+        _put(state, rel, None)
+
+
+# ---------------------------------------------------------------------------
+# Reverse-Reference Graph
+# ---------------------------------------------------------------------------
+
+def _graph(state):
+    """Return the reverse-reference graph, building it on first use."""
+    if state["graph"] is None:
+        state["graph"] = {"by_id": {}, "referrers": {}, "children": {}}
+        for rel, entry in state["docs"].items():
+            _link(state["graph"], rel, entry)
+    return state["graph"]
+
+
+def _link(graph, rel, entry):
+    """Add one entry's edges to the graph."""
+    if entry.get("id"):
+        graph["by_id"].setdefault(entry["id"], set()).add(rel)
+    for ref in entry.get("refs", ()):
+        graph["referrers"].setdefault(ref, set()).add(rel)
+    meta = entry.get("meta", {})
+    for field in GRAPH_FIELDS:
+        parent = first_id(meta.get(field))
+        if parent:
+            graph["children"].setdefault((field, parent), {})[rel] = entry.get("status")
+
+
+def _unlink(graph, rel, entry):
+    """Remove one entry's edges from the graph."""
+    if entry.get("id"):
+        graph["by_id"].get(entry["id"], set()).discard(rel)
+    for ref in entry.get("refs", ()):
+        graph["referrers"].get(ref, set()).discard(rel)
+    meta = entry.get("meta", {})
+    for field in GRAPH_FIELDS:
+        parent = first_id(meta.get(field))
+        if parent:
+            graph["children"].get((field, parent), {}).pop(rel, None)
+
+
+def _put(state, rel, entry):
+    """Replace (or with entry=None, remove) one doc, keeping the graph in step."""
+    old = state["docs"].pop(rel, None)
+    graph = state["graph"]
+    if graph is not None and old is not None:
+        _unlink(graph, rel, old)
+    if entry is not None:
+        state["docs"][rel] = entry
+        if graph is not None:
+            _link(graph, rel, entry)
+    state["dirty"] = True
+
+
+def _rel(path, root):
+    """Normalise an absolute or scaffold-relative path to the index key."""
+    p = Path(path)
+    if p.is_absolute():
+        try:
+            p = p.relative_to(root)
+        except ValueError:
+            p = p.resolve().relative_to(root.resolve())
+    return p.as_posix()
+
+
+def rebuild(scaffold_dir=None):
+    """Discard the in-memory and stored index and rebuild from the tree."""
+    root = Path(scaffold_dir) if scaffold_dir else SCAFFOLD_DIR
+    _indexes.pop(str(root.resolve()), None)
+    state = {"root": root, "docs": {}, "dirty": True, "refreshed": True, "graph": None}
+    _indexes[str(root.resolve())] = state
+    _refresh(state)
+    _save(state)
+    return state["docs"]
+
+
+# ---------------------------------------------------------------------------
+# Mutation (call after writing docs)
+# ---------------------------------------------------------------------------
+
+def update_doc(path, scaffold_dir=None, content=None):
+    """Re-index one doc after it was written. Pass the text just written as
+    `content` to skip re-reading it. Returns the new entry or None."""
+    state = _state(scaffold_dir)
+    root = state["root"]
+    rel = _rel(path, root)
+    try:
+        st = os.stat(root / rel)
+    except OSError:
+        _put(state, rel, None)
+        return None
+    entry = _build_entry(root, rel, st, content)
+    _put(state, rel, entry)
+    return entry
+
+
+def rename_doc(old_path, new_path, scaffold_dir=None, content=None):
+    """Move an entry after a rename and re-index the new file.
+    Graph edges follow the doc in place — no rescan of referrers.
+    May also be called just before the rename (utils' write batch renames
+    at flush): with content given, the entry is built from it and the old
+    file's stat, and update_doc() after the rename refreshes the stat."""
+    state = _state(scaffold_dir)
+    root = state["root"]
+    old_rel, new_rel = _rel(old_path, root), _rel(new_path, root)
+    _put(state, old_rel, None)
+    if content is None or (root / new_rel).exists():
+        return update_doc(new_path, scaffold_dir, content)
+    try:
+        st = os.stat(root / old_rel)
+    except OSError:
+        return None
+    entry = _build_entry(root, new_rel, st, content)
+    _put(state, new_rel, entry)
+    return entry
+
+
+def remove_doc(path, scaffold_dir=None):
+    state = _state(scaffold_dir)
+    _put(state, _rel(path, state["root"]), None)
+
+
+def save_index(scaffold_dir=None):
+    """Flush the index to disk now rather than at exit."""
+    state = _state(scaffold_dir)
+    if state["dirty"]:
+        _save(state)
+
+
+def invalidate():
+    """Flush pending changes and re-validate every loaded index on next use.
+    Long-lived processes (daemon.py) call this when tree_stamp() shows that
+    the tree changed since the index was last validated."""
+    flush()
+    for state in _indexes.values():
+        state["refreshed"] = False
+
+
+def tree_stamp(scaffold_dir=None):
+    """Fingerprint of the doc tree: every markdown path with its mtime and
+    size. Costs one stat walk and no parsing or entry comparison."""
+    root = Path(scaffold_dir) if scaffold_dir else SCAFFOLD_DIR
+    return hash(tuple((rel, st.st_mtime_ns, st.st_size) for rel, st in _walk(root)))
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+def get_index(scaffold_dir=None):
+    """Return the {rel_path: entry} mapping for a scaffold dir."""
+    return _state(scaffold_dir)["docs"]
+
+
+def get_doc(path, scaffold_dir=None):
+    """Return the entry for a doc path (absolute or scaffold-relative), or None."""
+    state = _state(scaffold_dir)
+    return state["docs"].get(_rel(path, state["root"]))
+
+
+def _in_dir(rel, subdir):
+    """True if rel sits directly in subdir (None matches everything)."""
+    if subdir is None:
+        return True
+    parent = rel.rsplit("/", 1)[0] if "/" in rel else ""
+    return parent == subdir.strip("/")
+
+
+def find_docs(pattern, scaffold_dir=None):
+    """Sorted scaffold-relative paths matching a glob like 'tasks/TASK-*-*.md'.
+    Same semantics as Path.glob for single-level patterns ('*' does not cross '/');
+    recursive or non-markdown patterns fall back to Path.glob."""
+    state = _state(scaffold_dir)
+    if "**" in pattern or not pattern.endswith(".md"):
+        root = state["root"]
+        return sorted(p.relative_to(root).as_posix() for p in root.glob(pattern))
+    depth = pattern.count("/")
+    return sorted(
+        rel for rel in state["docs"]
+        if rel.count("/") == depth and fnmatch.fnmatchcase(rel, pattern)
+    )
+
+
+def find_doc(doc_id, subdir=None, scaffold_dir=None):
+    """Return the first (sorted) scaffold-relative path whose filename ID is doc_id."""
+    if not doc_id:
+        return None
+    rels = _graph(_state(scaffold_dir))["by_id"].get(doc_id, ())
+    matches = sorted(rel for rel in rels if _in_dir(rel, subdir))
+    return matches[0] if matches else None
+
+
+def referencing(ref_id, subdir=None, section=None, scaffold_dir=None):
+    """Sorted paths of docs that mention ref_id, optionally only under a heading
+    containing `section` (e.g. '### Specs Included')."""
+    state = _state(scaffold_dir)
+    results = []
+    for rel in _graph(state)["referrers"].get(ref_id, ()):
+        if not _in_dir(rel, subdir):
+            continue
+        if section is None:
+            results.append(rel)
+        elif any(section in h and ref_id in ids
+                 for h, ids in state["docs"][rel].get("section_refs", {}).items()):
+            results.append(rel)
+    return sorted(results)
+
+
+def children(parent_id, field, subdir=None, scaffold_dir=None):
+    """Sorted paths of docs whose metadata `field` (e.g. 'implements', 'phase')
+    points at parent_id."""
+    return sorted(child_statuses(parent_id, field, subdir, scaffold_dir))
+
+
+def child_statuses(parent_id, field, subdir=None, scaffold_dir=None):
+    """{path: status} for docs whose metadata `field` points at parent_id.
+    Graph fields (implements, phase, system) are a direct lookup."""
+    state = _state(scaffold_dir)
+    if field in GRAPH_FIELDS:
+        kids = _graph(state)["children"].get((field, parent_id), {})
+        return {rel: status for rel, status in kids.items() if _in_dir(rel, subdir)}
+    return {
+        rel: entry.get("status") for rel, entry in state["docs"].items()
+        if _in_dir(rel, subdir) and first_id(entry.get("meta", {}).get(field)) == parent_id
+    }
+
+
+def section_refs(path, section, scaffold_dir=None):
+    """IDs referenced under any heading containing `section` in one doc."""
+    entry = get_doc(path, scaffold_dir)
+    if not entry:
+        return []
+    ids = []
+    for heading, refs in entry.get("section_refs", {}).items():
+        if section in heading:
+            ids.extend(r for r in refs if r not in ids)
+    return ids
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def cmd_rebuild(args):
+    docs = rebuild()
+    print(json.dumps({"rebuilt": True, "docs": len(docs), "index": str(_index_path(SCAFFOLD_DIR))}, indent=2))
+
+
+def cmd_stats(args):
+    docs = get_index()
+    by_dir = {}
+    for rel in docs:
+        d = rel.rsplit("/", 1)[0] if "/" in rel else "."
+        by_dir[d] = by_dir.get(d, 0) + 1
+    print(json.dumps({"docs": len(docs), "by_dir": dict(sorted(by_dir.items()))}, indent=2))
+
+
+def cmd_show(args):
+    target = args.doc
+    rel = target if target.endswith(".md") else find_doc(target)
+    entry = get_doc(rel) if rel else None
+    if not entry:
+        print(json.dumps({"error": f"Not indexed: {target}"}))
+        sys.exit(1)
+    print(json.dumps({"file": rel, **entry}, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scaffold document index")
+    sub = parser.add_subparsers(dest="command")
+
+    sub.add_parser("rebuild", help="Rebuild the index from scratch")
+    sub.add_parser("stats", help="Show index entry counts")
+    p = sub.add_parser("show", help="Show the entry for a doc")
+    p.add_argument("doc", help="Doc ID (SPEC-003) or scaffold-relative path")
+
+    args = parser.parse_args()
+    if args.command == "rebuild":
+        cmd_rebuild(args)
+    elif args.command == "stats":
+        cmd_stats(args)
+    elif args.command == "show":
+        cmd_show(args)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Glossary matcher — one-pass NOT-term detection for scaffold docs.
+
+The glossary's NOT column lists terms that must not appear in docs
+(| Colonist | ... | NOT: settler, villager | ...). Checking them one
+\\b...\\b regex per term per document is O(terms x docs x length); this module
+compiles every NOT-term into a single Aho-Corasick automaton instead, so a
+document is scanned once regardless of glossary size.
+
+Matching keeps the old regex semantics: case-insensitive, \\b word boundaries
+at both ends, and non-overlapping occurrences per term. Each match carries its
+character offsets in the original text.
+
+The automaton is stored at scaffold/.reviews/glossary-matcher.json together
+with the sha256 of design/glossary.md and rebuilt only when the glossary
+changes; within a process it is memoized by the glossary's mtime and size.
+
+Usage:
+    import glossary_match
+
+    glossary_match.load_not_terms()        # {"settler": "Colonist", ...}
+    glossary_match.glossary_hash()         # sha256 of design/glossary.md
+    glossary_match.find_matches(text)      # [{"term", "canonical", "start", "end", "text"}, ...]
+
+Commands:
+    build   Rebuild the stored automaton from design/glossary.md.
+    scan    Print NOT-term matches for one or more files.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from collections import deque
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).parent
+SCAFFOLD_DIR = TOOLS_DIR.parent
+
+MATCHER_FILE = "glossary-matcher.json"
+MATCHER_VERSION = 1
+
+# Process-wide memo: resolved scaffold dir -> {"stamp", "hash", "matcher"}
+_matchers = {}
+
+
+# ---------------------------------------------------------------------------
+# Glossary Parsing
+# ---------------------------------------------------------------------------
+
+def _glossary_path(root):
+    return root / "design" / "glossary.md"
+
+
+def parse_not_terms(content):
+    """Parse NOT-column terms from glossary markdown. Returns {bad_term_lower: canonical}."""
+    not_terms = {}
+    for line in content.splitlines():
+        if "|" in line and line.count("|") >= 3:
+            cells = [c.strip() for c in line.split("|")]
+            # Typical format: | Term | Definition | NOT: bad1, bad2 |
+            for cell in cells:
+                if cell.lower().startswith("not:") or cell.lower().startswith("not "):
+                    canonical = cells[1].strip() if len(cells) > 1 else ""
+                    bad_terms = cell.split(":", 1)[-1].strip() if ":" in cell else ""
+                    for bt in bad_terms.split(","):
+                        bt = bt.strip()
+                        if bt and canonical:
+                            not_terms[bt.lower()] = canonical
+    return not_terms
+
+
+def load_not_terms(scaffold_dir=None):
+    """NOT-column terms from design/glossary.md, in glossary order."""
+    matcher = get_matcher(scaffold_dir)
+    return {term: canonical for term, canonical in matcher["terms"]}
+
+
+def glossary_hash(scaffold_dir=None):
+    """sha256 of design/glossary.md ("" if there is no glossary)."""
+    root = Path(scaffold_dir) if scaffold_dir else SCAFFOLD_DIR
+    _, digest, _ = _glossary_state(root)
+    return digest
+
+
+# ---------------------------------------------------------------------------
+# Automaton
+# ---------------------------------------------------------------------------
+
+def build_matcher(not_terms, digest=""):
+    """Compile {term: canonical} into an Aho-Corasick automaton.
+
+    States are list indexes: goto[s] maps a character to the next state,
+    fail[s] is the longest proper suffix state, out[s] lists the term indexes
+    that end at s (including those inherited through fail links)."""
+    terms = [[term, canonical] for term, canonical in not_terms.items()]
+    goto = [{}]
+    out = [[]]
+    for idx, (term, _) in enumerate(terms):
+        state = 0
+        for ch in term:
+            nxt = goto[state].get(ch)
+            if nxt is None:
+                nxt = len(goto)
+                goto.append({})
+                out.append([])
+                goto[state][ch] = nxt
+            state = nxt
+        out[state].append(idx)
+
+    fail = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for ch, nxt in goto[state].items():
+            queue.append(nxt)
+            f = fail[state]
+            while f and ch not in goto[f]:
+                f = fail[f]
+            fail[nxt] = goto[f].get(ch, 0)
+            if out[fail[nxt]]:
+                out[nxt] = out[nxt] + out[fail[nxt]]
+
+    return {
+        "hash": digest,
+        "terms": terms,
+        "lengths": [len(term) for term, _ in terms],
+        "goto": goto,
+        "fail": fail,
+        "out": out,
+    }
+
+
+def _is_word(ch):
+    return ch.isalnum() or ch == "_"
+
+
+def _at_boundary(text, i):
+    """True if position i is a \\b word boundary in text."""
+    before = i > 0 and _is_word(text[i - 1])
+    after = i < len(text) and _is_word(text[i])
+    return before != after
+
+
+def _fold(text):
+    """Lowercase text without changing its length, so offsets stay valid."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+def scan(matcher, text):
+    """Scan text once. Returns [(term_index, start, end)] sorted by term, then offset."""
+    goto, fail, out, lengths = matcher["goto"], matcher["fail"], matcher["out"], matcher["lengths"]
+    if len(goto) == 1:
+        return []
+    hits = []
+    last_end = {}
+    state = 0
+    for i, ch in enumerate(_fold(text)):
+        while state and ch not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(ch, 0)
+        if not out[state]:
+            continue
+        end = i + 1
+        for idx in out[state]:
+            start = end - lengths[idx]
+            # Non-overlapping per term, like re.finditer
+            if start < last_end.get(idx, 0):
+                continue
+            if _at_boundary(text, start) and _at_boundary(text, end):
+                hits.append((idx, start, end))
+                last_end[idx] = end
+    hits.sort()
+    return hits
+
+
+def find_matches(text, scaffold_dir=None):
+    """NOT-term occurrences in text, ordered by glossary term then offset."""
+    matcher = get_matcher(scaffold_dir)
+    terms = matcher["terms"]
+    return [
+        {"term": terms[idx][0], "canonical": terms[idx][1],
+         "start": start, "end": end, "text": text[start:end]}
+        for idx, start, end in scan(matcher, text)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Caching
+# ---------------------------------------------------------------------------
+
+def _matcher_path(root):
+    return root / ".reviews" / MATCHER_FILE
+
+
+def _glossary_state(root):
+    """Return (stamp, digest, content) for the glossary; content is None when
+    the memoized stamp is still current."""
+    path = _glossary_path(root)
+    try:
+        st = path.stat()
+    except OSError:
+        return None, "", ""
+    stamp = [st.st_mtime_ns, st.st_size]
+    memo = _matchers.get(str(root.resolve()))
+    if memo and memo["stamp"] == stamp:
+        return stamp, memo["hash"], None
+    data = path.read_bytes()
+    return stamp, hashlib.sha256(data).hexdigest(), data.decode("utf-8", errors="replace")
+
+
+def get_matcher(scaffold_dir=None):
+    """Return the automaton for the current glossary, loading or rebuilding
+    the stored copy as needed."""
+    root = Path(scaffold_dir) if scaffold_dir else SCAFFOLD_DIR
+    key = str(root.resolve())
+    stamp, digest, content = _glossary_state(root)
+    memo = _matchers.get(key)
+    if memo and memo["stamp"] == stamp and memo["hash"] == digest:
+        return memo["matcher"]
+
+    matcher = _load(root, digest)
+    if matcher is None:
+        matcher = build_matcher(parse_not_terms(content or ""), digest)
+        _save(root, matcher)
+    _matchers[key] = {"stamp": stamp, "hash": digest, "matcher": matcher}
+    return matcher
+
+
+def _load(root, digest):
+    """Load the stored automaton if it was built from this glossary hash."""
+    path = _matcher_path(root)
+    if not path.exists():
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != MATCHER_VERSION:
+        return None
+    matcher = data.get("matcher")
+    if not isinstance(matcher, dict) or matcher.get("hash") != digest:
+        return None
+    return matcher
+
+
+def _save(root, matcher):
+    """Write the automaton atomically (temp file + rename)."""
+    path = _matcher_path(root)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".tmp{os.getpid()}")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": MATCHER_VERSION, "matcher": matcher}, f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except OSError:
+        pass  # the stored automaton is an optimisation — never fail the caller over it
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _output(data):
+    print(json.dumps(data, indent=2))
+
+
+def cmd_build(args):
+    _matchers.clear()
+    path = _matcher_path(SCAFFOLD_DIR)
+    if path.exists():
+        path.unlink()
+    matcher = get_matcher()
+    _output({
+        "status": "ok",
+        "terms": len(matcher["terms"]),
+        "states": len(matcher["goto"]),
+        "hash": matcher["hash"],
+    })
+
+
+def cmd_scan(args):
+    results = {}
+    for f in args.files:
+        path = Path(f)
+        if not path.is_absolute() and not path.exists():
+            path = SCAFFOLD_DIR / f
+        if not path.is_file():
+            _output({"status": "error", "message": f"File not found: {f}"})
+            sys.exit(1)
+        results[f] = find_matches(path.read_text(encoding="utf-8"))
+    _output({"status": "ok", "matches": results})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Glossary NOT-term matcher")
+    sub = parser.add_subparsers(dest="command")
+
+    sub.add_parser("build", help="Rebuild the stored automaton from design/glossary.md")
+
+    p_scan = sub.add_parser("scan", help="Print NOT-term matches for files")
+    p_scan.add_argument("files", nargs="+", help="Doc paths (relative to scaffold/ or absolute)")
+
+    args = parser.parse_args()
+    if args.command == "build":
+        cmd_build(args)
+    elif args.command == "scan":
+        cmd_scan(args)
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+HTTP pool — persistent keep-alive connections for reviewer API calls.
+
+urllib.request opens a new TCP + TLS connection for every request. A review
+session makes many short respond/consensus exchanges with the same provider
+host, so the handshake is a large share of each call. This module keeps
+idle http.client connections per (scheme, host, port) and reuses them for
+the next request to that host — across review, respond and consensus calls
+and across adversarial-review.py and code-review.py, which both send
+through it. Under daemon.py the pool outlives individual CLI invocations.
+
+Errors mirror urllib.request.urlopen so callers keep their handlers:
+HTTP status >= 400 raises urllib.error.HTTPError (with headers and a
+readable body), connection failures raise urllib.error.URLError. A request
+that fails because a reused connection was closed by the server is retried
+once on a fresh connection. HTTPS_PROXY is honoured via a CONNECT tunnel.
+
+The network modules (http.client, ssl, urllib) are imported on the first
+request, so importing this module costs nothing for commands that never
+call a provider (preflight, check-config).
+
+Usage:
+    import http_pool
+
+    status, headers, body = http_pool.post(url, data, {"Content-Type": "application/json"})
+    status, headers, lines = http_pool.post_stream(url, data, headers)   # SSE
+    http_pool.stats()      # {"requests", "connections_opened", "reused"}
+    http_pool.close_all()
+"""
+
+import threading
+
+
+# Idle connections kept per host; extra ones are closed when returned
+MAX_IDLE_PER_HOST = 4
+
+_lock = threading.Lock()
+_idle = {}  # (scheme, host, port) -> [HTTPConnection, ...]
+_stats = {"requests": 0, "connections_opened": 0, "reused": 0}
+_ssl_context = None
+
+
+# ---------------------------------------------------------------------------
+# Connections
+# ---------------------------------------------------------------------------
+
+def _context():
+    global _ssl_context
+    import ssl
+
+    if _ssl_context is None:
+        _ssl_context = ssl.create_default_context()
+    return _ssl_context
+
+
+def _connect(scheme, host, port, timeout):
+    """Open a new connection (through a CONNECT tunnel if a proxy is set)."""
+    import http.client
+    import urllib.parse
+    import urllib.request
+
+    proxy = urllib.request.getproxies().get("https") if scheme == "https" else None
+    if proxy and urllib.request.proxy_bypass(host):
+        proxy = None
+    if proxy:
+        p = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+        conn_host, conn_port = p.hostname, p.port or 8080
+    else:
+        conn_host, conn_port = host, port
+
+    if scheme == "https":
+        conn = http.client.HTTPSConnection(conn_host, conn_port, timeout=timeout, context=_context())
+    else:
+        conn = http.client.HTTPConnection(conn_host, conn_port, timeout=timeout)
+    if proxy:
+        conn.set_tunnel(host, port)
+    with _lock:
+        _stats["connections_opened"] += 1
+    return conn
+
+
+def _checkout(key, timeout):
+    """Take an idle connection for key, or open a new one. Returns (conn, reused)."""
+    with _lock:
+        pool = _idle.get(key)
+        conn = pool.pop() if pool else None
+    if conn is None:
+        return _connect(*key, timeout), False
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn, True
+
+
+def _checkin(key, conn):
+    with _lock:
+        pool = _idle.setdefault(key, [])
+        if len(pool) < MAX_IDLE_PER_HOST:
+            pool.append(conn)
+            return
+    conn.close()
+
+
+def _discard(key):
+    with _lock:
+        pool = _idle.pop(key, [])
+    for conn in pool:
+        conn.close()
+
+
+def close_all():
+    """Close every idle connection."""
+    with _lock:
+        pools = list(_idle.values())
+        _idle.clear()
+    for pool in pools:
+        for conn in pool:
+            conn.close()
+
+
+def stats():
+    """Request and connection counters for this process."""
+    with _lock:
+        return dict(_stats)
+
+
+# ---------------------------------------------------------------------------
+# Requests
+# ---------------------------------------------------------------------------
+
+def _send(method, url, data, headers, timeout):
+    """Send a request and read the response head. Returns (key, conn, reused, resp)."""
+    import http.client
+    import socket
+    import urllib.error
+    import urllib.parse
+
+    # Server closed a kept-alive connection between our requests
+    stale_errors = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError,
+                    http.client.BadStatusLine)
+
+    parts = urllib.parse.urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https"):
+        raise urllib.error.URLError(f"unsupported URL scheme: {scheme}")
+    port = parts.port or (443 if scheme == "https" else 80)
+    key = (scheme, parts.hostname, port)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    headers = dict(headers or {})
+
+    with _lock:
+        _stats["requests"] += 1
+
+    for attempt in (1, 2):
+        conn, reused = _checkout(key, timeout)
+        try:
+            if conn.sock is None:
+                conn.connect()
+                # http.client writes headers and body separately; without
+                # NODELAY, Nagle + delayed ACK stalls every reused request ~40ms
+                conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn.request(method, path, body=data, headers=headers)
+            resp = conn.getresponse()
+        except stale_errors as e:
+            conn.close()
+            if reused and attempt == 1:
+                # Idle connection was dropped by the server; its siblings
+                # likely were too — retry once on a fresh one
+                _discard(key)
+                continue
+            raise urllib.error.URLError(e)
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise urllib.error.URLError(e)
+        break
+
+    if reused:
+        with _lock:
+            _stats["reused"] += 1
+    return key, conn, reused, resp
+
+
+def _release(key, conn, resp):
+    if resp.will_close:
+        conn.close()
+    else:
+        _checkin(key, conn)
+
+
+def _raise_for_status(url, resp, body):
+    if resp.status >= 400:
+        import io
+        import urllib.error
+
+        raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(body))
+
+
+def request(method, url, data=None, headers=None, timeout=180):
+    """Send one request over a pooled connection.
+
+    Returns (status, headers, body bytes). Raises urllib.error.HTTPError for
+    status >= 400 and urllib.error.URLError for connection failures."""
+    import http.client
+    import urllib.error
+
+    key, conn, _, resp = _send(method, url, data, headers, timeout)
+    try:
+        body = resp.read()
+    except (OSError, http.client.HTTPException) as e:
+        conn.close()
+        raise urllib.error.URLError(e)
+    _release(key, conn, resp)
+    _raise_for_status(url, resp, body)
+    return resp.status, resp.headers, body
+
+
+def post(url, data, headers=None, timeout=180):
+    """POST data (bytes) to url. See request()."""
+    return request("POST", url, data, headers, timeout)
+
+
+def post_stream(url, data, headers=None, timeout=180):
+    """POST data and return (status, headers, lines) without reading the body.
+
+    lines is an iterator over the raw response lines (bytes), for
+    server-sent event streams; timeout applies to each read, so a stream
+    may run longer than it as long as data keeps arriving. The connection
+    returns to the pool once the body is fully read. Errors before the
+    body starts are raised as in request(); errors while iterating
+    propagate from the iterator (OSError / http.client.HTTPException)."""
+    import http.client
+
+    key, conn, _, resp = _send("POST", url, data, headers, timeout)
+    if resp.status >= 400:
+        try:
+            body = resp.read()
+        except (OSError, http.client.HTTPException):
+            body = b""
+        _release(key, conn, resp)
+        _raise_for_status(url, resp, body)
+
+    def lines():
+        try:
+            while True:
+                line = resp.readline()
+                if not line:
+                    break
+                yield line
+        except BaseException:
+            conn.close()  # Mid-stream failure or abandoned iterator
+            raise
+        _release(key, conn, resp)
+
+    return resp.status, resp.headers, lines()
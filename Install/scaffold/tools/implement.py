@@ -14,20 +14,32 @@ Drives the implementation pipeline step-by-step:
 
 Maintains a file manifest in session state — never lost.
 Handles retry loops with limits. Supports task ranges via
-dependency-aware parallelization.
+dependency-aware parallelization: `schedule` splits a range into waves
+(no dependencies or shared files within a wave) and hands out up to
+--jobs concurrent sessions. Each scheduled session uses its own
+action-<session>.json / result-<session>.json; build/test and
+complete_doc run under a lock, one session at a time.
 
 Commands:
     preflight    Check if task is ready for implementation.
     next-action  Write action.json with the next instruction.
     resolve      Read result.json, process it, write next action.json.
+    schedule     Create or advance a parallel schedule for a task range.
 """
 
+import startup_profile
+
+# --profile-startup: re-run under -X importtime and report (startup_profile.py)
+if __name__ == "__main__":
+    startup_profile.from_argv(__file__)
+
 import json
 import os
 import sys
 import argparse
 import hashlib
 import re
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 
@@ -41,122 +53,14 @@ SCAFFOLD_DIR = TOOLS_DIR.parent
 REVIEWS_DIR = SCAFFOLD_DIR / ".reviews" / "implement"
 ACTION_FILE = REVIEWS_DIR / "action.json"
 RESULT_FILE = REVIEWS_DIR / "result.json"
+SHARED_LOCK = REVIEWS_DIR / "shared.lock"
 
 # Add tools dir to sys.path so sibling imports (from utils import ...) work
 if str(TOOLS_DIR) not in sys.path:
     sys.path.insert(0, str(TOOLS_DIR))
 
-
-# ---------------------------------------------------------------------------
-# YAML Parser (shared)
-# ---------------------------------------------------------------------------
-
-def _parse_yaml_value(val):
-    val = val.strip()
-    if val == "" or val == "~" or val == "null":
-        return None
-    if val in ("true", "True"):
-        return True
-    if val in ("false", "False"):
-        return False
-    try:
-        return int(val)
-    except ValueError:
-        pass
-    try:
-        return float(val)
-    except ValueError:
-        pass
-    if (val.startswith('"') and val.endswith('"')) or (val.startswith("'") and val.endswith("'")):
-        return val[1:-1]
-    return val
-
-
-def _count_indent(line):
-    return len(line) - len(line.lstrip())
-
-
-def load_yaml(path):
-    """Load a YAML file. Uses PyYAML if available, falls back to custom parser."""
-    path = Path(path)
-    if not path.exists():
-        return None
-    content = path.read_text(encoding="utf-8")
-    try:
-        import yaml
-        return yaml.safe_load(content)
-    except ImportError:
-        lines = content.splitlines()
-        return _parse_yaml_block(lines, 0, 0)[0]
-
-
-def _parse_yaml_block(lines, start, base_indent):
-    result = {}
-    i = start
-    is_list = False
-    result_list = []
-    while i < len(lines):
-        line = lines[i]
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            i += 1
-            continue
-        indent = _count_indent(line)
-        if indent < base_indent:
-            break
-        if indent == base_indent:
-            if stripped.startswith("- "):
-                is_list = True
-                item_text = stripped[2:].strip()
-                if ":" in item_text and not item_text.startswith('"'):
-                    cp = item_text.index(":")
-                    key = item_text[:cp].strip()
-                    vt = item_text[cp + 1:].strip()
-                    item_dict = {key: _parse_yaml_value(vt)} if vt else {key: None}
-                    ni = i + 1
-                    if ni < len(lines):
-                        ns = lines[ni].strip()
-                        nind = _count_indent(lines[ni]) if ns else 0
-                        if ns and nind > indent:
-                            child, ni = _parse_yaml_block(lines, ni, nind)
-                            if not vt:
-                                item_dict[key] = child
-                            i = ni
-                            result_list.append(item_dict)
-                            continue
-                    i += 1
-                    result_list.append(item_dict)
-                    continue
-                else:
-                    result_list.append(_parse_yaml_value(item_text))
-                    i += 1
-                    continue
-            if ":" in stripped:
-                cp = stripped.index(":")
-                key = stripped[:cp].strip()
-                vt = stripped[cp + 1:].strip()
-                if vt.startswith("[") and vt.endswith("]"):
-                    inner = vt[1:-1]
-                    result[key] = [_parse_yaml_value(x.strip()) for x in inner.split(",")] if inner.strip() else []
-                    i += 1
-                    continue
-                if vt:
-                    result[key] = _parse_yaml_value(vt)
-                    i += 1
-                    continue
-                ni = i + 1
-                while ni < len(lines) and not lines[ni].strip():
-                    ni += 1
-                if ni < len(lines) and _count_indent(lines[ni]) > base_indent:
-                    child, ni = _parse_yaml_block(lines, ni, _count_indent(lines[ni]))
-                    result[key] = child
-                    i = ni
-                    continue
-                result[key] = None
-                i += 1
-                continue
-        i += 1
-    return (result_list, i) if is_list else (result, i)
+import doc_index
+import session_journal
 
 
 # ---------------------------------------------------------------------------
@@ -174,25 +78,84 @@ def _session_path(sid):
 
 
 def _load_session(sid):
-    p = _session_path(sid)
-    return json.load(open(p, encoding="utf-8")) if p.exists() else None
+    return session_journal.load(_session_path(sid))
 
 
 def _save_session(sid, data):
-    p = _session_path(sid)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    json.dump(data, open(p, "w", encoding="utf-8"), indent=2)
+    session_journal.save(_session_path(sid), data)
+
+
+# Action/result files for the current command. Sessions started with
+# --session-files (one per task under `schedule`) use their own pair so
+# concurrent sessions do not overwrite each other's instructions.
+_io = {"action": ACTION_FILE, "result": RESULT_FILE}
+
+
+def _bind_session_files(session):
+    if session.get("session_files"):
+        sid = session["session_id"]
+        _io.update(action=REVIEWS_DIR / f"action-{sid}.json", result=REVIEWS_DIR / f"result-{sid}.json")
+    else:
+        _io.update(action=ACTION_FILE, result=RESULT_FILE)
 
 
 def _write_action(data):
     REVIEWS_DIR.mkdir(parents=True, exist_ok=True)
-    json.dump(data, open(ACTION_FILE, "w", encoding="utf-8"), indent=2)
+    json.dump(data, open(_io["action"], "w", encoding="utf-8"), indent=2)
 
 
 def _read_result():
-    if not RESULT_FILE.exists():
+    if not _io["result"].exists():
         return None
-    return json.load(open(RESULT_FILE, encoding="utf-8"))
+    return json.load(open(_io["result"], encoding="utf-8"))
+
+
+def _lock_file(f):
+    """Block until this process holds an exclusive lock on open file f."""
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        import msvcrt
+
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue  # LK_LOCK gives up after ~10s — keep waiting
+    fcntl.flock(f, fcntl.LOCK_EX)
+
+
+def _unlock_file(f):
+    try:
+        import fcntl
+    except ImportError:
+        import msvcrt
+
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        return
+    fcntl.flock(f, fcntl.LOCK_UN)
+
+
+@contextmanager
+def _held(lock_path):
+    """Hold an exclusive lock on lock_path; other processes wait for it."""
+    REVIEWS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a+b") as f:
+        _lock_file(f)
+        try:
+            yield
+        finally:
+            _unlock_file(f)
+
+
+def _shared_step():
+    """Hold the implement lock for a step that touches state shared between
+    concurrent sessions — the build/test run and complete_doc's ripple into
+    parent specs, slices and indexes. Other sessions wait for it."""
+    return _held(SHARED_LOCK)
 
 
 def _output(data):
@@ -214,38 +177,27 @@ def _load_task_context(task_file):
     content = abs_path.read_text(encoding="utf-8")
 
     # Extract metadata
-    task_type = ""
-    implements = ""
-    depends_on = ""
-    type_match = re.search(r">\s*\*\*Task Type:\*\*\s*(.+)", content)
-    impl_match = re.search(r">\s*\*\*Implements:\*\*\s*(\S+)", content)
-    dep_match = re.search(r">\s*\*\*Depends on:\*\*\s*(.+)", content)
-
-    if type_match:
-        task_type = type_match.group(1).strip()
-    if impl_match:
-        implements = impl_match.group(1).strip()
-    if dep_match:
-        depends_on = dep_match.group(1).strip()
+    meta = (doc_index.get_doc(task_file) or {}).get("meta", {})
+    task_type = meta.get("task_type", "")
+    implements = meta.get("implements", "")
+    depends_on = meta.get("depends_on", "")
 
     # --- Structured context resolution ---
     needed_docs = []
 
     # 1. Parent spec — always (extract ACs + Steps only)
+    spec_file = None
     if implements and implements != "—":
-        spec_matches = list(SCAFFOLD_DIR.glob(f"specs/{implements}-*.md"))
-        if spec_matches:
-            needed_docs.append(str(spec_matches[0].relative_to(SCAFFOLD_DIR)))
+        spec_file = doc_index.find_doc(implements, "specs")
+        if spec_file:
+            needed_docs.append(spec_file)
 
     # 2. Parent system — from spec's System field (extract Purpose + Owned State)
-    if implements:
-        for spec_file in SCAFFOLD_DIR.glob(f"specs/{implements}-*.md"):
-            spec_content = spec_file.read_text(encoding="utf-8")
-            sys_match = re.search(r">\s*\*\*System:\*\*\s*(\S+)", spec_content)
-            if sys_match:
-                sys_id = sys_match.group(1)
-                for sys_file in SCAFFOLD_DIR.glob(f"design/systems/{sys_id}-*.md"):
-                    needed_docs.append(str(sys_file.relative_to(SCAFFOLD_DIR)))
+    if spec_file:
+        sys_id = doc_index.get_doc(spec_file)["meta"].get("system")
+        sys_file = doc_index.find_doc(sys_id, "design/systems")
+        if sys_file:
+            needed_docs.append(sys_file)
 
     # 3. Architecture — only for types that need it
     if task_type.lower() in ("foundation", "behavior", "integration"):
@@ -405,7 +357,8 @@ def _check_asset_delivery(content, task_file, task_type):
         spec = importlib.util.spec_from_file_location("utils", utils_path)
         utils = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(utils)
-        result = utils.complete_doc(task_file, scaffold_dir=str(SCAFFOLD_DIR))
+        with _shared_step():
+            result = utils.complete_doc(task_file, scaffold_dir=str(SCAFFOLD_DIR))
         return {
             "status": "complete",
             "message": (
@@ -433,10 +386,10 @@ def cmd_preflight(args):
 
     abs_path = SCAFFOLD_DIR / task_file
     content = abs_path.read_text(encoding="utf-8")
+    entry = doc_index.get_doc(task_file)
 
     # Check status
-    status_match = re.search(r">\s*\*\*Status:\*\*\s*(\w+)", content)
-    status = status_match.group(1) if status_match else "Unknown"
+    status = entry["status"] or "Unknown"
     if status == "Complete":
         _output({"status": "blocked", "message": f"{args.task} is already Complete."})
         return
@@ -446,27 +399,23 @@ def cmd_preflight(args):
         return
 
     # Check task type — art/audio tasks are human-delivered, not code-implemented
-    type_match = re.search(r">\s*\*\*Task Type:\*\*\s*(.+)", content)
-    if type_match:
-        tt = type_match.group(1).strip().lower()
+    if entry["meta"].get("task_type"):
+        tt = entry["meta"]["task_type"].lower()
         if tt in ("art", "audio"):
             result = _check_asset_delivery(content, task_file, tt)
             _output(result)
             return
 
     # Check dependencies
-    dep_match = re.search(r">\s*\*\*Depends on:\*\*\s*(.+)", content)
-    if dep_match:
-        deps = dep_match.group(1).strip()
-        if deps != "—" and deps != "None":
-            for dep_id in re.findall(r"TASK-\d+", deps):
-                dep_files = list(SCAFFOLD_DIR.glob(f"tasks/{dep_id}-*.md"))
-                if dep_files:
-                    dep_content = dep_files[0].read_text(encoding="utf-8")
-                    dep_status = re.search(r">\s*\*\*Status:\*\*\s*(\w+)", dep_content)
-                    if dep_status and dep_status.group(1) != "Complete":
-                        _output({"status": "blocked", "message": f"Dependency {dep_id} is not Complete (status: {dep_status.group(1)})."})
-                        return
+    deps = entry["meta"].get("depends_on", "")
+    if deps and deps != "—" and deps != "None":
+        for dep_id in re.findall(r"TASK-\d+", deps):
+            dep_file = doc_index.find_doc(dep_id, "tasks")
+            if dep_file:
+                dep_status = doc_index.get_doc(dep_file)["status"]
+                if dep_status and dep_status != "Complete":
+                    _output({"status": "blocked", "message": f"Dependency {dep_id} is not Complete (status: {dep_status})."})
+                    return
 
     _output({"status": "ready", "task": args.task, "file": task_file})
 
@@ -476,6 +425,8 @@ def cmd_preflight(args):
 # ---------------------------------------------------------------------------
 
 def cmd_next_action(args):
+    if args.session_files:
+        _bind_session_files({"session_id": _session_id(args.task), "session_files": True})
     task_file = _resolve_task(args.task)
     if not task_file:
         _write_action({"action": "blocked", "message": f"Task not found: {args.task}"})
@@ -483,6 +434,9 @@ def cmd_next_action(args):
 
     sid = _session_id(args.task)
     session = _load_session(sid)
+    if session and args.session_files and not session.get("session_files"):
+        session["session_files"] = True
+        _save_session(sid, session)
 
     if not session:
         # Load context
@@ -505,6 +459,7 @@ def cmd_next_action(args):
             "file_manifest": [],
             "build_attempts": 0,
             "max_build_attempts": args.max_retries or 3,
+            "session_files": args.session_files,
             "code_review_iterations": args.cri or 10,
             "review_changed_files": False,
             "results": {
@@ -518,6 +473,7 @@ def cmd_next_action(args):
         }
         _save_session(sid, session)
 
+    _bind_session_files(session)
     _advance(session)
 
 
@@ -588,7 +544,8 @@ def _advance(session):
         from utils import build_and_test
         attempts = session.get("build_attempts", 0)
         max_attempts = session.get("max_build_attempts", 3)
-        build_result = build_and_test(session["file_manifest"])
+        with _shared_step():
+            build_result = build_and_test(session["file_manifest"])
 
         session["build_attempts"] = attempts + 1
         if build_result.get("passed"):
@@ -653,7 +610,8 @@ def _advance(session):
         from utils import build_and_test
         attempts = session.get("build_attempts", 0)
         max_attempts = session.get("max_build_attempts", 3)
-        build_result = build_and_test(session["file_manifest"])
+        with _shared_step():
+            build_result = build_and_test(session["file_manifest"])
 
         session["build_attempts"] = attempts + 1
         if build_result.get("passed"):
@@ -733,7 +691,8 @@ def _advance(session):
     elif phase == "complete":
         # Run complete directly via utils — no sub-skill needed
         from utils import complete_doc
-        complete_result = complete_doc(session["task_file"])
+        with _shared_step():
+            complete_result = complete_doc(session["task_file"])
         session["results"]["complete_status"] = complete_result.get("status", "error")
         session["phase"] = "done"
         _save_session(sid, session)
@@ -760,9 +719,10 @@ def cmd_resolve(args):
         _write_action({"action": "blocked", "message": f"Session not found: {args.session}"})
         return
 
+    _bind_session_files(session)
     result = _read_result()
-    if RESULT_FILE.exists():
-        RESULT_FILE.unlink()
+    if _io["result"].exists():
+        _io["result"].unlink()
 
     if not result:
         _advance(session)
@@ -855,16 +815,244 @@ def cmd_resolve(args):
         _advance(session)
 
 
+# ---------------------------------------------------------------------------
+# Parallel Scheduler — dependency waves across a task range
+# ---------------------------------------------------------------------------
+
+DEFAULT_JOBS = 3
+
+
+def _schedule_path(schedule_id):
+    REVIEWS_DIR.mkdir(parents=True, exist_ok=True)
+    return REVIEWS_DIR / f"schedule-{schedule_id}.json"
+
+
+def _range_ids(spec, known_ids):
+    """Task IDs named by a range ("TASK-001-TASK-040") or a list ("TASK-001,TASK-004")."""
+    bounds = re.fullmatch(r"\s*(TASK-\d+)\s*(?:-|\.\.)\s*(TASK-\d+)\s*", spec)
+    if bounds:
+        lo, hi = sorted(int(b.split("-")[1]) for b in bounds.groups())
+        return [tid for tid in known_ids if lo <= int(tid.split("-")[1]) <= hi]
+    wanted = set(re.findall(r"TASK-\d+", spec))
+    return [tid for tid in known_ids if tid in wanted]
+
+
+def _declared_files(task_file):
+    """Paths listed under the task's Files Created / Modified / Affected headings."""
+    try:
+        content = (SCAFFOLD_DIR / task_file).read_text(encoding="utf-8")
+    except OSError:
+        return []
+    files = set()
+    for match in re.finditer(r"^###?\s+Files\s+(?:Created|Modified|Affected)\s*\n(.*?)(?=^#|\Z)",
+                             content, re.MULTILINE | re.DOTALL):
+        body = re.sub(r"<!--.*?-->", "", match.group(1), flags=re.DOTALL)
+        for line in body.splitlines():
+            ticked = re.findall(r"`([^`\s]+)`", line)
+            item = re.match(r"^\s*(?:[-*]|\d+\.)\s+(\S+)", line)
+            for path in ticked or ([item.group(1)] if item else []):
+                files.add(path[2:] if path.startswith("./") else path)
+    return sorted(files)
+
+
+def _assign_waves(order, tasks):
+    """Place each task one wave after its latest in-range dependency, then
+    later still while it shares a file with a task already in that wave.
+    Each wave is an antichain: no dependencies and no file overlaps inside
+    it. order must be topological. Returns the waves as lists of IDs."""
+    waves, wave_files = [], []
+    for tid in order:
+        task = tasks[tid]
+        wave = max((tasks[d]["wave"] + 1 for d in task["depends_on"]
+                    if tasks.get(d, {}).get("wave") is not None), default=0)
+        files = set(task["files"])
+        while wave < len(waves) and files & wave_files[wave]:
+            wave += 1
+        if wave == len(waves):
+            waves.append([])
+            wave_files.append(set())
+        waves[wave].append(tid)
+        wave_files[wave] |= files
+        task["wave"] = wave
+    return waves
+
+
+def _new_schedule(spec, jobs):
+    from utils import reorder_tasks
+
+    ordered = reorder_tasks()
+    in_range = set(_range_ids(spec, [t["id"] for t in ordered]))
+    if not in_range:
+        return None
+    schedule_id = "sched-" + hashlib.md5(",".join(sorted(in_range)).encode()).hexdigest()[:8]
+    tasks, order = {}, []
+    for t in ordered:
+        if t["id"] not in in_range:
+            continue
+        task = {"file": t["file"], "depends_on": [d for d in t["depends_on"] if d in in_range],
+                "files": _declared_files(t["file"]), "wave": None, "state": "pending",
+                "slack": t.get("slack", 0)}
+        if (doc_index.get_doc(t["file"]) or {}).get("status") == "Complete":
+            task["state"] = "done"
+        elif t.get("_cycle"):
+            task.update(state="blocked", reason="dependency cycle")
+        else:
+            for dep in t["depends_on"]:
+                if dep in in_range:
+                    continue
+                dep_file = doc_index.find_doc(dep, "tasks")
+                dep_status = doc_index.get_doc(dep_file)["status"] if dep_file else None
+                if dep_status != "Complete":
+                    task.update(state="blocked", reason=f"{dep} (outside the range) is not Complete")
+                    break
+        tasks[t["id"]] = task
+        if task["state"] == "pending":
+            order.append(t["id"])
+    waves = _assign_waves(order, tasks)
+    return {
+        "schedule_id": schedule_id,
+        "range": spec,
+        "jobs": jobs,
+        "waves": waves,
+        "tasks": tasks,
+        "created": datetime.now().isoformat(),
+    }
+
+
+def _refresh_schedule(schedule):
+    """Update task states from their sessions and doc status; block the
+    dependents of failed tasks."""
+    tasks = schedule["tasks"]
+    for tid, task in tasks.items():
+        if task["state"] not in ("pending", "running"):
+            continue
+        if (doc_index.get_doc(task["file"]) or {}).get("status") == "Complete":
+            task["state"] = "done"
+            continue
+        session = _load_session(_session_id(tid)) if task["state"] == "running" else None
+        if session and session.get("phase") == "done":
+            task["state"] = "done"
+        elif session and session.get("phase") == "stuck":
+            build_status = session.get("results", {}).get("build_status")
+            task.update(state="failed", reason=f"session {session['session_id']} is stuck"
+                                               + (f" ({build_status})" if build_status else ""))
+    changed = True
+    while changed:
+        changed = False
+        for tid, task in tasks.items():
+            if task["state"] != "pending":
+                continue
+            bad = next((d for d in task["depends_on"] if tasks[d]["state"] in ("failed", "blocked")), None)
+            if bad:
+                task.update(state="blocked", reason=f"depends on {bad} ({tasks[bad]['state']})")
+                changed = True
+
+
+def _launch(schedule):
+    """Start pending tasks in wave order while slots are free: all in-range
+    dependencies done, and no file shared with a running session. Within a
+    wave, critical-path tasks (least slack, see dep_graph.py) go first."""
+    tasks = schedule["tasks"]
+    running = [tid for tid, t in tasks.items() if t["state"] == "running"]
+    busy = set()
+    for tid in running:
+        session = _load_session(_session_id(tid)) or {}
+        busy |= set(tasks[tid]["files"]) | set(session.get("file_manifest", []))
+    started = []
+    for wave in schedule["waves"]:
+        for tid in sorted(wave, key=lambda t: tasks[t].get("slack", 0)):
+            if len(running) + len(started) >= schedule["jobs"]:
+                return started
+            task = tasks[tid]
+            if task["state"] != "pending" or set(task["files"]) & busy:
+                continue
+            if any(tasks[d]["state"] != "done" for d in task["depends_on"]):
+                continue
+            task["state"] = "running"
+            busy |= set(task["files"])
+            sid = _session_id(tid)
+            started.append({
+                "task": tid,
+                "file": task["file"],
+                "wave": task["wave"] + 1,
+                "session_id": sid,
+                "command": f"python scaffold/tools/implement.py next-action --task {tid} --session-files",
+                "action_file": (REVIEWS_DIR / f"action-{sid}.json").relative_to(SCAFFOLD_DIR.parent).as_posix(),
+                "result_file": (REVIEWS_DIR / f"result-{sid}.json").relative_to(SCAFFOLD_DIR.parent).as_posix(),
+            })
+    return started
+
+
+def _save_schedule(path, schedule):
+    """Write the schedule atomically (temp file + rename)."""
+    tmp = path.with_suffix(f".tmp{os.getpid()}")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(schedule, f, indent=2)
+    os.replace(tmp, path)
+
+
+def cmd_schedule(args):
+    """Create or advance a parallel schedule. Call again whenever a session
+    finishes; each call returns the sessions to start next. Calls for the
+    same schedule run one at a time under its lock file."""
+    if args.schedule:
+        schedule_id, fresh = args.schedule, None
+    else:
+        fresh = _new_schedule(args.range, args.jobs or DEFAULT_JOBS)
+        if fresh is None:
+            _output({"status": "error", "message": f"No tasks match {args.range}"})
+            return
+        schedule_id = fresh["schedule_id"]
+    path = _schedule_path(schedule_id)
+
+    with _held(path.with_suffix(".lock")):
+        if fresh is None:
+            if not path.exists():
+                _output({"status": "error", "message": f"Schedule not found: {args.schedule}"})
+                return
+            schedule = json.load(open(path, encoding="utf-8"))
+        else:
+            schedule = fresh
+            if path.exists():
+                # Same range again — resume, keeping task states
+                previous = json.load(open(path, encoding="utf-8"))
+                for tid, task in previous["tasks"].items():
+                    if tid in schedule["tasks"] and task["state"] != "pending":
+                        schedule["tasks"][tid].update(state=task["state"], reason=task.get("reason"))
+        if args.jobs:
+            schedule["jobs"] = args.jobs
+
+        _refresh_schedule(schedule)
+        started = _launch(schedule)
+        _save_schedule(path, schedule)
+
+    by_state = {}
+    for tid, task in schedule["tasks"].items():
+        by_state.setdefault(task["state"], []).append(tid)
+    finished = not by_state.get("pending") and not by_state.get("running")
+    _output({
+        "status": "done" if finished else "running",
+        "schedule_id": schedule["schedule_id"],
+        "jobs": schedule["jobs"],
+        "waves": schedule["waves"],
+        "start": started,
+        "running": [tid for tid in by_state.get("running", []) if tid not in {s["task"] for s in started}],
+        "done": by_state.get("done", []),
+        "failed": {tid: schedule["tasks"][tid].get("reason") for tid in by_state.get("failed", [])},
+        "blocked": {tid: schedule["tasks"][tid].get("reason") for tid in by_state.get("blocked", [])},
+        "message": ("All tasks finished." if finished else
+                    f"Run each started session to done or stuck, then call: "
+                    f"python scaffold/tools/implement.py schedule --schedule {schedule['schedule_id']}"),
+    })
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 def _resolve_task(task_id):
     """Resolve TASK-### to a file path."""
-    matches = list(SCAFFOLD_DIR.glob(f"tasks/{task_id}-*.md"))
-    if matches:
-        return str(matches[0].relative_to(SCAFFOLD_DIR))
-    return None
+    return doc_index.find_doc(task_id, "tasks")
 
 
 # ---------------------------------------------------------------------------
@@ -882,16 +1070,26 @@ def main():
     p_next.add_argument("--task", required=True)
     p_next.add_argument("--max-retries", type=int, default=3)
     p_next.add_argument("--cri", type=int, default=10, help="Code review iterations")
+    p_next.add_argument("--session-files", action="store_true",
+                        help="Use action-<session>.json / result-<session>.json (concurrent sessions)")
 
     p_res = subparsers.add_parser("resolve")
     p_res.add_argument("--session", required=True)
 
+    p_sched = subparsers.add_parser("schedule", help="Run a task range as parallel dependency waves")
+    target = p_sched.add_mutually_exclusive_group(required=True)
+    target.add_argument("--range", help="TASK-###-TASK-### or a comma-separated list")
+    target.add_argument("--schedule", help="Advance an existing schedule")
+    p_sched.add_argument("--jobs", type=int, default=0, help=f"Concurrent sessions (default {DEFAULT_JOBS})")
+
     args = parser.parse_args()
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
-    {"preflight": cmd_preflight, "next-action": cmd_next_action, "resolve": cmd_resolve}[args.command](args)
+    _io.update(action=ACTION_FILE, result=RESULT_FILE)
+    {"preflight": cmd_preflight, "next-action": cmd_next_action, "resolve": cmd_resolve,
+     "schedule": cmd_schedule}[args.command](args)
 
 
 if __name__ == "__main__":
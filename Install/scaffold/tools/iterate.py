@@ -11,8 +11,12 @@ Commands:
     preflight    Check if a layer/target is ready for review.
     next-action  Write action.json with the next instruction. Starts or resumes a session.
     resolve      Read result.json, process it, write next action.json.
+    batch-submit  Queue the L3/L2 section reviews of a range of targets as one
+                  provider batch (cheaper; results arrive asynchronously).
+    batch-collect Attach a finished batch's reviews to the targets' sessions.
 
-Session state persists in .reviews/iterate/session-<id>.json.
+Session state persists in .reviews/iterate/session-<id>.json (snapshot) plus
+session-<id>.journal.jsonl (changes since the snapshot; see session_journal.py).
 Temp files (action.json, result.json) are overwritten each exchange.
 No pip dependencies — uses Python standard library only.
 
@@ -33,17 +37,27 @@ Issue categorization:
   - Ambiguous (no suggestion, unclear fix): escalate to user.
 """
 
+import daemon
+import startup_profile
+
+if __name__ == "__main__":
+    # --profile-startup: re-run under -X importtime and report (startup_profile.py)
+    startup_profile.from_argv(__file__)
+    daemon.forward_cli("iterate")
+
 import json
 import os
 import sys
 import argparse
 import hashlib
+import importlib.util
 import re
-import subprocess
-import time
 from pathlib import Path
 from datetime import datetime
 
+import config_loader
+import session_journal
+
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -59,157 +73,13 @@ ACTION_FILE = REVIEWS_DIR / "action.json"
 RESULT_FILE = REVIEWS_DIR / "result.json"
 
 
-# ---------------------------------------------------------------------------
-# YAML Parser (minimal, no dependencies)
-# ---------------------------------------------------------------------------
-
-def _parse_yaml_value(val):
-    """Parse a YAML scalar value into a Python type."""
-    val = val.strip()
-    if val == "" or val == "~" or val == "null":
-        return None
-    if val == "true" or val == "True":
-        return True
-    if val == "false" or val == "False":
-        return False
-    try:
-        return int(val)
-    except ValueError:
-        pass
-    try:
-        return float(val)
-    except ValueError:
-        pass
-    if (val.startswith('"') and val.endswith('"')) or \
-       (val.startswith("'") and val.endswith("'")):
-        return val[1:-1]
-    return val
-
-
-def _count_indent(line):
-    return len(line) - len(line.lstrip())
-
-
-def load_yaml(path):
-    """Load a YAML file. Uses PyYAML if available, falls back to custom parser."""
-    path = Path(path)
-    if not path.exists():
-        return None
-    content = path.read_text(encoding="utf-8")
-    try:
-        import yaml
-        return yaml.safe_load(content)
-    except ImportError:
-        lines = content.splitlines()
-        return _parse_yaml_block(lines, 0, 0)[0]
-
-
-def _parse_yaml_block(lines, start, base_indent):
-    result = {}
-    i = start
-    is_list = False
-    result_list = []
-
-    while i < len(lines):
-        line = lines[i]
-        stripped = line.strip()
-
-        if not stripped or stripped.startswith("#"):
-            i += 1
-            continue
-
-        indent = _count_indent(line)
-
-        if indent < base_indent:
-            break
-
-        if indent == base_indent:
-            if stripped.startswith("- "):
-                is_list = True
-                item_text = stripped[2:].strip()
-
-                if ":" in item_text and not item_text.startswith('"'):
-                    colon_pos = item_text.index(":")
-                    key = item_text[:colon_pos].strip()
-                    val_text = item_text[colon_pos + 1:].strip()
-
-                    if val_text:
-                        item_dict = {key: _parse_yaml_value(val_text)}
-                    else:
-                        item_dict = {key: None}
-
-                    next_i = i + 1
-                    if next_i < len(lines):
-                        next_stripped = lines[next_i].strip()
-                        next_indent = _count_indent(lines[next_i]) if next_stripped else 0
-                        if next_stripped and next_indent > indent:
-                            child, next_i = _parse_yaml_block(lines, next_i, next_indent)
-                            if not val_text:
-                                item_dict[key] = child
-                            i = next_i
-                            result_list.append(item_dict)
-                            continue
-
-                    i += 1
-                    result_list.append(item_dict)
-                    continue
-                else:
-                    result_list.append(_parse_yaml_value(item_text))
-                    i += 1
-                    continue
-
-            if ":" in stripped:
-                colon_pos = stripped.index(":")
-                key = stripped[:colon_pos].strip()
-                val_text = stripped[colon_pos + 1:].strip()
-
-                if val_text.startswith("[") and val_text.endswith("]"):
-                    inner = val_text[1:-1]
-                    if inner.strip():
-                        items = [_parse_yaml_value(x.strip()) for x in inner.split(",")]
-                    else:
-                        items = []
-                    result[key] = items
-                    i += 1
-                    continue
-
-                if val_text:
-                    result[key] = _parse_yaml_value(val_text)
-                    i += 1
-                    continue
-
-                next_i = i + 1
-                while next_i < len(lines) and not lines[next_i].strip():
-                    next_i += 1
-
-                if next_i < len(lines):
-                    next_indent = _count_indent(lines[next_i])
-                    if next_indent > base_indent:
-                        child, next_i = _parse_yaml_block(lines, next_i, next_indent)
-                        result[key] = child
-                        i = next_i
-                        continue
-
-                result[key] = None
-                i += 1
-                continue
-
-        i += 1
-
-    if is_list:
-        return result_list, i
-    return result, i
-
-
 # ---------------------------------------------------------------------------
 # Config & Session
 # ---------------------------------------------------------------------------
 
 def load_layer_config(layer):
     config_path = CONFIGS_DIR / f"{layer}.yaml"
-    if not config_path.exists():
-        return None
-    return load_yaml(config_path)
+    return config_loader.load_config(config_path, "iterate")
 
 
 def _session_id(layer, target):
@@ -225,18 +95,11 @@ def _session_path(session_id):
 
 
 def _load_session(session_id):
-    path = _session_path(session_id)
-    if not path.exists():
-        return None
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    return session_journal.load(_session_path(session_id))
 
 
 def _save_session(session_id, data):
-    path = _session_path(session_id)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    session_journal.save(_session_path(session_id), data)
 
 
 def _write_action(data):
@@ -256,23 +119,38 @@ def _read_result():
 # Context File Resolution
 # ---------------------------------------------------------------------------
 
-def resolve_context_files(config, target_path, section_heading=None):
-    """Resolve context using the hierarchical context system.
-    Falls back to legacy context_files format if no 'context' key in config."""
+def resolve_review_context(config, target_path, section_heading=None, report=None):
+    """Resolve reviewer context. Returns (context_text, context_files):
+    text from the hierarchical context system, or whole files from the
+    legacy context_files format if the config has no 'context' key.
+    If report is a dict, it is filled with the budget packing summary
+    (tokens, dropped and truncated entries)."""
     # New format: use context.py resolver
     if "context" in config:
         try:
-            from context import resolve as ctx_resolve, resolve_as_text
-            ctx_text = resolve_as_text(config, target_path, section_heading)
-            if ctx_text:
-                # Write extracted context to a single temp file
-                # (adversarial-review.py reads --context-files as whole files)
-                ctx_file = REVIEWS_DIR / f"ctx-{hashlib.md5((target_path + str(section_heading)).encode()).hexdigest()[:8]}.md"
-                ctx_file.write_text(ctx_text, encoding="utf-8")
-                return [str(ctx_file)]
-            return []
+            from context import resolve_packed
+            packed = resolve_packed(config, target_path, section_heading)
+            if report is not None:
+                report.update({k: v for k, v in packed.items() if k != "entries"})
+            return "\n\n".join(e["text"] for e in packed["entries"]), []
         except ImportError:
             pass  # Fall through to legacy
+    return "", _legacy_context_files(config, target_path)
+
+
+def resolve_context_files(config, target_path, section_heading=None, report=None):
+    """Resolve context as a list of files (for tools that take whole files).
+    Hierarchical context is written to a single temp file."""
+    ctx_text, files = resolve_review_context(config, target_path, section_heading, report)
+    if not ctx_text:
+        return files
+    ctx_file = REVIEWS_DIR / f"ctx-{hashlib.md5((target_path + str(section_heading)).encode()).hexdigest()[:8]}.md"
+    ctx_file.write_text(ctx_text, encoding="utf-8")
+    return [str(ctx_file)]
+
+
+def _legacy_context_files(config, target_path):
+    """Flat context_files list (static paths + dynamic globs) plus the target."""
 
     # Legacy format: flat context_files
     files = []
@@ -464,19 +342,15 @@ def cmd_preflight(args):
 
     # Check if external reviewer is available
     try:
-        check_result = subprocess.run(
-            [sys.executable, str(DOC_REVIEW_SCRIPT), "check-config"],
-            capture_output=True, text=True, timeout=10, cwd=str(SCAFFOLD_DIR)
-        )
-        if check_result.stdout.strip():
-            check_data = json.loads(check_result.stdout.strip())
+        check_data = _reviewer("doc").check_config()
+        if check_data:
             if not check_data.get("api_key_found", True):
                 result["warning"] = (
                     "No external reviewer API key found. "
                     "Will fall back to self-review (Claude reviews directly — weaker but functional). "
                     f"Set {check_data.get('api_key_env', 'API key')} in environment or scaffold/.env for external review."
                 )
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
+    except (ImportError, OSError, ValueError):
         pass  # Can't check — will discover at review time
 
     _output(result)
@@ -494,6 +368,15 @@ def cmd_next_action(args):
         return
 
     target = args.target or config.get("target", "")
+    session = _open_session(args, config, target)
+
+    # Determine next action based on session state
+    _advance_and_write_action(session, config)
+
+
+def _open_session(args, config, target):
+    """Resume the target's session, or start a new one if there is none or
+    the previous run completed."""
     session_id = _session_id(args.layer, target)
     session = _load_session(session_id)
 
@@ -509,9 +392,7 @@ def cmd_next_action(args):
         # Create new session
         session = _create_session(args, config, session_id, target)
         _save_session(session_id, session)
-
-    # Determine next action based on session state
-    _advance_and_write_action(session, config)
+    return session
 
 
 def _create_session(args, config, session_id, target):
@@ -587,6 +468,8 @@ def _create_session(args, config, session_id, target):
         "focus": args.focus or "",
         "fast": args.fast or False,
         "reviewer": getattr(args, 'reviewer', 'doc'),
+        "no_cache": getattr(args, "no_cache", False),
+        "prefetch": args.prefetch if args.prefetch is not None else config.get("defaults", {}).get("prefetch_workers", 0),
         "queue": queue,
         "queue_index": 0,
         "adjudications": [],
@@ -757,43 +640,7 @@ def _advance_and_write_action(session, config):
 
     # Review action — need to call adversarial-review.py and get issues
     doc_content = target_abs.read_text(encoding="utf-8") if target_abs.exists() else ""
-
-    if item["pass"] == "l3":
-        section_heading = item["section"]
-        if item.get("fast"):
-            # Fast mode — extract full parent section
-            section_content = _extract_section(doc_content, section_heading)
-            questions = []
-            for sub in item.get("subsections", []):
-                sub_def = config.get("l3_sections", {}).get(sub, {})
-                if isinstance(sub_def, dict):
-                    questions.extend(sub_def.get("questions", []))
-        else:
-            section_content = _extract_section(doc_content, section_heading)
-            section_def = config.get("l3_sections", {}).get(section_heading, {})
-            questions = section_def.get("questions", []) if isinstance(section_def, dict) else []
-
-    elif item["pass"] == "l2":
-        section_heading = item["section"]
-        section_content = _extract_section(doc_content, section_heading)
-        section_def = config.get("l2_sections", {}).get(section_heading, {})
-        questions = section_def.get("questions", []) if isinstance(section_def, dict) else []
-
-    elif item["pass"] == "l1":
-        section_content = doc_content
-        questions = config.get("l1_questions", [])
-        # Append identity check and bias pack
-        identity = config.get("identity_check", {})
-        if isinstance(identity, dict) and identity.get("questions"):
-            questions = questions + [f"[Identity Check] {q}" for q in identity["questions"]]
-        bias = config.get("bias_pack", [])
-        if bias:
-            questions.append("[Bias Pack] Check for these patterns: " +
-                           "; ".join(b.get("name", "") + " — " + b.get("description", "")
-                                     for b in bias if isinstance(b, dict)))
-    else:
-        section_content = ""
-        questions = []
+    section_content, questions = _review_inputs(config, item, doc_content)
 
     if not section_content:
         # Section not found — skip
@@ -802,17 +649,25 @@ def _advance_and_write_action(session, config):
         _advance_and_write_action(session, config)
         return
 
-    # Sleep between reviewer calls to avoid rate limits
-    sleep_seconds = config.get("defaults", {}).get("sleep_between_topics", 10)
-    if session.get("_reviewer_calls", 0) > 0 and sleep_seconds > 0:
-        time.sleep(sleep_seconds)
-    session["_reviewer_calls"] = session.get("_reviewer_calls", 0) + 1
-    _save_session(session["session_id"], session)
-
-    # Call adversarial-review.py for the review
-    section_heading = item.get("section", "")
-    context_files = resolve_context_files(config, target, section_heading)
-    issues = _call_reviewer(session, config, section_content, questions, context_files)
+    # A batch-submitted review may have finished since batch-submit
+    if "batched" in item and "prefetched" not in item:
+        collected = _collect_batch(item["batched"], live=session)
+        if "prefetched" not in item:
+            print(f"[BATCH] {collected.get('status')}: reviewing {item.get('section', '')} directly",
+                  file=sys.stderr)
+            item.pop("batched", None)
+
+    # Reviews for the rest of this pass are sent concurrently on first reach
+    if session.get("prefetch", 0) > 0 and item["pass"] in ("l3", "l2") and "prefetched" not in item:
+        _prefetch_pass(session, config, idx, doc_content)
+
+    prefetched = _take_prefetched(session, item, section_content)
+    if prefetched is not None:
+        issues = prefetched["issues"]
+    else:
+        # Call adversarial-review.py for the review (paced by rate_limit.py)
+        context_text, context_files = _review_context(session, config, item)
+        issues = _call_reviewer(session, config, section_content, questions, context_files, context_text)
 
     if issues is None:
         # Reviewer failed (API key missing, timeout, etc.) — fall back to self-review
@@ -902,6 +757,295 @@ def _advance_and_write_action(session, config):
     _write_adjudicate_action(session, config, needs_adjudication[0], section_content, item)
 
 
+def _review_inputs(config, item, doc_content):
+    """Return (section_content, questions) for a review queue item."""
+    if item["pass"] == "l3":
+        section_heading = item["section"]
+        if item.get("fast"):
+            # Fast mode — extract full parent section
+            section_content = _extract_section(doc_content, section_heading)
+            questions = []
+            for sub in item.get("subsections", []):
+                sub_def = config.get("l3_sections", {}).get(sub, {})
+                if isinstance(sub_def, dict):
+                    questions.extend(sub_def.get("questions", []))
+        else:
+            section_content = _extract_section(doc_content, section_heading)
+            section_def = config.get("l3_sections", {}).get(section_heading, {})
+            questions = section_def.get("questions", []) if isinstance(section_def, dict) else []
+
+    elif item["pass"] == "l2":
+        section_heading = item["section"]
+        section_content = _extract_section(doc_content, section_heading)
+        section_def = config.get("l2_sections", {}).get(section_heading, {})
+        questions = section_def.get("questions", []) if isinstance(section_def, dict) else []
+
+    elif item["pass"] == "l1":
+        section_content = doc_content
+        questions = config.get("l1_questions", [])
+        # Append identity check and bias pack
+        identity = config.get("identity_check", {})
+        if isinstance(identity, dict) and identity.get("questions"):
+            questions = questions + [f"[Identity Check] {q}" for q in identity["questions"]]
+        bias = config.get("bias_pack", [])
+        if bias:
+            questions.append("[Bias Pack] Check for these patterns: " +
+                           "; ".join(b.get("name", "") + " — " + b.get("description", "")
+                                     for b in bias if isinstance(b, dict)))
+    else:
+        section_content = ""
+        questions = []
+
+    return section_content, questions
+
+
+def _review_context(session, config, item):
+    """Resolve reviewer context for a queue item. Budget cuts are recorded on
+    the item so the session log shows them."""
+    ctx_report = {}
+    context_text, context_files = resolve_review_context(
+        config, session["target"], item.get("section", ""), report=ctx_report)
+    if ctx_report.get("dropped") or ctx_report.get("truncated"):
+        item["context_budget"] = ctx_report
+        _save_session(session["session_id"], session)
+    return context_text, context_files
+
+
+# ---------------------------------------------------------------------------
+# Prefetch — concurrent section reviews
+# ---------------------------------------------------------------------------
+
+def _content_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _prefetch_pass(session, config, idx, doc_content):
+    """Send the reviews for every pending item of the current pass (up to the
+    next apply step) concurrently, at most session["prefetch"] at a time.
+
+    Sections within a pass are independent and the document is only edited
+    at the pass's apply step, so the results stay valid until then. Each
+    result is stored on its queue item ("prefetched") with a hash of the
+    section it reviewed; the reviewer conversation goes to a side file and
+    becomes the live conversation when the item is served."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    queue = session["queue"]
+    pass_name = queue[idx]["pass"]
+    jobs = []
+    for i in range(idx, len(queue)):
+        item = queue[i]
+        if item["pass"] != pass_name:
+            break
+        if "prefetched" in item or "batched" in item:
+            continue
+        section_content, questions = _review_inputs(config, item, doc_content)
+        if not section_content:
+            continue  # Skipped when reached
+        context_text, context_files = _review_context(session, config, item)
+        jobs.append((i, item, section_content, questions, context_files, context_text))
+
+    if not jobs:
+        return
+
+    _reviewer(session.get("reviewer", "doc"))  # import here, not concurrently in the workers
+    with ThreadPoolExecutor(max_workers=max(1, session["prefetch"])) as pool:
+        futures = [
+            pool.submit(_reviewer_result, session, job[2], job[3], job[4], job[5], False)
+            for job in jobs
+        ]
+        results = [f.result() for f in futures]
+
+    for (i, item, section_content, _, _, _), result in zip(jobs, results):
+        _store_prefetched(session, i, item, _content_hash(section_content), result)
+
+    _save_session(session["session_id"], session)
+
+
+def _store_prefetched(session, i, item, content_hash, result):
+    """Attach a review result (from review(..., persist=False)) to queue item i."""
+    record = {
+        "iteration": session.get("iteration", 1),
+        "content_hash": content_hash,
+        "issues": None if "error" in result else result.get("issues", []),
+    }
+    conversation = result.pop("_conversation", None)
+    if conversation:
+        conv_file = REVIEWS_DIR / f"prefetch-{session['session_id']}-{i}.json"
+        conv_file.write_text(json.dumps(conversation), encoding="utf-8")
+        record["conversation_file"] = str(conv_file)
+    item["prefetched"] = record
+
+
+def _take_prefetched(session, item, section_content):
+    """Pop the prefetched review for a queue item. Returns the record, or None
+    if there is none or the section changed since it was reviewed."""
+    record = item.pop("prefetched", None)
+    if record is None:
+        return None
+    conv_file = record.get("conversation_file")
+    if (record.get("iteration") != session.get("iteration", 1)
+            or record.get("content_hash") != _content_hash(section_content)):
+        if conv_file and Path(conv_file).exists():
+            os.remove(conv_file)
+        _save_session(session["session_id"], session)
+        return None
+    if conv_file and Path(conv_file).exists():
+        # Pushback for this section continues this review's conversation
+        os.replace(conv_file, _conversation_path(session))
+    _save_session(session["session_id"], session)
+    return record
+
+
+# ---------------------------------------------------------------------------
+# Batch — whole-range reviews through the provider batch API
+# ---------------------------------------------------------------------------
+
+def _expand_targets(patterns):
+    """Target paths (relative to scaffold/) from paths and glob patterns."""
+    targets = []
+    for pattern in patterns:
+        if any(ch in pattern for ch in "*?["):
+            targets.extend(sorted(str(p.relative_to(SCAFFOLD_DIR)) for p in SCAFFOLD_DIR.glob(pattern)))
+        else:
+            targets.append(pattern)
+    return list(dict.fromkeys(targets))
+
+
+def _batch_record_path(batch_id):
+    return REVIEWS_DIR / f"batch-{batch_id}.json"
+
+
+def cmd_batch_submit(args):
+    """Queue every pending L3/L2 section review of a range of targets as one
+    provider batch. Results are attached to each target's session by
+    batch-collect and served by next-action like prefetched reviews."""
+    config = load_layer_config(args.layer)
+    if not config:
+        _output({"status": "error", "message": f"No config for layer '{args.layer}'"})
+        return
+
+    targets = _expand_targets(args.targets)
+    sessions, requests, jobs, skipped = {}, [], [], []
+    for target in targets:
+        target_abs = SCAFFOLD_DIR / target
+        if not target_abs.exists():
+            skipped.append(target)
+            continue
+        session = _open_session(args, config, target)
+        sessions[session["session_id"]] = session
+        doc_content = target_abs.read_text(encoding="utf-8")
+        queue = session["queue"]
+        for i in range(session.get("queue_index", 0), len(queue)):
+            item = queue[i]
+            if item["pass"] not in ("l3", "l2") or "prefetched" in item or "batched" in item:
+                continue
+            section_content, questions = _review_inputs(config, item, doc_content)
+            if not section_content:
+                continue
+            context_text, context_files = _review_context(session, config, item)
+            requests.append({
+                "doc_path": str(target_abs),
+                "iteration": session.get("iteration", 1),
+                "context_files": list(context_files),
+                "context_text": context_text,
+                "instructions": _review_instructions(session, section_content, questions),
+            })
+            jobs.append({
+                "session_id": session["session_id"],
+                "queue_index": i,
+                "iteration": session.get("iteration", 1),
+                "content_hash": _content_hash(section_content),
+            })
+
+    if not requests:
+        _output({"status": "ok", "message": "No pending section reviews in range",
+                 "targets": len(targets), "skipped": skipped})
+        return
+
+    result = _reviewer("doc").batch_submit(requests)
+    if "error" in result:
+        _output({"status": "error", "message": result["error"]})
+        return
+
+    batch_id = result["batch_id"]
+    for job, custom_id in zip(jobs, result["custom_ids"]):
+        job["custom_id"] = custom_id
+        sessions[job["session_id"]]["queue"][job["queue_index"]]["batched"] = batch_id
+    for session_id, session in sessions.items():
+        _save_session(session_id, session)
+    _batch_record_path(batch_id).write_text(json.dumps({
+        "batch_id": batch_id,
+        "layer": args.layer,
+        "submitted": datetime.now().isoformat(),
+        "jobs": jobs,
+    }, indent=2), encoding="utf-8")
+
+    _output({
+        "status": "ok",
+        "batch_id": batch_id,
+        "provider": result["provider"],
+        "requests": len(requests),
+        "sessions": sorted(sessions),
+        "skipped": skipped,
+        "message": f"Submitted {len(requests)} section reviews. Run batch-collect --batch {batch_id} --wait, then next-action per target.",
+    })
+
+
+def cmd_batch_collect(args):
+    """Fetch a batch's reviews into the sessions that requested them."""
+    _output(_collect_batch(args.batch, wait=args.wait))
+
+
+def _collect_batch(batch_id, wait=False, live=None):
+    """Attach a finished batch's reviews to their queue items. live is an
+    in-memory session to update in place (next-action's current session)."""
+    record_path = _batch_record_path(batch_id)
+    if not record_path.exists():
+        return {"status": "error", "message": f"Unknown batch: {batch_id}"}
+    record = json.loads(record_path.read_text(encoding="utf-8"))
+
+    result = _reviewer("doc").batch_results(batch_id, wait=wait)
+    if "error" in result:
+        return {"status": "error", "message": result["error"]}
+    if result["status"] == "pending":
+        return {"status": "pending", "batch_id": batch_id, "counts": result.get("counts", {})}
+
+    sessions = {live["session_id"]: live} if live else {}
+    reviews = result.get("results", {})
+    stored, failed = 0, 0
+    for job in record["jobs"]:
+        session_id = job["session_id"]
+        if session_id not in sessions:
+            sessions[session_id] = _load_session(session_id)
+        session = sessions[session_id]
+        queue = session.get("queue", []) if session else []
+        i = job["queue_index"]
+        if i >= len(queue) or queue[i].get("batched") != batch_id:
+            continue  # Session restarted or rebuilt since submission
+        item = queue[i]
+        item.pop("batched")
+        review = reviews.get(job["custom_id"], {"error": "missing"})
+        if "error" in review or job["iteration"] != session.get("iteration", 1):
+            failed += 1  # Reviewed synchronously when reached
+            continue
+        _store_prefetched(session, i, item, job["content_hash"], review)
+        stored += 1
+
+    for session_id, session in sessions.items():
+        if session:
+            _save_session(session_id, session)
+    record_path.unlink()
+    return {
+        "status": "ok",
+        "batch_id": batch_id,
+        "batch_status": result["status"],
+        "reviews": stored,
+        "failed": failed,
+        "sessions": sorted(s for s in sessions if sessions[s]),
+    }
+
+
 def _write_adjudicate_action(session, config, issue, section_content, queue_item):
     """Write an adjudicate action for one issue."""
     section_heading = queue_item.get("section", "")
@@ -1283,15 +1427,34 @@ def cmd_resolve(args):
 # Reviewer Interaction
 # ---------------------------------------------------------------------------
 
-def _call_reviewer(session, config, section_content, questions, context_files):
-    """Call the appropriate reviewer script and return issues list."""
-    # Select reviewer script
-    reviewer = session.get("reviewer", "doc")
-    if reviewer == "code":
-        review_script = CODE_REVIEW_SCRIPT
-    else:
-        review_script = DOC_REVIEW_SCRIPT
+def _reviewer(kind):
+    """Load the reviewer script (adversarial-review.py or code-review.py) as a
+    module. The file names are hyphenated, so they are imported by path."""
+    module = _reviewers.get(kind)
+    if module is None:
+        script = CODE_REVIEW_SCRIPT if kind == "code" else DOC_REVIEW_SCRIPT
+        spec = importlib.util.spec_from_file_location(script.stem.replace("-", "_"), script)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _reviewers[kind] = module
+    return module
+
 
+_reviewers = {}
+
+
+def _call_reviewer(session, config, section_content, questions, context_files=(), context_text=""):
+    """Call the appropriate reviewer in-process and return issues list."""
+    result = _reviewer_result(session, section_content, questions, context_files, context_text)
+
+    if "error" in result:
+        return None  # Sentinel: reviewer failed (distinct from [] = no issues)
+
+    return result.get("issues", [])
+
+
+def _review_instructions(session, section_content, questions):
+    """Reviewer instructions for one section: the section text plus its questions."""
     # Build prompt with questions
     prompt_parts = [
         "Review the following section from the document. The full document is provided separately — cross-reference other sections as needed.\n\n",
@@ -1307,81 +1470,68 @@ def _call_reviewer(session, config, section_content, questions, context_files):
     if focus:
         prompt_parts.append(f"\nFOCUS: Concentrate on: {focus}\n")
 
-    prompt_text = "".join(prompt_parts)
+    return "".join(prompt_parts)
 
-    # Write prompt to temp file
-    prompt_file = REVIEWS_DIR / f"prompt-{session['session_id']}.md"
-    prompt_file.write_text(prompt_text, encoding="utf-8")
 
-    target_abs = SCAFFOLD_DIR / session["target"]
-    cmd = [
-        sys.executable, str(review_script),
-        "review", str(target_abs),
-        "--iteration", str(session.get("iteration", 1)),
-        "--system-prompt-file", str(prompt_file),
-    ]
-    if context_files:
-        cmd.extend(["--context-files"] + context_files)
+def _reviewer_result(session, section_content, questions, context_files=(), context_text="", persist=True):
+    """Run one reviewer call and return its result dict ({"error": ...} on failure).
+    With persist=False the conversation comes back as "_conversation"."""
+    reviewer = session.get("reviewer", "doc")
+    prompt_text = _review_instructions(session, section_content, questions)
 
-    result = _run_doc_review(cmd)
+    target_abs = str(SCAFFOLD_DIR / session["target"])
+    iteration = session.get("iteration", 1)
+    try:
+        if reviewer == "code":
+            result = _reviewer("code").review(
+                target_abs, session.get("topic", 1), iteration=iteration,
+                context_files=context_files, context_text=context_text, instructions=prompt_text,
+                persist=persist, use_cache=not session.get("no_cache"), on_issue=_issue_arrived)
+        else:
+            result = _reviewer("doc").review(
+                target_abs, iteration=iteration,
+                context_files=context_files, context_text=context_text, instructions=prompt_text,
+                persist=persist, use_cache=not session.get("no_cache"), on_issue=_issue_arrived)
+    except Exception as e:
+        # Reviewer runs in-process — a crash there must not take down the session
+        result = {"error": f"Reviewer failed: {e}"}
+    return result
 
-    # Clean up prompt file
-    if prompt_file.exists():
-        prompt_file.unlink()
 
-    if "error" in result:
-        return None  # Sentinel: reviewer failed (distinct from [] = no issues)
+def _issue_arrived(issue):
+    """Log each streamed issue as it arrives (config "stream"), so a long
+    review shows progress before the full response is in."""
+    severity = issue.get("severity", "?")
+    description = str(issue.get("description", ""))[:80]
+    print(f"[STREAM] {severity}: {description}", file=sys.stderr)
 
-    return result.get("issues", [])
+
+def _conversation_path(session):
+    """Path of the reviewer's live conversation file for this session."""
+    target_abs = str(SCAFFOLD_DIR / session["target"])
+    iteration = session.get("iteration", 1)
+    if session.get("reviewer") == "code":
+        return _reviewer("code").conv_path(target_abs, session.get("topic", 1), iteration)
+    return _reviewer("doc").conv_path(target_abs, iteration)
 
 
 def _send_pushback(session, config, counter_argument):
     """Send pushback to reviewer, return their response."""
     reviewer = session.get("reviewer", "doc")
-    review_script = CODE_REVIEW_SCRIPT if reviewer == "code" else DOC_REVIEW_SCRIPT
-
-    msg_file = REVIEWS_DIR / f"pushback-{session['session_id']}.md"
-    msg_file.write_text(counter_argument, encoding="utf-8")
-
-    target_abs = SCAFFOLD_DIR / session["target"]
-    cmd = [
-        sys.executable, str(review_script),
-        "respond", str(target_abs),
-        "--iteration", str(session.get("iteration", 1)),
-        "--message-file", str(msg_file),
-    ]
-
-    result = _run_doc_review(cmd)
-
-    if msg_file.exists():
-        msg_file.unlink()
+    target_abs = str(SCAFFOLD_DIR / session["target"])
+    iteration = session.get("iteration", 1)
+    try:
+        if reviewer == "code":
+            result = _reviewer("code").respond(target_abs, session.get("topic", 1), iteration, counter_argument)
+        else:
+            result = _reviewer("doc").respond(target_abs, iteration, counter_argument)
+    except Exception as e:
+        result = {"error": f"Reviewer failed: {e}"}
 
     if "error" in result:
         return None
 
-    return result.get("content", result.get("response", ""))
-
-
-def _run_doc_review(cmd):
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300, cwd=str(SCAFFOLD_DIR))
-        stdout = result.stdout.strip()
-        if not stdout:
-            return {"error": result.stderr.strip() if result.stderr else "No output"}
-        try:
-            return json.loads(stdout)
-        except json.JSONDecodeError:
-            for line in stdout.splitlines():
-                if line.strip().startswith("{"):
-                    try:
-                        return json.loads(line.strip())
-                    except json.JSONDecodeError:
-                        continue
-            return {"error": "Failed to parse output", "raw": stdout[:500]}
-    except subprocess.TimeoutExpired:
-        return {"error": "Timed out after 300s"}
-    except FileNotFoundError:
-        return {"error": f"Reviewer script not found"}
+    return result.get("reviewer_response", "")
 
 
 # ---------------------------------------------------------------------------
@@ -1459,11 +1609,32 @@ def main():
     p_next.add_argument("--fast", action="store_true")
     p_next.add_argument("--reviewer", default="doc", choices=["doc", "code"],
                        help="Which reviewer to use: doc (adversarial-review.py) or code (code-review.py)")
+    p_next.add_argument("--prefetch", type=int, default=None, metavar="N",
+                       help="Review the sections of each L3/L2 pass concurrently, N requests at a time "
+                            "(default: defaults.prefetch_workers in the layer config, 0 = off)")
+    p_next.add_argument("--no-cache", action="store_true",
+                       help="Force fresh reviewer calls instead of reusing cached responses")
 
     # resolve
     p_res = subparsers.add_parser("resolve")
     p_res.add_argument("--session", required=True)
 
+    # batch-submit / batch-collect — whole-range reviews via the provider batch API
+    p_bsub = subparsers.add_parser("batch-submit")
+    p_bsub.add_argument("--layer", required=True)
+    p_bsub.add_argument("--targets", nargs="+", required=True,
+                        help="Target docs relative to scaffold/ (glob patterns allowed)")
+    p_bsub.add_argument("--iterations", type=int, default=None)
+    p_bsub.add_argument("--max-exchanges", type=int, default=None)
+    p_bsub.add_argument("--focus", default="")
+    p_bsub.add_argument("--sections", default="")
+    p_bsub.add_argument("--fast", action="store_true")
+    p_bsub.set_defaults(reviewer="doc", prefetch=None, no_cache=False)
+
+    p_bcol = subparsers.add_parser("batch-collect")
+    p_bcol.add_argument("--batch", required=True)
+    p_bcol.add_argument("--wait", action="store_true", help="Poll until the batch has ended")
+
     args = parser.parse_args()
 
     if not args.command:
@@ -1474,6 +1645,8 @@ def main():
         "preflight": cmd_preflight,
         "next-action": cmd_next_action,
         "resolve": cmd_resolve,
+        "batch-submit": cmd_batch_submit,
+        "batch-collect": cmd_batch_collect,
     }
 
     commands[args.command](args)
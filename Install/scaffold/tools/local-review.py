@@ -13,10 +13,19 @@ Commands:
     next-action  Write action.json with the next instruction.
     resolve      Read result.json, process it, write next action.json.
 
-Session state persists in .reviews/fix/session-<id>.json.
+Session state persists in .reviews/fix/session-<id>.json (snapshot) plus
+session-<id>.journal.jsonl (changes since the snapshot; see session_journal.py).
 No pip dependencies — uses Python standard library only.
 """
 
+import daemon
+import startup_profile
+
+if __name__ == "__main__":
+    # --profile-startup: re-run under -X importtime and report (startup_profile.py)
+    startup_profile.from_argv(__file__)
+    daemon.forward_cli("local-review")
+
 import json
 import os
 import sys
@@ -26,6 +35,10 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+import config_loader
+import glossary_match
+import session_journal
+
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -39,142 +52,13 @@ ACTION_FILE = REVIEWS_DIR / "action.json"
 RESULT_FILE = REVIEWS_DIR / "result.json"
 
 
-# ---------------------------------------------------------------------------
-# YAML Parser (shared with iterate.py — minimal, no dependencies)
-# ---------------------------------------------------------------------------
-
-def _parse_yaml_value(val):
-    val = val.strip()
-    if val == "" or val == "~" or val == "null":
-        return None
-    if val == "true" or val == "True":
-        return True
-    if val == "false" or val == "False":
-        return False
-    try:
-        return int(val)
-    except ValueError:
-        pass
-    try:
-        return float(val)
-    except ValueError:
-        pass
-    if (val.startswith('"') and val.endswith('"')) or \
-       (val.startswith("'") and val.endswith("'")):
-        return val[1:-1]
-    return val
-
-
-def _count_indent(line):
-    return len(line) - len(line.lstrip())
-
-
-def load_yaml(path):
-    """Load a YAML file. Uses PyYAML if available, falls back to custom parser."""
-    path = Path(path)
-    if not path.exists():
-        return None
-    content = path.read_text(encoding="utf-8")
-    try:
-        import yaml
-        return yaml.safe_load(content)
-    except ImportError:
-        lines = content.splitlines()
-        return _parse_yaml_block(lines, 0, 0)[0]
-
-
-def _parse_yaml_block(lines, start, base_indent):
-    result = {}
-    i = start
-    is_list = False
-    result_list = []
-
-    while i < len(lines):
-        line = lines[i]
-        stripped = line.strip()
-
-        if not stripped or stripped.startswith("#"):
-            i += 1
-            continue
-
-        indent = _count_indent(line)
-        if indent < base_indent:
-            break
-
-        if indent == base_indent:
-            if stripped.startswith("- "):
-                is_list = True
-                item_text = stripped[2:].strip()
-                if ":" in item_text and not item_text.startswith('"'):
-                    colon_pos = item_text.index(":")
-                    key = item_text[:colon_pos].strip()
-                    val_text = item_text[colon_pos + 1:].strip()
-                    if val_text:
-                        item_dict = {key: _parse_yaml_value(val_text)}
-                    else:
-                        item_dict = {key: None}
-                    next_i = i + 1
-                    if next_i < len(lines):
-                        next_stripped = lines[next_i].strip()
-                        next_indent = _count_indent(lines[next_i]) if next_stripped else 0
-                        if next_stripped and next_indent > indent:
-                            child, next_i = _parse_yaml_block(lines, next_i, next_indent)
-                            if not val_text:
-                                item_dict[key] = child
-                            i = next_i
-                            result_list.append(item_dict)
-                            continue
-                    i += 1
-                    result_list.append(item_dict)
-                    continue
-                else:
-                    result_list.append(_parse_yaml_value(item_text))
-                    i += 1
-                    continue
-
-            if ":" in stripped:
-                colon_pos = stripped.index(":")
-                key = stripped[:colon_pos].strip()
-                val_text = stripped[colon_pos + 1:].strip()
-                if val_text.startswith("[") and val_text.endswith("]"):
-                    inner = val_text[1:-1]
-                    items = [_parse_yaml_value(x.strip()) for x in inner.split(",")] if inner.strip() else []
-                    result[key] = items
-                    i += 1
-                    continue
-                if val_text:
-                    result[key] = _parse_yaml_value(val_text)
-                    i += 1
-                    continue
-                next_i = i + 1
-                while next_i < len(lines) and not lines[next_i].strip():
-                    next_i += 1
-                if next_i < len(lines):
-                    next_indent = _count_indent(lines[next_i])
-                    if next_indent > base_indent:
-                        child, next_i = _parse_yaml_block(lines, next_i, next_indent)
-                        result[key] = child
-                        i = next_i
-                        continue
-                result[key] = None
-                i += 1
-                continue
-        i += 1
-
-    if is_list:
-        return result_list, i
-    return result, i
-
-
 # ---------------------------------------------------------------------------
 # Config & Session
 # ---------------------------------------------------------------------------
 
 def load_layer_config(layer):
     config_path = CONFIGS_DIR / f"{layer}.yaml"
-    if not config_path.exists():
-        return None
-    return load_yaml(config_path)
+    return config_loader.load_config(config_path, "fix")
 
 
 def _session_id(layer, target):
@@ -190,18 +74,11 @@ def _session_path(session_id):
 
 
 def _load_session(session_id):
-    path = _session_path(session_id)
-    if not path.exists():
-        return None
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    return session_journal.load(_session_path(session_id))
 
 
 def _save_session(session_id, data):
-    path = _session_path(session_id)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    session_journal.save(_session_path(session_id), data)
 
 
 def _write_action(data):
@@ -221,33 +98,6 @@ def _output(data):
     print(json.dumps(data, indent=2))
 
 
-# ---------------------------------------------------------------------------
-# Glossary Loading
-# ---------------------------------------------------------------------------
-
-def _load_glossary():
-    """Load glossary NOT-column terms for compliance checking."""
-    glossary_path = SCAFFOLD_DIR / "design" / "glossary.md"
-    if not glossary_path.exists():
-        return {}
-    content = glossary_path.read_text(encoding="utf-8")
-    not_terms = {}
-    # Find table rows with NOT column
-    for line in content.splitlines():
-        if "|" in line and line.count("|") >= 3:
-            cells = [c.strip() for c in line.split("|")]
-            # Typical format: | Term | Definition | NOT: bad1, bad2 |
-            for cell in cells:
-                if cell.lower().startswith("not:") or cell.lower().startswith("not "):
-                    canonical = cells[1].strip() if len(cells) > 1 else ""
-                    bad_terms = cell.split(":", 1)[-1].strip() if ":" in cell else ""
-                    for bt in bad_terms.split(","):
-                        bt = bt.strip()
-                        if bt and canonical:
-                            not_terms[bt.lower()] = canonical
-    return not_terms
-
-
 # ---------------------------------------------------------------------------
 # Template Loading
 # ---------------------------------------------------------------------------
@@ -329,7 +179,7 @@ def _run_mechanical_checks(session, config, doc_content, doc_path):
 
     # -- Terminology checks --
     terminology = mechanical.get("terminology", [])
-    not_terms = _load_glossary()
+    not_terms = glossary_match.load_not_terms(SCAFFOLD_DIR)
 
     for check in terminology:
         if not isinstance(check, dict):
@@ -337,24 +187,21 @@ def _run_mechanical_checks(session, config, doc_content, doc_path):
         check_id = check.get("id", "")
 
         if check_id == "glossary_compliance" and not_terms:
-            for bad_term, canonical in not_terms.items():
-                # Case-insensitive word boundary search
-                pattern = rf"\b{re.escape(bad_term)}\b"
-                matches = list(re.finditer(pattern, doc_content, re.IGNORECASE))
-                for match in matches:
-                    # Check if in excluded context (rough heuristic)
-                    line_start = doc_content.rfind("\n", 0, match.start()) + 1
-                    line = doc_content[line_start:doc_content.find("\n", match.end())]
-                    if _is_excluded_context(line):
-                        continue
-                    if check.get("auto_fix"):
-                        auto_fixes.append({
-                            "check_id": check_id,
-                            "category": "terminology",
-                            "description": f"NOT-column term '{bad_term}' used — canonical is '{canonical}'",
-                            "fix": f"Replace '{match.group()}' with '{canonical}'",
-                            "location": match.start(),
-                        })
+            # One automaton pass over the doc; case-insensitive, word-bounded
+            for match in glossary_match.find_matches(doc_content, SCAFFOLD_DIR):
+                # Check if in excluded context (rough heuristic)
+                line_start = doc_content.rfind("\n", 0, match["start"]) + 1
+                line = doc_content[line_start:doc_content.find("\n", match["end"])]
+                if _is_excluded_context(line):
+                    continue
+                if check.get("auto_fix"):
+                    auto_fixes.append({
+                        "check_id": check_id,
+                        "category": "terminology",
+                        "description": f"NOT-column term '{match['term']}' used — canonical is '{match['canonical']}'",
+                        "fix": f"Replace '{match['text']}' with '{match['canonical']}'",
+                        "location": match["start"],
+                    })
 
         elif check_id == "index_registration":
             index_file = SCAFFOLD_DIR / check.get("index_file", "")
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Rate limiter — adaptive per-provider pacing for reviewer API calls.
+
+Each provider (openai, anthropic, google) gets two token buckets, one for
+requests and one for tokens. Their capacity, level and refill rate are
+learned from the rate-limit headers on every response:
+
+    OpenAI     x-ratelimit-{limit,remaining,reset}-{requests,tokens}
+    Anthropic  anthropic-ratelimit-{requests,tokens,input-tokens}-{limit,remaining,reset}
+    any        retry-after (on 429 / 529)
+
+acquire() waits only when a bucket would go empty (or the provider asked us
+to back off); with no headers seen yet it never waits. State is persisted to
+scaffold/.reviews/rate-limits.json so consecutive CLI invocations share what
+the last response said.
+
+Usage:
+    import rate_limit
+
+    rate_limit.acquire("openai", tokens=rate_limit.estimate_tokens(body))
+    ... send request ...
+    rate_limit.observe("openai", resp.headers, resp.status)
+
+Commands:
+    status   Show learned limits and the current wait per provider.
+    reset    Forget learned state (all providers, or one).
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).parent
+SCAFFOLD_DIR = TOOLS_DIR.parent
+STATE_FILE = SCAFFOLD_DIR / ".reviews" / "rate-limits.json"
+STATE_VERSION = 1
+
+# Rough chars-per-token used to size the token-bucket debit of a request
+_CHARS_PER_TOKEN = 4
+
+# Refill assumption when a bucket has no reset time: limits are per minute
+_DEFAULT_WINDOW = 60.0
+
+# Header names per bucket: (limit, remaining, reset), first match wins
+_HEADERS = {
+    "requests": [
+        ("x-ratelimit-limit-requests", "x-ratelimit-remaining-requests", "x-ratelimit-reset-requests"),
+        ("anthropic-ratelimit-requests-limit", "anthropic-ratelimit-requests-remaining",
+         "anthropic-ratelimit-requests-reset"),
+    ],
+    "tokens": [
+        ("x-ratelimit-limit-tokens", "x-ratelimit-remaining-tokens", "x-ratelimit-reset-tokens"),
+        ("anthropic-ratelimit-tokens-limit", "anthropic-ratelimit-tokens-remaining",
+         "anthropic-ratelimit-tokens-reset"),
+        ("anthropic-ratelimit-input-tokens-limit", "anthropic-ratelimit-input-tokens-remaining",
+         "anthropic-ratelimit-input-tokens-reset"),
+    ],
+}
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+
+_lock = threading.Lock()
+_state = {"stamp": None, "providers": {}}
+
+
+# ---------------------------------------------------------------------------
+# Header Parsing
+# ---------------------------------------------------------------------------
+
+def estimate_tokens(body):
+    """Approximate prompt tokens for a request body (str or bytes)."""
+    return len(body) // _CHARS_PER_TOKEN
+
+
+def parse_duration(value):
+    """Seconds from an OpenAI-style duration ("20ms", "1.5s", "6m0s", "1h2m")."""
+    value = value.strip()
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(n + u for n, u in parts) != value:
+        return None
+    scale = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+    return sum(float(n) * scale[u] for n, u in parts)
+
+
+def _parse_reset(value, now):
+    """Seconds until a reset given as a duration, plain seconds, or a timestamp."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    seconds = parse_duration(value)
+    if seconds is not None:
+        return seconds
+    try:
+        ts = datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        try:
+            from email.utils import parsedate_to_datetime
+            ts = parsedate_to_datetime(value).timestamp()
+        except (TypeError, ValueError):
+            return None
+    return max(0.0, ts - now)
+
+
+def retry_after(headers):
+    """Seconds from a Retry-After header, or None."""
+    if not headers:
+        return None
+    value = _lower(headers).get("retry-after")
+    return _parse_reset(value, time.time()) if value else None
+
+
+def _lower(headers):
+    return {str(k).lower(): v for k, v in headers.items()}
+
+
+def _number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Buckets
+# ---------------------------------------------------------------------------
+
+def _level(bucket, now):
+    """Current bucket level after refilling since it was last observed."""
+    elapsed = max(0.0, now - bucket["at"])
+    return min(bucket["limit"], bucket["level"] + bucket["rate"] * elapsed)
+
+
+def _bucket_wait(bucket, cost, now):
+    cost = min(cost, bucket["limit"])  # a request larger than the bucket still gets through once full
+    level = _level(bucket, now)
+    if level >= cost:
+        return 0.0
+    if bucket["rate"] <= 0:
+        return _DEFAULT_WINDOW
+    return (cost - level) / bucket["rate"]
+
+
+def _costs(tokens):
+    return {"requests": 1, "tokens": tokens}
+
+
+def _wait(entry, tokens, now):
+    wait = max(0.0, entry.get("blocked_until", 0) - now)
+    for kind, cost in _costs(tokens).items():
+        bucket = entry.get("buckets", {}).get(kind)
+        if bucket and cost:
+            wait = max(wait, _bucket_wait(bucket, cost, now))
+    return wait
+
+
+def wait_time(provider, tokens=0):
+    """Seconds acquire() would currently wait for a request of this size."""
+    with _lock:
+        _refresh()
+        return _wait(_state["providers"].get(provider, {}), tokens, time.time())
+
+
+def acquire(provider, tokens=0):
+    """Block until the provider's buckets can take one request of `tokens`
+    prompt tokens, then debit them. Returns the seconds spent waiting."""
+    waited = 0.0
+    while True:
+        with _lock:
+            _refresh()
+            entry = _state["providers"].get(provider, {})
+            now = time.time()
+            wait = _wait(entry, tokens, now)
+            if wait <= 0:
+                for kind, cost in _costs(tokens).items():
+                    bucket = entry.get("buckets", {}).get(kind)
+                    if bucket and cost:
+                        bucket["level"] = _level(bucket, now) - min(cost, bucket["limit"])
+                        bucket["at"] = now
+                if entry:
+                    _save()
+                return waited
+        if wait >= 1:
+            print(f"[rate-limit] {provider}: pacing {wait:.1f}s", file=sys.stderr)
+        time.sleep(wait)
+        waited += wait
+
+
+def observe(provider, headers, status=None):
+    """Update the provider's buckets from a response's headers. On 429/529
+    the provider is blocked for its Retry-After (or until the empty bucket
+    resets)."""
+    if headers is None:
+        return
+    h = _lower(headers)
+    now = time.time()
+    with _lock:
+        _refresh()
+        entry = _state["providers"].setdefault(provider, {})
+        buckets = entry.setdefault("buckets", {})
+        for kind, candidates in _HEADERS.items():
+            for limit_h, remaining_h, reset_h in candidates:
+                limit, remaining = _number(h.get(limit_h)), _number(h.get(remaining_h))
+                if not limit or remaining is None:
+                    continue
+                reset = _parse_reset(h.get(reset_h), now)
+                if reset and limit > remaining:
+                    rate = (limit - remaining) / reset
+                else:
+                    rate = limit / _DEFAULT_WINDOW
+                buckets[kind] = {"limit": limit, "level": remaining, "rate": rate, "at": now}
+                break
+        if status in (429, 529):
+            delay = retry_after(h)
+            if delay is None:
+                empty = [b for b in buckets.values() if _level(b, now) < 1]
+                delay = max((_bucket_wait(b, 1, now) for b in empty), default=None)
+            if delay:
+                entry["blocked_until"] = max(entry.get("blocked_until", 0), now + delay)
+        entry["updated"] = now
+        _save()
+
+
+def block(provider, seconds):
+    """Hold off all requests to a provider for `seconds` (e.g. a wait parsed
+    from an error message)."""
+    with _lock:
+        _refresh()
+        entry = _state["providers"].setdefault(provider, {})
+        entry["blocked_until"] = max(entry.get("blocked_until", 0), time.time() + seconds)
+        _save()
+
+
+# ---------------------------------------------------------------------------
+# Persistence
+# ---------------------------------------------------------------------------
+
+def _stamp():
+    try:
+        st = STATE_FILE.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _refresh():
+    """Reload state if another process wrote it since we last did."""
+    stamp = _stamp()
+    if stamp == _state["stamp"]:
+        return
+    providers = {}
+    if stamp is not None:
+        try:
+            data = json.loads(STATE_FILE.read_text(encoding="utf-8"))
+            if isinstance(data, dict) and data.get("version") == STATE_VERSION:
+                providers = data.get("providers", {})
+        except (OSError, ValueError):
+            pass
+    _state["providers"] = providers
+    _state["stamp"] = stamp
+
+
+def _save():
+    try:
+        STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = STATE_FILE.with_suffix(f".tmp{os.getpid()}.{threading.get_ident()}")
+        tmp.write_text(json.dumps({"version": STATE_VERSION, "providers": _state["providers"]}),
+                       encoding="utf-8")
+        os.replace(tmp, STATE_FILE)
+        _state["stamp"] = _stamp()
+    except OSError:
+        pass  # pacing state is advisory — never fail a review over it
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _output(data):
+    print(json.dumps(data, indent=2))
+
+
+def cmd_status(args):
+    now = time.time()
+    with _lock:
+        _refresh()
+        providers = {}
+        for name, entry in sorted(_state["providers"].items()):
+            providers[name] = {
+                "wait_seconds": round(_wait(entry, 0, now), 2),
+                "blocked_for": round(max(0.0, entry.get("blocked_until", 0) - now), 2),
+                "buckets": {
+                    kind: {"limit": b["limit"], "available": round(_level(b, now), 1),
+                           "refill_per_second": round(b["rate"], 3)}
+                    for kind, b in entry.get("buckets", {}).items()
+                },
+            }
+    _output({"status": "ok", "state_file": str(STATE_FILE), "providers": providers})
+
+
+def cmd_reset(args):
+    with _lock:
+        _refresh()
+        if args.provider:
+            _state["providers"].pop(args.provider, None)
+        else:
+            _state["providers"] = {}
+        _save()
+    _output({"status": "ok", "reset": args.provider or "all"})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reviewer API rate limiter")
+    sub = parser.add_subparsers(dest="command")
+
+    sub.add_parser("status", help="Show learned limits and current waits")
+
+    p_reset = sub.add_parser("reset", help="Forget learned rate-limit state")
+    p_reset.add_argument("provider", nargs="?", default="", help="openai, anthropic or google (default: all)")
+
+    args = parser.parse_args()
+    if args.command == "status":
+        cmd_status(args)
+    elif args.command == "reset":
+        cmd_reset(args)
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
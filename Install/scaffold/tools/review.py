@@ -16,6 +16,14 @@ Commands:
     resolve      Read result.json — delegates to whichever phase is active.
 """
 
+import daemon
+import startup_profile
+
+if __name__ == "__main__":
+    # --profile-startup: re-run under -X importtime and report (startup_profile.py)
+    startup_profile.from_argv(__file__)
+    daemon.forward_cli("review")
+
 import json
 import os
 import sys
@@ -92,24 +100,35 @@ def _output(data):
 # Delegate to sub-orchestrator
 # ---------------------------------------------------------------------------
 
-def _run_sub(script, args_list):
-    """Run a sub-orchestrator command and return its stdout parsed as JSON."""
-    cmd = [sys.executable, str(script)] + args_list
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600, cwd=str(SCAFFOLD_DIR))
-        if result.returncode != 0 and result.stderr:
-            return {"_error": True, "message": result.stderr.strip()[:500]}
-        stdout = result.stdout.strip()
-        if stdout:
-            try:
-                return json.loads(stdout)
-            except json.JSONDecodeError:
-                pass
-        return None
-    except subprocess.TimeoutExpired:
-        return {"_error": True, "message": "Sub-orchestrator timed out"}
-    except FileNotFoundError:
-        return {"_error": True, "message": f"Script not found: {script}"}
+def _run_sub(script, args_list, in_process=False):
+    """Run a sub-orchestrator command and return its stdout parsed as JSON.
+    Inside the daemon, or with in_process=True, the sub-orchestrator runs
+    in-process instead of spawning."""
+    if in_process:
+        inline = daemon.run_in_process(Path(script).stem, args_list, cwd=str(SCAFFOLD_DIR))
+    else:
+        inline = daemon.run_inline(Path(script).stem, args_list, cwd=str(SCAFFOLD_DIR))
+    if inline is not None:
+        returncode, stdout, stderr = inline
+    else:
+        cmd = [sys.executable, str(script)] + args_list
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=600, cwd=str(SCAFFOLD_DIR))
+        except subprocess.TimeoutExpired:
+            return {"_error": True, "message": "Sub-orchestrator timed out"}
+        except FileNotFoundError:
+            return {"_error": True, "message": f"Script not found: {script}"}
+        returncode, stdout, stderr = result.returncode, result.stdout, result.stderr
+
+    if returncode != 0 and stderr:
+        return {"_error": True, "message": stderr.strip()[:500]}
+    stdout = stdout.strip()
+    if stdout:
+        try:
+            return json.loads(stdout)
+        except json.JSONDecodeError:
+            pass
+    return None
 
 
 def _copy_action_from_sub(sub_action_file, parent_session_id=None):
@@ -176,19 +195,22 @@ def _layer_to_scope(layer):
 # ---------------------------------------------------------------------------
 
 def cmd_preflight(args):
-    """Run preflight for fix, iterate, and validate."""
-    fix_result = _run_sub(LOCAL_REVIEW, ["preflight", "--layer", args.layer, "--target", args.target])
+    """Run preflight for fix, iterate, and validate — in-process, since each
+    is a quick check and three interpreter startups would dominate."""
+    fix_result = _run_sub(LOCAL_REVIEW, ["preflight", "--layer", args.layer, "--target", args.target],
+                          in_process=True)
     if fix_result and fix_result.get("status") != "ready":
         _output(fix_result)
         return
 
-    iterate_result = _run_sub(ITERATE, ["preflight", "--layer", args.layer, "--target", args.target])
+    iterate_result = _run_sub(ITERATE, ["preflight", "--layer", args.layer, "--target", args.target],
+                              in_process=True)
     if iterate_result and iterate_result.get("status") != "ready":
         _output(iterate_result)
         return
 
     scope = _layer_to_scope(args.layer)
-    validate_result = _run_sub(VALIDATE, ["preflight", "--scope", scope])
+    validate_result = _run_sub(VALIDATE, ["preflight", "--scope", scope], in_process=True)
     if validate_result and validate_result.get("status") not in ("ready", "skip"):
         _output(validate_result)
         return
@@ -277,6 +299,8 @@ def cmd_next_action(args):
             iter_args.extend(["--sections", args.sections])
         if args.fast:
             iter_args.append("--fast")
+        if args.no_cache:
+            iter_args.append("--no-cache")
         sub_result = _run_sub(ITERATE, iter_args)
 
         if sub_result and sub_result.get("_error"):
@@ -443,6 +467,7 @@ def main():
     p_next.add_argument("--focus", default="")
     p_next.add_argument("--sections", default="")
     p_next.add_argument("--fast", action="store_true")
+    p_next.add_argument("--no-cache", action="store_true")
 
     p_res = subparsers.add_parser("resolve")
     p_res.add_argument("--session", required=True)
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Review cache — content-addressed store of reviewer API responses.
+
+Re-reviewing a section that has not changed (a discarded session restarted,
+a verification pass over untouched sections) sends the exact same prompt
+again. call_provider() in adversarial-review.py and code-review.py checks
+this cache first and only pays for an LLM call on a miss.
+
+The key is the sha256 of (provider, model, temperature, response mode,
+messages) — the messages carry the system prompt, the user prompt and the
+resolved context text, so any change to the document, context or
+instructions is a different key. Only successful, complete responses are
+stored (a streamed review cut short is not).
+
+Entries live in scaffold/.reviews/response-cache/<key>.json. Each expires
+after ttl_hours; beyond max_entries the least recently used (oldest mtime —
+hits touch the file) are evicted. Hit/miss counters are kept in stats.json.
+
+Settings (review_config.json, all optional):
+    "cache": {"enabled": true, "ttl_hours": 168, "max_entries": 500}
+
+Usage:
+    import review_cache
+
+    key = review_cache.key(provider, model, temperature, messages, json_mode)
+    result = review_cache.get(key, config)    # None on miss
+    review_cache.put(key, result, config)
+
+Commands:
+    stats   Show entry count, size and hit rate.
+    clear   Delete every cached response (counters too).
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).parent
+SCAFFOLD_DIR = TOOLS_DIR.parent
+CACHE_DIR = SCAFFOLD_DIR / ".reviews" / "response-cache"
+STATS_FILE = CACHE_DIR / "stats.json"
+
+DEFAULTS = {"enabled": True, "ttl_hours": 168, "max_entries": 500}
+
+_lock = threading.Lock()
+
+
+# ---------------------------------------------------------------------------
+# Settings & Keys
+# ---------------------------------------------------------------------------
+
+def settings(config=None):
+    """Cache settings from a review config, filled with defaults."""
+    merged = dict(DEFAULTS)
+    merged.update((config or {}).get("cache", {}) or {})
+    return merged
+
+
+def enabled(config=None):
+    return bool(settings(config)["enabled"])
+
+
+def key(provider, model, temperature, messages, json_mode):
+    """Content hash identifying one provider request."""
+    blob = json.dumps({
+        "provider": provider,
+        "model": model,
+        "temperature": temperature,
+        "json_mode": bool(json_mode),
+        "messages": messages,
+    }, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _entry_path(k):
+    return CACHE_DIR / f"{k}.json"
+
+
+# ---------------------------------------------------------------------------
+# Lookup & Store
+# ---------------------------------------------------------------------------
+
+def get(k, config=None):
+    """Cached result for key k, or None if absent or expired. Counts the
+    lookup and marks the entry as recently used."""
+    cfg = settings(config)
+    path = _entry_path(k)
+    result = None
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+        if time.time() - entry.get("created", 0) <= cfg["ttl_hours"] * 3600:
+            result = entry.get("result")
+            os.utime(path)  # LRU: eviction goes by mtime
+        else:
+            path.unlink()
+    except (OSError, ValueError):
+        pass
+    _count("hits" if result is not None else "misses")
+    return result
+
+
+def put(k, result, config=None, provider="", model=""):
+    """Store a successful, complete result under key k, then evict past max_entries."""
+    if not isinstance(result, dict) or "error" in result or result.get("_partial"):
+        return
+    cfg = settings(config)
+    entry = {"created": time.time(), "provider": provider, "model": model, "result": result}
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = _entry_path(k)
+        tmp = path.with_suffix(f".tmp{os.getpid()}.{threading.get_ident()}")
+        tmp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+        _evict(cfg["max_entries"])
+    except OSError:
+        pass  # the cache is an optimisation — never fail a review over it
+
+
+def _entries():
+    """[(mtime, path)] for every cached response."""
+    out = []
+    if not CACHE_DIR.is_dir():
+        return out
+    for path in CACHE_DIR.glob("*.json"):
+        if path.name == STATS_FILE.name:
+            continue
+        try:
+            out.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    return out
+
+
+def _evict(max_entries):
+    entries = _entries()
+    if len(entries) <= max_entries:
+        return
+    entries.sort()
+    for _, path in entries[:len(entries) - max_entries]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+# ---------------------------------------------------------------------------
+# Stats
+# ---------------------------------------------------------------------------
+
+def _read_counts():
+    try:
+        data = json.loads(STATS_FILE.read_text(encoding="utf-8"))
+        return {"hits": int(data.get("hits", 0)), "misses": int(data.get("misses", 0))}
+    except (OSError, ValueError):
+        return {"hits": 0, "misses": 0}
+
+
+def _count(field):
+    with _lock:
+        counts = _read_counts()
+        counts[field] += 1
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = STATS_FILE.with_suffix(f".tmp{os.getpid()}.{threading.get_ident()}")
+            tmp.write_text(json.dumps(counts), encoding="utf-8")
+            os.replace(tmp, STATS_FILE)
+        except OSError:
+            pass
+
+
+def stats():
+    """Entry count, total size and cumulative hit rate."""
+    entries = _entries()
+    counts = _read_counts()
+    lookups = counts["hits"] + counts["misses"]
+    return {
+        "entries": len(entries),
+        "bytes": sum(p.stat().st_size for _, p in entries if p.exists()),
+        "hits": counts["hits"],
+        "misses": counts["misses"],
+        "hit_rate": round(counts["hits"] / lookups, 3) if lookups else 0.0,
+    }
+
+
+def clear():
+    """Delete every cached response and reset the counters. Returns the count removed."""
+    removed = 0
+    for _, path in _entries():
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    if STATS_FILE.exists():
+        STATS_FILE.unlink()
+    return removed
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _output(data):
+    print(json.dumps(data, indent=2))
+
+
+def cmd_stats(args):
+    _output({"status": "ok", "cache_dir": str(CACHE_DIR), **stats()})
+
+
+def cmd_clear(args):
+    _output({"status": "ok", "removed": clear()})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reviewer response cache")
+    sub = parser.add_subparsers(dest="command")
+    sub.add_parser("stats", help="Show entry count, size and hit rate")
+    sub.add_parser("clear", help="Delete every cached response")
+
+    args = parser.parse_args()
+    if args.command == "stats":
+        cmd_stats(args)
+    elif args.command == "clear":
+        cmd_clear(args)
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
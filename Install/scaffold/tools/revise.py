@@ -12,6 +12,14 @@ Commands:
     resolve      Read result.json, process it, write next action.json.
 """
 
+import daemon
+import startup_profile
+
+if __name__ == "__main__":
+    # --profile-startup: re-run under -X importtime and report (startup_profile.py)
+    startup_profile.from_argv(__file__)
+    daemon.forward_cli("revise")
+
 import json
 import os
 import sys
@@ -21,6 +29,9 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+import config_loader
+import doc_index
+
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -34,127 +45,13 @@ ACTION_FILE = REVIEWS_DIR / "action.json"
 RESULT_FILE = REVIEWS_DIR / "result.json"
 
 
-# ---------------------------------------------------------------------------
-# YAML Parser (shared)
-# ---------------------------------------------------------------------------
-
-def _parse_yaml_value(val):
-    val = val.strip()
-    if val == "" or val == "~" or val == "null":
-        return None
-    if val in ("true", "True"):
-        return True
-    if val in ("false", "False"):
-        return False
-    try:
-        return int(val)
-    except ValueError:
-        pass
-    try:
-        return float(val)
-    except ValueError:
-        pass
-    if (val.startswith('"') and val.endswith('"')) or (val.startswith("'") and val.endswith("'")):
-        return val[1:-1]
-    return val
-
-
-def _count_indent(line):
-    return len(line) - len(line.lstrip())
-
-
-def load_yaml(path):
-    """Load a YAML file. Uses PyYAML if available, falls back to custom parser."""
-    path = Path(path)
-    if not path.exists():
-        return None
-    content = path.read_text(encoding="utf-8")
-    try:
-        import yaml
-        return yaml.safe_load(content)
-    except ImportError:
-        lines = content.splitlines()
-        return _parse_yaml_block(lines, 0, 0)[0]
-
-
-def _parse_yaml_block(lines, start, base_indent):
-    result = {}
-    i = start
-    is_list = False
-    result_list = []
-    while i < len(lines):
-        line = lines[i]
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            i += 1
-            continue
-        indent = _count_indent(line)
-        if indent < base_indent:
-            break
-        if indent == base_indent:
-            if stripped.startswith("- "):
-                is_list = True
-                item_text = stripped[2:].strip()
-                if ":" in item_text and not item_text.startswith('"'):
-                    cp = item_text.index(":")
-                    key = item_text[:cp].strip()
-                    vt = item_text[cp + 1:].strip()
-                    item_dict = {key: _parse_yaml_value(vt)} if vt else {key: None}
-                    ni = i + 1
-                    if ni < len(lines):
-                        ns = lines[ni].strip()
-                        nind = _count_indent(lines[ni]) if ns else 0
-                        if ns and nind > indent:
-                            child, ni = _parse_yaml_block(lines, ni, nind)
-                            if not vt:
-                                item_dict[key] = child
-                            i = ni
-                            result_list.append(item_dict)
-                            continue
-                    i += 1
-                    result_list.append(item_dict)
-                    continue
-                else:
-                    result_list.append(_parse_yaml_value(item_text))
-                    i += 1
-                    continue
-            if ":" in stripped:
-                cp = stripped.index(":")
-                key = stripped[:cp].strip()
-                vt = stripped[cp + 1:].strip()
-                if vt.startswith("[") and vt.endswith("]"):
-                    inner = vt[1:-1]
-                    result[key] = [_parse_yaml_value(x.strip()) for x in inner.split(",")] if inner.strip() else []
-                    i += 1
-                    continue
-                if vt:
-                    result[key] = _parse_yaml_value(vt)
-                    i += 1
-                    continue
-                ni = i + 1
-                while ni < len(lines) and not lines[ni].strip():
-                    ni += 1
-                if ni < len(lines) and _count_indent(lines[ni]) > base_indent:
-                    child, ni = _parse_yaml_block(lines, ni, _count_indent(lines[ni]))
-                    result[key] = child
-                    i = ni
-                    continue
-                result[key] = None
-                i += 1
-                continue
-        i += 1
-    return (result_list, i) if is_list else (result, i)
-
-
 # ---------------------------------------------------------------------------
 # Config & Session
 # ---------------------------------------------------------------------------
 
 def load_layer_config(layer):
     config_path = CONFIGS_DIR / f"{layer}.yaml"
-    if not config_path.exists():
-        return None
-    return load_yaml(config_path)
+    return config_loader.load_config(config_path, "revise")
 
 
 def _session_id(layer, source):
@@ -245,30 +142,24 @@ def _build_impact_preview(feedback):
     # Extract signal IDs from feedback (ADR-###, KI-###, DD-### etc.)
     signal_ids = set()
     for f in feedback:
-        for match in re.findall(r"(ADR|KI|DD|PF|XC)-\d+", f.get("source_file", "")):
+        for match in re.findall(r"(?:ADR|KI|DD|PF|XC)-\d+", f.get("source_file", "")):
             signal_ids.add(match)
-        for match in re.findall(r"(ADR|KI|DD|PF|XC)-\d+", f.get("content_summary", "")):
+        for match in re.findall(r"(?:ADR|KI|DD|PF|XC)-\d+", f.get("content_summary", "")):
             signal_ids.add(match)
 
     if not signal_ids:
         return impact
 
-    # Scan all scaffold docs for references to these signal IDs
+    # Look up references to these signal IDs in the doc index
     scan_dirs = ["design", "design/systems", "reference", "engine", "inputs",
                  "phases", "slices", "specs", "tasks"]
 
     for scan_dir in scan_dirs:
-        dir_path = SCAFFOLD_DIR / scan_dir
-        if not dir_path.exists():
-            continue
-        for doc in sorted(dir_path.glob("*.md")):
-            if doc.name.startswith("_"):
-                continue
-            content = doc.read_text(encoding="utf-8")
-            rel = str(doc.relative_to(SCAFFOLD_DIR))
-            for sid in signal_ids:
-                if sid in content:
-                    impact.setdefault(sid, []).append(rel)
+        for sid in sorted(signal_ids):
+            for rel in doc_index.referencing(sid, scan_dir):
+                if Path(rel).name.startswith("_"):
+                    continue
+                impact.setdefault(sid, []).append(rel)
 
     return impact
 
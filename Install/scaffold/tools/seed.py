@@ -16,6 +16,14 @@ Commands:
     resolve      Read result.json, process it, write next action.json.
 """
 
+import daemon
+import startup_profile
+
+if __name__ == "__main__":
+    # --profile-startup: re-run under -X importtime and report (startup_profile.py)
+    startup_profile.from_argv(__file__)
+    daemon.forward_cli("seed")
+
 import json
 import os
 import sys
@@ -25,6 +33,11 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+import config_loader
+import dep_graph
+import doc_index
+import session_journal
+
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -38,133 +51,13 @@ ACTION_FILE = REVIEWS_DIR / "action.json"
 RESULT_FILE = REVIEWS_DIR / "result.json"
 
 
-# ---------------------------------------------------------------------------
-# YAML Parser (shared)
-# ---------------------------------------------------------------------------
-
-def _parse_yaml_value(val):
-    val = val.strip()
-    if val == "" or val == "~" or val == "null":
-        return None
-    if val == "true" or val == "True":
-        return True
-    if val == "false" or val == "False":
-        return False
-    try:
-        return int(val)
-    except ValueError:
-        pass
-    try:
-        return float(val)
-    except ValueError:
-        pass
-    if (val.startswith('"') and val.endswith('"')) or \
-       (val.startswith("'") and val.endswith("'")):
-        return val[1:-1]
-    return val
-
-
-def _count_indent(line):
-    return len(line) - len(line.lstrip())
-
-
-def load_yaml(path):
-    """Load a YAML file. Uses PyYAML if available, falls back to custom parser."""
-    path = Path(path)
-    if not path.exists():
-        return None
-    content = path.read_text(encoding="utf-8")
-    try:
-        import yaml
-        return yaml.safe_load(content)
-    except ImportError:
-        lines = content.splitlines()
-        return _parse_yaml_block(lines, 0, 0)[0]
-
-
-def _parse_yaml_block(lines, start, base_indent):
-    result = {}
-    i = start
-    is_list = False
-    result_list = []
-    while i < len(lines):
-        line = lines[i]
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            i += 1
-            continue
-        indent = _count_indent(line)
-        if indent < base_indent:
-            break
-        if indent == base_indent:
-            if stripped.startswith("- "):
-                is_list = True
-                item_text = stripped[2:].strip()
-                if ":" in item_text and not item_text.startswith('"'):
-                    colon_pos = item_text.index(":")
-                    key = item_text[:colon_pos].strip()
-                    val_text = item_text[colon_pos + 1:].strip()
-                    item_dict = {key: _parse_yaml_value(val_text)} if val_text else {key: None}
-                    next_i = i + 1
-                    if next_i < len(lines):
-                        ns = lines[next_i].strip()
-                        ni = _count_indent(lines[next_i]) if ns else 0
-                        if ns and ni > indent:
-                            child, next_i = _parse_yaml_block(lines, next_i, ni)
-                            if not val_text:
-                                item_dict[key] = child
-                            i = next_i
-                            result_list.append(item_dict)
-                            continue
-                    i += 1
-                    result_list.append(item_dict)
-                    continue
-                else:
-                    result_list.append(_parse_yaml_value(item_text))
-                    i += 1
-                    continue
-            if ":" in stripped:
-                colon_pos = stripped.index(":")
-                key = stripped[:colon_pos].strip()
-                val_text = stripped[colon_pos + 1:].strip()
-                if val_text.startswith("[") and val_text.endswith("]"):
-                    inner = val_text[1:-1]
-                    items = [_parse_yaml_value(x.strip()) for x in inner.split(",")] if inner.strip() else []
-                    result[key] = items
-                    i += 1
-                    continue
-                if val_text:
-                    result[key] = _parse_yaml_value(val_text)
-                    i += 1
-                    continue
-                next_i = i + 1
-                while next_i < len(lines) and not lines[next_i].strip():
-                    next_i += 1
-                if next_i < len(lines):
-                    ni = _count_indent(lines[next_i])
-                    if ni > base_indent:
-                        child, next_i = _parse_yaml_block(lines, next_i, ni)
-                        result[key] = child
-                        i = next_i
-                        continue
-                result[key] = None
-                i += 1
-                continue
-        i += 1
-    if is_list:
-        return result_list, i
-    return result, i
-
-
 # ---------------------------------------------------------------------------
 # Config & Session
 # ---------------------------------------------------------------------------
 
 def load_layer_config(layer):
     config_path = CONFIGS_DIR / f"{layer}.yaml"
-    if not config_path.exists():
-        return None
-    return load_yaml(config_path)
+    return config_loader.load_config(config_path, "seed")
 
 
 def _session_id(layer, target):
@@ -179,18 +72,11 @@ def _session_path(session_id):
 
 
 def _load_session(session_id):
-    path = _session_path(session_id)
-    if not path.exists():
-        return None
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    return session_journal.load(_session_path(session_id))
 
 
 def _save_session(session_id, data):
-    path = _session_path(session_id)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    session_journal.save(_session_path(session_id), data)
 
 
 def _write_action(data):
@@ -450,8 +336,7 @@ def _analyze_existing(config, inventory, requirements):
 
     elif output_pattern:
         # Glob pattern (systems, specs, tasks, slices, phases, engine)
-        matches = sorted(SCAFFOLD_DIR.glob(output_pattern))
-        existing_paths = [str(m.relative_to(SCAFFOLD_DIR)) for m in matches]
+        existing_paths = doc_index.find_docs(output_pattern)
 
     if existing_paths:
         analysis["has_existing"] = True
@@ -460,29 +345,22 @@ def _analyze_existing(config, inventory, requirements):
 
         for f in existing_paths:
             abs_path = SCAFFOLD_DIR / f
-            if not abs_path.exists():
+            entry = doc_index.get_doc(f)
+            if not abs_path.exists() or entry is None:
                 continue
-            content = abs_path.read_text(encoding="utf-8")
-
-            # Check status
-            status_match = re.search(r">\s*\*\*Status:\*\*\s*(\w+)", content)
-            status = status_match.group(1) if status_match else "Unknown"
 
-            # Check traceability references
-            implements = re.search(r">\s*\*\*Implements:\*\*\s*(\S+)", content)
-            system = re.search(r">\s*\*\*System:\*\*\s*(\S+)", content)
-
-            # Check section fill for fixed-target docs
+            # Status and traceability references come from the doc index
             summary = {
                 "file": f,
-                "status": status,
-                "implements": implements.group(1) if implements else None,
-                "system": system.group(1) if system else None,
+                "status": entry["status"] or "Unknown",
+                "implements": entry["meta"].get("implements"),
+                "system": entry["meta"].get("system"),
             }
 
             # For fixed-target or small file sets, check section completeness
             if target or len(existing_paths) <= 10:
-                headings = [line.strip() for line in content.splitlines() if line.strip().startswith("#")]
+                content = abs_path.read_text(encoding="utf-8")
+                headings = entry["headings"]
                 filled = 0
                 empty = 0
                 for heading in headings:
@@ -501,32 +379,30 @@ def _analyze_existing(config, inventory, requirements):
             analysis["existing_summaries"].append(summary)
 
     # Check for stale references (docs that reference things that no longer exist)
+    ref_dirs = {
+        "SYS": "design/systems",
+        "SPEC": "specs",
+        "TASK": "tasks",
+        "SLICE": "slices",
+        "PHASE": "phases",
+    }
+    index = doc_index.get_index()
+    known_ids = {
+        entry["id"] for rel, entry in index.items()
+        if entry.get("id") and rel.rsplit("/", 1)[0] == ref_dirs.get(entry["id"].split("-")[0])
+    }
     for f in analysis.get("existing_files", []):
-        abs_path = SCAFFOLD_DIR / f
-        if abs_path.exists():
-            content = abs_path.read_text(encoding="utf-8")
-            # Check for references to non-existent docs
-            for ref_match in re.finditer(r"(SYS|SPEC|TASK|SLICE|PHASE)-\d+", content):
-                ref_id = ref_match.group()
-                # Try to find the referenced file
-                ref_patterns = {
-                    "SYS": "design/systems/SYS-*",
-                    "SPEC": "specs/SPEC-*",
-                    "TASK": "tasks/TASK-*",
-                    "SLICE": "slices/SLICE-*",
-                    "PHASE": "phases/PHASE-*",
-                }
-                prefix = re.match(r"(SYS|SPEC|TASK|SLICE|PHASE)", ref_id).group()
-                pattern = ref_patterns.get(prefix, "")
-                if pattern:
-                    matches = list(SCAFFOLD_DIR.glob(f"{pattern}"))
-                    ref_found = any(ref_id in str(m) for m in matches)
-                    if not ref_found:
-                        analysis["stale"].append({
-                            "file": f,
-                            "reference": ref_id,
-                            "issue": f"References {ref_id} but no matching file found",
-                        })
+        entry = index.get(f)
+        if entry is None:
+            continue
+        # Check for references to non-existent docs
+        for ref_id in entry["refs"]:
+            if ref_id.split("-")[0] in ref_dirs and ref_id not in known_ids:
+                analysis["stale"].append({
+                    "file": f,
+                    "reference": ref_id,
+                    "issue": f"References {ref_id} but no matching file found",
+                })
 
     return analysis
 
@@ -711,35 +587,22 @@ def _summarize_created_docs(created_docs):
 
 
 def _topological_sort(candidates):
-    """Sort candidates by dependencies. Returns ordered list."""
-    # Build adjacency
+    """Sort candidates by dependencies (dep_graph). Returns ordered list.
+    Candidates in or behind a cycle go last with _cycle_warning; actual
+    cycle members also list their cycle."""
     id_to_candidate = {c.get("proposed_id", f"c{i}"): c for i, c in enumerate(candidates)}
-    in_degree = {cid: 0 for cid in id_to_candidate}
-    graph = {cid: [] for cid in id_to_candidate}
-
-    for cid, candidate in id_to_candidate.items():
-        for dep in candidate.get("depends_on", []):
-            if dep in graph:
-                graph[dep].append(cid)
-                in_degree[cid] = in_degree.get(cid, 0) + 1
-
-    # Kahn's algorithm
-    queue = [cid for cid, deg in in_degree.items() if deg == 0]
-    result = []
-
-    while queue:
-        node = queue.pop(0)
-        result.append(id_to_candidate[node])
-        for neighbor in graph.get(node, []):
-            in_degree[neighbor] -= 1
-            if in_degree[neighbor] == 0:
-                queue.append(neighbor)
+    graph = dep_graph.analyze(list(id_to_candidate),
+                              {cid: c.get("depends_on", []) for cid, c in id_to_candidate.items()})
+    result = [id_to_candidate[cid] for cid in graph["order"]]
 
     # If there are remaining nodes, there's a cycle — append them anyway with warning
-    remaining = [id_to_candidate[cid] for cid in id_to_candidate if cid not in [c.get("proposed_id") for c in result]]
-    for r in remaining:
-        r["_cycle_warning"] = True
-        result.append(r)
+    cycle_of = {cid: cycle for cycle in graph["cycles"] for cid in cycle}
+    for cid in graph["blocked"]:
+        candidate = id_to_candidate[cid]
+        candidate["_cycle_warning"] = True
+        if cid in cycle_of:
+            candidate["cycle"] = cycle_of[cid]
+        result.append(candidate)
 
     return result
 
@@ -807,9 +670,7 @@ def cmd_next_action(args):
 
     # Discard exhausted sessions so re-running starts fresh
     if session and session.get("phase") == "done":
-        session_path = _session_path(session_id)
-        if session_path.exists():
-            session_path.unlink()
+        session_journal.delete(_session_path(session_id))
         session = None
 
     if not session:
@@ -1154,7 +1015,8 @@ def _update_upstream_after_creation(layer, created_file, candidate, config):
         spec_match = re.search(r"SPEC-\d+", spec_id)
         if spec_match:
             spec_ref = spec_match.group()
-            for slice_file in SCAFFOLD_DIR.glob("slices/SLICE-*-*.md"):
+            for slice_rel in doc_index.referencing(spec_ref, "slices", section="### Specs Included"):
+                slice_file = SCAFFOLD_DIR / slice_rel
                 content = slice_file.read_text(encoding="utf-8")
                 # Match spec ID only in Specs Included section (not in notes/changelog)
                 specs_section = _extract_section_content(content, "### Specs Included")
@@ -1172,8 +1034,9 @@ def _update_upstream_after_creation(layer, created_file, candidate, config):
         source = candidate.get("source", "")
         slice_match = re.search(r"SLICE-\d+", source)
         if slice_match:
-            slice_ref = slice_match.group()
-            for slice_file in SCAFFOLD_DIR.glob(f"slices/{slice_ref}-*.md"):
+            slice_rel = doc_index.find_doc(slice_match.group(), "slices")
+            if slice_rel:
+                slice_file = SCAFFOLD_DIR / slice_rel
                 content = slice_file.read_text(encoding="utf-8")
                 if new_id not in content:
                     content = _add_table_row(
@@ -1181,15 +1044,15 @@ def _update_upstream_after_creation(layer, created_file, candidate, config):
                         f"| {new_id} | {doc_name} |"
                     )
                     _update_last_updated(content, slice_file, today)
-                    break
 
     elif layer == "slices":
         # Add slice to parent phase's references
         phase_id = candidate.get("source", "")
         phase_match = re.search(r"PHASE-\d+", phase_id)
         if phase_match:
-            phase_ref = phase_match.group()
-            for phase_file in SCAFFOLD_DIR.glob(f"phases/{phase_ref}-*.md"):
+            phase_rel = doc_index.find_doc(phase_match.group(), "phases")
+            if phase_rel:
+                phase_file = SCAFFOLD_DIR / phase_rel
                 content = phase_file.read_text(encoding="utf-8")
                 if new_id not in content:
                     content = _add_table_row(
@@ -1197,7 +1060,6 @@ def _update_upstream_after_creation(layer, created_file, candidate, config):
                         f"| {new_id} | {doc_name} | Draft |"
                     )
                     _update_last_updated(content, phase_file, today)
-                    break
 
     elif layer == "systems":
         # Add system to design doc's System Design Index
@@ -1221,6 +1083,7 @@ def _update_upstream_after_creation(layer, created_file, candidate, config):
                     f"| {new_id} | {doc_name} | Draft |"
                 )
                 sys_index.write_text(idx_content, encoding="utf-8")
+                doc_index.update_doc(sys_index)
 
     elif layer == "phases":
         # Add phase to roadmap
@@ -1280,6 +1143,7 @@ def _update_last_updated(content, file_path, today):
         content
     )
     file_path.write_text(content, encoding="utf-8")
+    doc_index.update_doc(file_path)
 
 
 # ---------------------------------------------------------------------------
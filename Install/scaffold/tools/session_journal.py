@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Session journal — append-only persistence for long-running session state.
+
+The orchestrators (iterate.py, local-review.py, implement.py, seed.py) save
+their whole session dict after every state change. Late in a long session
+that dict holds hundreds of KB of queue items, adjudications and issue
+lists, and rewriting all of it for each small step dominates the cost.
+
+Instead, the session file session-<id>.json is a snapshot, and each save
+appends only what changed since the previous save to a journal next to it:
+
+    session-<id>.json           snapshot (plain JSON, plus "_journal_seq")
+    session-<id>.journal.jsonl  {"seq": n, "ops": [[op, path, value], ...]}
+
+ops are "set" (path -> value), "del" (path) and "append" (extend the list
+at path). load() reads the snapshot and replays the journal entries newer
+than its _journal_seq, so callers get the same dict as before. Once the
+journal has COMPACT_EVERY entries or outgrows the snapshot, the next save
+writes a fresh snapshot (temp file + os.replace) and removes the journal.
+
+Crash safety: a crash between replacing the snapshot and removing the
+journal leaves entries the snapshot already contains — their seq is not
+newer, so they are skipped. A torn final line (crash mid-append) is dropped
+and cut off on the next load. If the files were written by another process
+since this one last loaded or saved them, save() writes a full snapshot
+rather than a delta against stale state.
+
+Usage:
+    import session_journal
+
+    state = session_journal.load(path)     # None if there is no session
+    session_journal.save(path, state)
+    session_journal.delete(path)
+
+Commands:
+    show <session.json>      Print the reconstructed state.
+    compact <session.json>   Fold the journal into a fresh snapshot.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+
+# Journal entries (or journal bytes beyond the snapshot's size) before the
+# next save rewrites the snapshot
+COMPACT_EVERY = 100
+
+_SEQ_KEY = "_journal_seq"
+
+_lock = threading.Lock()
+_cache = {}  # snapshot path -> {"state", "seq", "entries", "journal_bytes", "snapshot_bytes", "snapshot_mtime"}
+
+
+# ---------------------------------------------------------------------------
+# Deltas
+# ---------------------------------------------------------------------------
+
+def _same(a, b):
+    """Equal as JSON, at every depth. Python treats 1, 1.0 and True as
+    equal; the journal must not, or a change between them is never recorded."""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_same(v, b[k]) for k, v in a.items())
+    if isinstance(a, list):
+        return len(a) == len(b) and all(map(_same, a, b))
+    return a == b
+
+
+def _diff(old, new, path, ops):
+    """Append the ops that turn old into new (at path) to ops."""
+    if type(old) is not type(new):
+        ops.append(["set", path, new])
+    elif isinstance(new, dict):
+        for k in old:
+            if k not in new:
+                ops.append(["del", path + [k]])
+        for k, v in new.items():
+            if k not in old:
+                ops.append(["set", path + [k], v])
+            elif not _same(old[k], v):
+                _diff(old[k], v, path + [k], ops)
+    elif isinstance(new, list) and len(new) >= len(old):
+        for i in range(len(old)):
+            if not _same(old[i], new[i]):
+                _diff(old[i], new[i], path + [i], ops)
+        if len(new) > len(old):
+            ops.append(["append", path, new[len(old):]])
+    elif not _same(old, new):
+        ops.append(["set", path, new])
+
+
+def _apply(state, op):
+    """Apply one op to state in place; returns the (possibly replaced) root."""
+    kind, path = op[0], op[1]
+    if not path:
+        return op[2] if kind == "set" else state
+    if kind == "append":
+        target = state
+        for p in path:
+            target = target[p]
+        target.extend(op[2])
+        return state
+    parent = state
+    for p in path[:-1]:
+        parent = parent[p]
+    if kind == "set":
+        parent[path[-1]] = op[2]
+    elif kind == "del":
+        del parent[path[-1]]
+    return state
+
+
+# ---------------------------------------------------------------------------
+# Files
+# ---------------------------------------------------------------------------
+
+def journal_path(path):
+    path = Path(path)
+    return path.with_name(path.stem + ".journal.jsonl")
+
+
+def _copy(state):
+    return json.loads(json.dumps(state))
+
+
+def _stat(path):
+    """(size, mtime_ns) of a file, or (0, 0) if it does not exist."""
+    try:
+        st = os.stat(path)
+        return st.st_size, st.st_mtime_ns
+    except OSError:
+        return 0, 0
+
+
+def _read_journal(path, after_seq):
+    """Journal entries newer than after_seq. A torn final line is cut off.
+    Returns (entries, last seq seen)."""
+    jpath = journal_path(path)
+    try:
+        raw = jpath.read_bytes()
+    except OSError:
+        return [], after_seq
+    entries, good, last_seq = [], 0, after_seq
+    for line in raw.splitlines(keepends=True):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            # Crash mid-append — only ever the last line
+            with open(jpath, "r+b") as f:
+                f.truncate(good)
+            break
+        good += len(line)
+        last_seq = max(last_seq, record.get("seq", 0))
+        if record.get("seq", 0) > after_seq:
+            entries.append(record)
+    return entries, last_seq
+
+
+def _write_snapshot(path, state, seq):
+    """Atomically replace the snapshot, then drop the journal it covers."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.tmp{os.getpid()}.{threading.get_ident()}")
+    data = json.dumps({**state, _SEQ_KEY: seq}, indent=2)
+    tmp.write_text(data, encoding="utf-8")
+    os.replace(tmp, path)
+    journal_path(path).unlink(missing_ok=True)
+    size, mtime = _stat(path)
+    _cache[str(path)] = {"state": _copy(state), "seq": seq, "entries": 0, "journal_bytes": 0,
+                         "snapshot_bytes": size, "snapshot_mtime": mtime}
+
+
+def _in_sync(path, entry):
+    """True if neither file changed since this process last touched them."""
+    return (_stat(path)[1] == entry["snapshot_mtime"]
+            and _stat(journal_path(path))[0] == entry["journal_bytes"])
+
+
+# ---------------------------------------------------------------------------
+# Load & Save
+# ---------------------------------------------------------------------------
+
+def load(path):
+    """Session state from the snapshot plus journal, or None if absent."""
+    path = Path(path)
+    with _lock:
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        state = json.loads(text)
+        seq = state.pop(_SEQ_KEY, 0)
+        records, _ = _read_journal(path, seq)
+        for record in records:
+            for op in record["ops"]:
+                state = _apply(state, op)
+            seq = record["seq"]
+        size, mtime = _stat(path)
+        _cache[str(path)] = {"state": _copy(state), "seq": seq, "entries": len(records),
+                             "journal_bytes": _stat(journal_path(path))[0],
+                             "snapshot_bytes": size, "snapshot_mtime": mtime}
+        return state
+
+
+def save(path, state):
+    """Persist state: append its delta to the journal, or write a snapshot
+    when there is no usable base or the journal is due for compaction."""
+    path = Path(path)
+    with _lock:
+        entry = _cache.get(str(path))
+        if entry is None or not _in_sync(path, entry):
+            # No trustworthy base — snapshot past any journal entries on disk
+            seq = _read_journal(path, 0)[1] if journal_path(path).exists() else 0
+            _write_snapshot(path, state, max(seq, entry["seq"] if entry else 0))
+            return
+
+        # Diff what a snapshot would hold: int keys as strings, tuples as lists
+        state = _copy(state)
+        ops = []
+        _diff(entry["state"], state, [], ops)
+        if not ops:
+            return
+        if entry["entries"] >= COMPACT_EVERY or entry["journal_bytes"] > entry["snapshot_bytes"]:
+            _write_snapshot(path, state, entry["seq"])
+            return
+
+        seq = entry["seq"] + 1
+        line = (json.dumps({"seq": seq, "ops": ops}, separators=(",", ":")) + "\n").encode("utf-8")
+        with open(journal_path(path), "ab") as f:
+            f.write(line)
+        entry.update(state=state, seq=seq, entries=entry["entries"] + 1,
+                     journal_bytes=entry["journal_bytes"] + len(line))
+
+
+def compact(path):
+    """Fold the journal into a fresh snapshot. Returns False if there is no session."""
+    state = load(path)
+    if state is None:
+        return False
+    with _lock:
+        _write_snapshot(path, state, _cache[str(Path(path))]["seq"])
+    return True
+
+
+def delete(path):
+    """Remove a session's snapshot and journal."""
+    path = Path(path)
+    with _lock:
+        _cache.pop(str(path), None)
+        path.unlink(missing_ok=True)
+        journal_path(path).unlink(missing_ok=True)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Session snapshot + journal files")
+    sub = parser.add_subparsers(dest="command")
+    p_show = sub.add_parser("show", help="Print the reconstructed state")
+    p_show.add_argument("path")
+    p_compact = sub.add_parser("compact", help="Fold the journal into a fresh snapshot")
+    p_compact.add_argument("path")
+
+    args = parser.parse_args()
+    if args.command == "show":
+        state = load(args.path)
+        if state is None:
+            print(json.dumps({"error": f"No session at {args.path}"}))
+            sys.exit(1)
+        print(json.dumps(state, indent=2))
+    elif args.command == "compact":
+        ok = compact(args.path)
+        print(json.dumps({"status": "ok" if ok else "error", "path": args.path}))
+        sys.exit(0 if ok else 1)
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+SSE stream — streaming reviewer responses with incremental issue parsing.
+
+A non-streaming review call returns nothing until the whole response has
+been generated; if the connection drops or the 180s timeout fires, all of it
+is lost. With streaming on, the reviewers (adversarial-review.py,
+code-review.py) ask the provider for server-sent events instead, collect the
+text deltas as they arrive, and feed them to an incremental parser that
+yields each element of the response's "issues" array as soon as its closing
+brace is seen.
+
+Token usage reported in the stream (OpenAI's final usage chunk, Anthropic's
+message_start / message_delta, Google's usageMetadata) is collected and put
+back into the assembled body, so prompt-cache hits are visible either way.
+
+If the stream stops early (dropped connection, read timeout, or the model
+hit max_tokens), the issues completed so far are kept: the reviewer returns
+them with "_partial": true instead of failing the whole review.
+
+Provider formats handled:
+    OpenAI     "stream": true — data: {choices[0].delta.content}, data: [DONE]
+    Anthropic  "stream": true — content_block_delta / message_stop events
+    Google     :streamGenerateContent?alt=sse — data: {candidates[0].content.parts}
+
+Settings (review_config.json, optional):
+    "stream": false
+
+Usage:
+    import sse_stream
+
+    url, payload = sse_stream.prepare("openai", url, payload)
+    status, headers, lines = http_pool.post_stream(url, data, headers)
+    usage = {}
+    text, error = sse_stream.read("openai", lines, on_text=callback, usage=usage)
+    body = sse_stream.assemble("openai", text, usage)
+
+    parser = sse_stream.issue_parser()
+    for issue in sse_stream.feed(parser, chunk): ...
+"""
+
+import json
+
+
+# finish/stop reasons that mean the model ran out of output tokens
+_TRUNCATED = {"length", "max_tokens", "MAX_TOKENS"}
+
+
+# ---------------------------------------------------------------------------
+# Settings & Requests
+# ---------------------------------------------------------------------------
+
+def enabled(config=None):
+    return bool((config or {}).get("stream", False))
+
+
+def prepare(provider, url, payload):
+    """Return (url, payload) asking the provider for an SSE stream."""
+    payload = dict(payload)
+    if provider == "google":
+        url = url.replace(":generateContent?", ":streamGenerateContent?alt=sse&", 1)
+    else:
+        payload["stream"] = True
+        if provider == "openai":
+            payload["stream_options"] = {"include_usage": True}
+    return url, payload
+
+
+def assemble(provider, text, usage=None):
+    """A response body in the provider's non-streaming shape, holding text
+    (and the usage collected by read(), if any)."""
+    if provider == "anthropic":
+        body = {"content": [{"type": "text", "text": text}]}
+    elif provider == "google":
+        body = {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+    else:
+        body = {"choices": [{"message": {"content": text}}]}
+    if usage:
+        body["usageMetadata" if provider == "google" else "usage"] = usage
+    return body
+
+
+# ---------------------------------------------------------------------------
+# Event Stream
+# ---------------------------------------------------------------------------
+
+def events(lines):
+    """Yield (event, data) pairs from raw SSE lines (bytes)."""
+    event, data = "", []
+    for raw in lines:
+        line = raw.decode("utf-8").rstrip("\r\n")
+        if not line:
+            if data:
+                yield event, "\n".join(data)
+            event, data = "", []
+        elif line.startswith(":"):
+            continue  # Comment / keep-alive
+        else:
+            field, _, value = line.partition(":")
+            value = value[1:] if value.startswith(" ") else value
+            if field == "event":
+                event = value
+            elif field == "data":
+                data.append(value)
+    if data:
+        yield event, "\n".join(data)
+
+
+def _delta(provider, event, payload):
+    """(text, finish_reason) carried by one decoded event."""
+    if provider == "anthropic":
+        kind = payload.get("type", event)
+        if kind == "content_block_delta":
+            return payload.get("delta", {}).get("text", ""), None
+        if kind == "message_delta":
+            return "", payload.get("delta", {}).get("stop_reason")
+        if kind == "message_stop":
+            return "", "end_turn"
+        return "", None
+    if provider == "google":
+        candidate = (payload.get("candidates") or [{}])[0]
+        parts = candidate.get("content", {}).get("parts", [])
+        return "".join(p.get("text", "") for p in parts), candidate.get("finishReason")
+    choice = (payload.get("choices") or [{}])[0]
+    return choice.get("delta", {}).get("content") or "", choice.get("finish_reason")
+
+
+def _usage(provider, event, payload):
+    """Usage fields (provider's own names) carried by one decoded event."""
+    if provider == "anthropic":
+        kind = payload.get("type", event)
+        if kind == "message_start":
+            return payload.get("message", {}).get("usage") or {}
+        if kind == "message_delta":
+            return payload.get("usage") or {}
+        return {}
+    if provider == "google":
+        return payload.get("usageMetadata") or {}  # Cumulative — last one wins
+    return payload.get("usage") or {}
+
+
+def read(provider, lines, on_text=None, usage=None):
+    """Consume an event stream. Returns (text, error): error is None when the
+    response completed, otherwise why it stopped early (text holds what
+    arrived). on_text(chunk) is called for every text delta; usage (a dict)
+    is filled with the token counts the stream reports."""
+    import http.client
+
+    chunks = []
+    finish = None
+    try:
+        for event, data in events(lines):
+            if data == "[DONE]":
+                finish = finish or "stop"
+                continue  # Read to the end so the connection can be reused
+            payload = json.loads(data)
+            if event == "error" or "error" in payload:
+                err = payload.get("error", payload)
+                message = err.get("message", str(err)) if isinstance(err, dict) else str(err)
+                return "".join(chunks), f"provider error: {message}"
+            if usage is not None:
+                usage.update(_usage(provider, event, payload))
+            text, reason = _delta(provider, event, payload)
+            if text:
+                chunks.append(text)
+                if on_text:
+                    on_text(text)
+            if reason and finish not in _TRUNCATED:
+                finish = reason
+    except (OSError, http.client.HTTPException, ValueError) as e:
+        return "".join(chunks), f"stream interrupted: {e or type(e).__name__}"
+    if finish is None:
+        return "".join(chunks), "stream ended before the response was complete"
+    if finish in _TRUNCATED:
+        return "".join(chunks), "response truncated at max_tokens"
+    return "".join(chunks), None
+
+
+# ---------------------------------------------------------------------------
+# Incremental Issue Parser
+# ---------------------------------------------------------------------------
+
+def issue_parser():
+    """New parser state for feed()."""
+    return {
+        "buf": "", "pos": 0, "depth": 0, "in_str": False, "esc": False,
+        "str_start": 0, "last_str": None, "in_issues": False, "done": False,
+        "item_start": -1,
+    }
+
+
+def feed(state, text):
+    """Add a chunk of response text; return the issues it completed.
+
+    Tracks string/nesting state character by character from the first "{".
+    Objects directly inside the top-level "issues" array are decoded the
+    moment their closing brace arrives. Text before the JSON (preamble,
+    a ```json fence) is skipped."""
+    state["buf"] += text
+    buf = state["buf"]
+    depth, in_str, esc = state["depth"], state["in_str"], state["esc"]
+    item_start, in_issues = state["item_start"], state["in_issues"]
+    out = []
+
+    for i in range(state["pos"], len(buf)):
+        c = buf[i]
+        if in_str:
+            if esc:
+                esc = False
+            elif c == "\\":
+                esc = True
+            elif c == '"':
+                in_str = False
+                if depth == 1:
+                    state["last_str"] = buf[state["str_start"] + 1:i]
+            continue
+        if depth == 0 and c != "{":
+            continue  # Before the JSON object
+        if c == '"':
+            in_str = True
+            state["str_start"] = i
+        elif c in "{[":
+            if c == "[" and depth == 1 and state["last_str"] == "issues" and not state["done"]:
+                in_issues = True
+            elif c == "{" and in_issues and depth == 2:
+                item_start = i
+            depth += 1
+        elif c in "}]":
+            depth -= 1
+            if c == "}" and in_issues and depth == 2 and item_start >= 0:
+                try:
+                    out.append(json.loads(buf[item_start:i + 1]))
+                except ValueError:
+                    pass
+                item_start = -1
+            elif c == "]" and in_issues and depth == 1:
+                in_issues = False
+                state["done"] = True
+
+    state.update(pos=len(buf), depth=depth, in_str=in_str, esc=esc,
+                 item_start=item_start, in_issues=in_issues)
+    return out
+
+
+def complete_issues(text):
+    """Every fully received issue in a (possibly truncated) response."""
+    return feed(issue_parser(), text)
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Startup profile — cold-start timing for the tools CLIs.
+
+Quick commands (iterate.py preflight, utils.py reorder, validate.py
+preflight) run once per dispatcher step, so their cost is mostly interpreter
+startup and module imports. This module measures that cost and guards it:
+
+- Every orchestrator CLI accepts --profile-startup. The command is re-run in
+  a child interpreter under `-X importtime` with SCAFFOLD_NO_DAEMON=1, so it
+  measures an in-process cold start. The child's output is passed through,
+  and a report (wall time, time in imports, slowest top-level imports) is
+  printed to stderr.
+- `bench` times each command in BUDGETS from a fresh interpreter and fails
+  if the median exceeds its budget, or if the command itself fails (non-zero
+  exit or "status": "error"). Run it after changing imports.
+
+Its own top-level imports are kept to os, sys and pathlib — every CLI
+imports it first.
+
+Usage:
+    python scaffold/tools/iterate.py preflight --layer design --profile-startup
+    python scaffold/tools/startup_profile.py report utils.py reorder
+    python scaffold/tools/startup_profile.py bench --runs 5
+
+Commands:
+    report <tool.py> [args ...]   Run one command and print its import-time report.
+    bench                         Time each quick command cold; fail if any exceeds its budget.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).parent
+
+FLAG = "--profile-startup"
+
+# (tool, argv, budget in ms) — cold start with compiled bytecode, no daemon
+BUDGETS = [
+    ("iterate.py", ["preflight", "--layer", "design"], 110),
+    ("local-review.py", ["preflight", "--layer", "design"], 100),
+    ("seed.py", ["preflight", "--layer", "design"], 100),
+    ("validate.py", ["preflight", "--scope", "design"], 100),
+    ("utils.py", ["reorder"], 100),
+]
+
+
+# ---------------------------------------------------------------------------
+# Profiling
+# ---------------------------------------------------------------------------
+
+def _child_env():
+    return {**os.environ, "SCAFFOLD_NO_DAEMON": "1"}
+
+
+def _parse_importtime(stderr):
+    """Split -X importtime output from the command's own stderr.
+    Returns (top-level imports, other stderr lines)."""
+    imports, other = [], []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            other.append(line)
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header
+        name = fields[2][1:]
+        if name.startswith(" "):
+            continue  # nested — counted in its parent's cumulative time
+        imports.append({"module": name, "self_ms": int(fields[0]) / 1000,
+                        "cumulative_ms": int(fields[1]) / 1000,
+                        "tool": (TOOLS_DIR / f"{name}.py").exists()})
+    return imports, other
+
+
+def profile(script, argv):
+    """Run script with argv under -X importtime. Returns exit_code, stdout,
+    stderr (without the import lines), wall_ms, import_ms and imports."""
+    import subprocess
+    import time
+
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime", str(script)] + list(argv),
+                          capture_output=True, text=True, env=_child_env())
+    wall_ms = (time.perf_counter() - start) * 1000
+    imports, other = _parse_importtime(proc.stderr)
+    return {
+        "exit_code": proc.returncode,
+        "stdout": proc.stdout,
+        "stderr": "\n".join(other) + ("\n" if other else ""),
+        "wall_ms": round(wall_ms, 1),
+        "import_ms": round(sum(i["cumulative_ms"] for i in imports), 1),
+        "imports": sorted(imports, key=lambda i: -i["cumulative_ms"]),
+    }
+
+
+def format_report(label, result, top=10):
+    lines = [f"[startup] {label}: {result['wall_ms']:.1f} ms wall, "
+             f"{result['import_ms']:.1f} ms in imports (under -X importtime)"]
+    for entry in result["imports"][:top]:
+        kind = "tool" if entry["tool"] else "lib"
+        lines.append(f"[startup]   {entry['cumulative_ms']:7.1f} ms  {kind:4}  {entry['module']}")
+    return "\n".join(lines)
+
+
+def from_argv(script):
+    """Called first by each CLI. With --profile-startup in sys.argv, re-run
+    the command under the profiler, print the report and exit with its
+    status; otherwise return immediately."""
+    if FLAG not in sys.argv[1:]:
+        return
+    argv = [a for a in sys.argv[1:] if a != FLAG]
+    result = profile(script, argv)
+    sys.stdout.write(result["stdout"])
+    sys.stderr.write(result["stderr"])
+    label = " ".join([Path(script).name] + argv[:1])
+    print(format_report(label, result), file=sys.stderr)
+    sys.exit(result["exit_code"])
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+def _failure(proc):
+    """Why a benchmarked command did not do its work, or None. A command
+    that errors out early must not pass as fast."""
+    if proc.returncode != 0:
+        return f"exit code {proc.returncode}"
+    import json
+
+    try:
+        output = json.loads(proc.stdout)
+    except ValueError:
+        return None
+    if isinstance(output, dict) and output.get("status") == "error":
+        return output.get("message") or "status: error"
+    return None
+
+
+def _time_run(cmd):
+    """(elapsed ms, failure or None) for one run of cmd."""
+    import subprocess
+    import time
+
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+                          env=_child_env())
+    return (time.perf_counter() - start) * 1000, _failure(proc)
+
+
+def _median_ms(cmd, runs):
+    """(median ms, failure or None). The warm-up run writes bytecode and
+    fills the config cache; it also decides whether the command works."""
+    _, failure = _time_run(cmd)
+    if failure:
+        return None, failure
+    samples = sorted(_time_run(cmd)[0] for _ in range(runs))
+    return round(samples[len(samples) // 2], 1), None
+
+
+def bench(runs=5, scale=1.0):
+    """Median cold-start time per BUDGETS command against its budget
+    (multiplied by scale, for slow machines). A command that exits non-zero
+    or reports "status": "error" fails regardless of its time."""
+    interpreter_ms, _ = _median_ms([sys.executable, "-c", "pass"], runs)
+    results = []
+    for tool, argv, budget in BUDGETS:
+        median, failure = _median_ms([sys.executable, str(TOOLS_DIR / tool)] + argv, runs)
+        budget_ms = round(budget * scale, 1)
+        entry = {"command": " ".join([tool] + argv), "median_ms": median,
+                 "budget_ms": budget_ms, "ok": failure is None and median <= budget_ms}
+        if failure:
+            entry["error"] = failure
+        results.append(entry)
+    return {
+        "status": "ok" if all(r["ok"] for r in results) else "over_budget",
+        "runs": runs,
+        "interpreter_ms": interpreter_ms,
+        "results": results,
+    }
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main():
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Cold-start profiling for the tools CLIs")
+    sub = parser.add_subparsers(dest="command")
+    p_report = sub.add_parser("report", help="Run one command and print its import-time report")
+    p_report.add_argument("tool", help="Tool script, e.g. iterate.py")
+    p_report.add_argument("args", nargs=argparse.REMAINDER)
+    p_report.add_argument("--top", type=int, default=15)
+    p_bench = sub.add_parser("bench", help="Fail if any quick command's cold start exceeds its budget")
+    p_bench.add_argument("--runs", type=int, default=5)
+    p_bench.add_argument("--scale", type=float, default=1.0, help="Multiply every budget (slow machines)")
+
+    args = parser.parse_args()
+    if args.command == "report":
+        script = TOOLS_DIR / Path(args.tool).name
+        if not script.exists():
+            print(json.dumps({"status": "error", "message": f"No such tool: {args.tool}"}))
+            sys.exit(1)
+        result = profile(script, args.args)
+        print(format_report(" ".join([script.name] + args.args[:1]), result, args.top))
+    elif args.command == "bench":
+        report = bench(max(1, args.runs), args.scale)
+        print(json.dumps(report, indent=2))
+        sys.exit(0 if report["status"] == "ok" else 1)
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
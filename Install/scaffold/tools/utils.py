@@ -3,26 +3,34 @@
 Shared utility functions for scaffold orchestrators.
 
 Provides mechanical operations that don't need Claude's judgment:
-- complete: mark a document as Complete (status, rename, index)
+- complete: mark documents as Complete (status, rename, index), batched
 - build_and_test: run build commands and test suites
-- reorder_tasks: topological sort by dependencies
+- reorder_tasks: topological sort by dependencies, with slack per task
 - These can be called as standalone commands or imported by orchestrators.
 
 Commands:
-    complete     Mark a scaffold doc as Complete.
+    complete     Mark scaffold docs as Complete (one, many, or --manifest).
     build-test   Run build and test commands.
-    reorder      Topological sort tasks by dependency.
+    reorder      Topological sort tasks by dependency (--summary: critical path, slack, cycles).
 """
 
+import startup_profile
+
+# --profile-startup: re-run under -X importtime and report (startup_profile.py)
+if __name__ == "__main__":
+    startup_profile.from_argv(__file__)
+
 import json
 import os
 import sys
 import argparse
 import re
-import subprocess
 from pathlib import Path
 from datetime import datetime
 
+import dep_graph
+import doc_index
+
 
 TOOLS_DIR = Path(__file__).parent
 SCAFFOLD_DIR = TOOLS_DIR.parent
@@ -36,25 +44,139 @@ PROJECT_ROOT = SCAFFOLD_DIR.parent
 def complete_doc(doc_path, scaffold_dir=None, ripple=True):
     """Mark a scaffold document as Complete. Updates status, renames file, updates index.
     If ripple=True, checks parent docs and completes them if all children are done."""
+    return complete_docs([doc_path], scaffold_dir, ripple)["results"][0]
+
+
+def complete_docs(doc_paths, scaffold_dir=None, ripple=True):
+    """Mark many scaffold documents as Complete in one pass.
+
+    Status changes, renames, parent-table updates and ripple all go through one
+    write batch: every shared file (slice, phase, roadmap.md, _index.md) is read
+    at most once and written once at the end, however many children changed.
+    Docs that were already completed by an earlier doc's ripple are skipped."""
     sd = Path(scaffold_dir) if scaffold_dir else SCAFFOLD_DIR
-    abs_path = sd / doc_path if not Path(doc_path).is_absolute() else Path(doc_path)
+    batch = _new_batch()
+    results = []
+
+    for doc_path in doc_paths:
+        doc_path = _resolve_doc_id(doc_path, sd)
+        abs_path = sd / doc_path if not Path(doc_path).is_absolute() else Path(doc_path)
+
+        if not abs_path.exists() or str(abs_path) in batch["renames"]:
+            done = _already_completed(abs_path, sd)
+            if done:
+                results.append({"status": "skip", "file": done,
+                                "message": f"Already Complete: {done}"})
+            else:
+                results.append({"status": "error", "message": f"File not found: {doc_path}"})
+            continue
 
-    if not abs_path.exists():
-        return {"status": "error", "message": f"File not found: {doc_path}"}
+        if (doc_index.get_doc(abs_path, sd) or {}).get("status") == "Complete":
+            rel = str(abs_path.relative_to(sd))
+            results.append({"status": "skip", "file": rel, "message": f"Already Complete: {rel}"})
+            continue
 
-    result = _complete_single(abs_path, sd)
+        result = _complete_single(abs_path, sd, batch)
 
-    # Ripple upward: task → spec → slice → phase
-    if ripple:
-        rippled = _ripple_complete(abs_path, sd)
-        result["rippled"] = rippled
+        # Ripple upward: task → spec → slice → phase — use the NEW path after rename
+        if ripple:
+            rippled = _ripple_complete(sd / result["file"], sd, batch)
+            result["rippled"] = rippled
 
-    return result
+        results.append(result)
+
+    written = _flush_batch(batch, sd)
+    return {
+        "status": "ok" if all(r["status"] != "error" for r in results) else "partial",
+        "results": results,
+        "files_read": batch["reads"],
+        "files_written": written,
+    }
+
+
+_PLANNING_DIRS = {"TASK": "tasks", "SPEC": "specs", "SLICE": "slices", "PHASE": "phases"}
+
+
+def _resolve_doc_id(doc_ref, sd):
+    """Accept a bare ID (TASK-001) as well as a path."""
+    ref = str(doc_ref)
+    id_match = re.fullmatch(r"(TASK|SPEC|SLICE|PHASE)-\d+", ref)
+    if not id_match:
+        return doc_ref
+    return doc_index.find_doc(ref, _PLANNING_DIRS[id_match.group(1)], sd) or doc_ref
 
 
-def _complete_single(abs_path, sd):
+def _already_completed(abs_path, sd):
+    """If a doc was renamed to _complete (e.g. by an earlier ripple in the same
+    batch), return its new relative path."""
+    id_match = re.match(r"(SYS|SPEC|TASK|SLICE|PHASE)-\d+", abs_path.name)
+    if not id_match:
+        return None
+    subdir = abs_path.parent.relative_to(sd).as_posix() if abs_path.parent != sd else ""
+    rel = doc_index.find_doc(id_match.group(), subdir, sd)
+    if rel and (doc_index.get_doc(rel, sd) or {}).get("status") == "Complete":
+        return rel
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Write batch — buffered reads/writes so each file is touched once per run
+# ---------------------------------------------------------------------------
+
+def _new_batch():
+    return {"files": {}, "dirty": set(), "renames": {}, "reads": 0}
+
+
+def _read_doc(path, batch):
+    """Read a doc through the batch buffer (disk is read at most once)."""
+    key = str(path)
+    if key not in batch["files"]:
+        batch["files"][key] = path.read_text(encoding="utf-8")
+        batch["reads"] += 1
+    return batch["files"][key]
+
+
+def _write_doc(path, content, batch):
+    """Buffer a write; the file is written by _flush_batch."""
+    key = str(path)
+    batch["files"][key] = content
+    batch["dirty"].add(key)
+
+
+def _rename_doc(old_path, new_path, sd, batch):
+    """Move buffered content and the index entry to the new name now; the
+    file itself is renamed by _flush_batch, after the content writes."""
+    old_key, new_key = str(old_path), str(new_path)
+    if old_key in batch["files"]:
+        batch["files"][new_key] = batch["files"].pop(old_key)
+    if old_key in batch["dirty"]:
+        batch["dirty"].discard(old_key)
+        batch["dirty"].add(new_key)
+    source = next((o for o, n in batch["renames"].items() if n == old_key), old_key)
+    batch["renames"][source] = new_key
+    doc_index.rename_doc(old_path, new_path, sd, batch["files"].get(new_key))
+
+
+def _flush_batch(batch, sd):
+    """Write every buffered file once, then apply the renames, so a crash
+    never leaves a renamed file with its old contents. Returns the number
+    of files written."""
+    on_disk = {new: old for old, new in batch["renames"].items()}
+    for key in sorted(batch["dirty"]):
+        Path(on_disk.get(key, key)).write_text(batch["files"][key], encoding="utf-8")
+    for old, new in batch["renames"].items():
+        Path(old).rename(new)
+    for key in sorted(batch["dirty"] | set(on_disk)):
+        doc_index.update_doc(Path(key), sd, batch["files"].get(key))
+    written = len(batch["dirty"])
+    batch["dirty"].clear()
+    batch["renames"].clear()
+    return written
+
+
+def _complete_single(abs_path, sd, batch):
     """Mark one doc as Complete. Returns result dict."""
-    content = abs_path.read_text(encoding="utf-8")
+    content = _read_doc(abs_path, batch)
 
     # Update status field
     content = re.sub(
@@ -79,28 +201,29 @@ def _complete_single(abs_path, sd):
             entry = f"\n> - {today}: Status → Complete."
             content = content[:insert_pos] + entry + content[insert_pos:]
 
-    abs_path.write_text(content, encoding="utf-8")
+    _write_doc(abs_path, content, batch)
 
     # Rename file — change status suffix
     old_name = abs_path.name
     new_name = re.sub(r"_(draft|review|approved)", "_complete", old_name)
     if new_name != old_name:
         new_path = abs_path.parent / new_name
-        abs_path.rename(new_path)
+        _rename_doc(abs_path, new_path, sd, batch)
         abs_path = new_path
+    else:
+        doc_index.update_doc(abs_path, sd, content)
 
     # Update index
-    index_files = list(abs_path.parent.glob("_index.md"))
-    if index_files:
-        index_path = index_files[0]
-        index_content = index_path.read_text(encoding="utf-8")
+    index_path = abs_path.parent / "_index.md"
+    if index_path.exists():
+        index_content = _read_doc(index_path, batch)
         index_content = index_content.replace(old_name, new_name)
         index_content = re.sub(
             rf"(\|\s*\[?{re.escape(old_name.split('_')[0])}[^\|]*\|[^\|]*\|)\s*\w+\s*\|",
             rf"\1 Complete |",
             index_content
         )
-        index_path.write_text(index_content, encoding="utf-8")
+        _write_doc(index_path, index_content, batch)
 
     return {
         "status": "ok",
@@ -110,7 +233,7 @@ def _complete_single(abs_path, sd):
     }
 
 
-def _ripple_complete(completed_path, sd):
+def _ripple_complete(completed_path, sd, batch):
     """Check if completing this doc triggers parent completion. Ripples upward.
     Also updates parent docs' tables to reflect the new status."""
     rippled = []
@@ -121,84 +244,84 @@ def _ripple_complete(completed_path, sd):
     # Determine doc type and find parent
     if "TASK-" in name:
         # Update parent slice's Tasks table with this task's new status
-        _update_parent_table_status(sd, "slices", completed_id, "Complete")
+        _update_parent_table_status(sd, "slices", completed_id, "Complete", batch)
 
         # Task → Spec: check if all tasks for parent spec are Complete
-        parent_spec_id = _find_parent_ref(completed_path, "Implements")
+        parent_spec_id = _find_parent_ref(completed_path, "Implements", sd)
         if parent_spec_id:
-            spec_files = list(sd.glob(f"specs/{parent_spec_id}-*.md"))
-            if spec_files and _all_children_complete(sd, spec_files[0], "tasks", "Implements"):
-                result = _complete_single(spec_files[0], sd)
+            spec_file = doc_index.find_doc(parent_spec_id, "specs", sd)
+            if spec_file and _all_children_complete(sd, sd / spec_file, "tasks", "Implements"):
+                result = _complete_single(sd / spec_file, sd, batch)
                 rippled.append({"doc": result.get("file", ""), "type": "spec"})
                 # Update parent slice's Specs table
-                _update_parent_table_status(sd, "slices", parent_spec_id, "Complete")
+                _update_parent_table_status(sd, "slices", parent_spec_id, "Complete", batch)
                 # Spec → Slice — use the NEW path after rename
                 new_spec_path = sd / result.get("file", "")
-                rippled.extend(_ripple_complete(new_spec_path, sd))
+                rippled.extend(_ripple_complete(new_spec_path, sd, batch))
 
     elif "SPEC-" in name:
         # Update parent slice's Specs table
-        _update_parent_table_status(sd, "slices", completed_id, "Complete")
+        _update_parent_table_status(sd, "slices", completed_id, "Complete", batch)
 
         # Spec → Slice: check if all specs in parent slice are Complete
         parent_slice = _find_parent_slice(completed_path, sd)
         if parent_slice:
             if _all_specs_in_slice_complete(sd, parent_slice):
-                result = _complete_single(parent_slice, sd)
+                result = _complete_single(parent_slice, sd, batch)
                 rippled.append({"doc": result.get("file", ""), "type": "slice"})
                 slice_id = re.search(r"SLICE-\d+", parent_slice.name)
                 if slice_id:
                     # Update parent phase's slice references
-                    _update_parent_table_status(sd, "phases", slice_id.group(), "Complete")
+                    _update_parent_table_status(sd, "phases", slice_id.group(), "Complete", batch)
                 # Slice → Phase — use the NEW path after rename
                 new_slice_path = sd / result.get("file", "")
-                rippled.extend(_ripple_complete(new_slice_path, sd))
+                rippled.extend(_ripple_complete(new_slice_path, sd, batch))
 
     elif "SLICE-" in name:
         # Update parent phase
-        parent_phase_id = _find_parent_ref(completed_path, "Phase")
+        parent_phase_id = _find_parent_ref(completed_path, "Phase", sd)
         if parent_phase_id:
-            _update_parent_table_status(sd, "phases", completed_id, "Complete")
+            _update_parent_table_status(sd, "phases", completed_id, "Complete", batch)
 
-            phase_files = list(sd.glob(f"phases/{parent_phase_id}-*.md"))
-            if phase_files and _all_children_complete_by_phase(sd, phase_files[0]):
-                result = _complete_single(phase_files[0], sd)
+            phase_file = doc_index.find_doc(parent_phase_id, "phases", sd)
+            if phase_file and _all_children_complete_by_phase(sd, sd / phase_file):
+                result = _complete_single(sd / phase_file, sd, batch)
                 rippled.append({"doc": result.get("file", ""), "type": "phase"})
                 # Update roadmap with phase completion
-                _update_roadmap_phase_status(sd, parent_phase_id, "Complete")
+                _update_roadmap_phase_status(sd, parent_phase_id, "Complete", batch)
 
     elif "PHASE-" in name:
         # Update roadmap
-        _update_roadmap_phase_status(sd, completed_id, "Complete")
+        _update_roadmap_phase_status(sd, completed_id, "Complete", batch)
 
     return rippled
 
 
-def _update_parent_table_status(sd, parent_dir, child_id, new_status):
+def _update_parent_table_status(sd, parent_dir, child_id, new_status, batch):
     """Update a child's status in parent doc tables (e.g., slice's Tasks/Specs table)."""
-    for parent_file in sd.glob(f"{parent_dir}/*-*.md"):
+    for rel in doc_index.referencing(child_id, parent_dir, scaffold_dir=sd):
+        parent_file = sd / rel
         if parent_file.name.startswith("_"):
             continue
-        content = parent_file.read_text(encoding="utf-8")
-        if child_id in content:
-            # Find table rows containing this child ID and update status
-            updated = re.sub(
-                rf"(\|\s*{re.escape(child_id)}\s*\|.*?\|)\s*\w+\s*\|",
-                rf"\1 {new_status} |",
-                content
-            )
-            if updated != content:
-                parent_file.write_text(updated, encoding="utf-8")
-                return True
+        content = _read_doc(parent_file, batch)
+        # Find table rows containing this child ID and update status
+        updated = re.sub(
+            rf"(\|\s*{re.escape(child_id)}\s*\|.*?\|)\s*\w+\s*\|",
+            rf"\1 {new_status} |",
+            content
+        )
+        if updated != content:
+            _write_doc(parent_file, updated, batch)
+            return True
     return False
 
 
-def _update_roadmap_phase_status(sd, phase_id, new_status):
+def _update_roadmap_phase_status(sd, phase_id, new_status, batch):
     """Update a phase's status in the roadmap."""
     roadmap = sd / "phases" / "roadmap.md"
     if not roadmap.exists():
         return False
-    content = roadmap.read_text(encoding="utf-8")
+    content = _read_doc(roadmap, batch)
     updated = re.sub(
         rf"(\|\s*{re.escape(phase_id)}\s*\|.*?\|)\s*\w+\s*\|",
         rf"\1 {new_status} |",
@@ -212,34 +335,31 @@ def _update_roadmap_phase_status(sd, phase_id, new_status):
             rf"\1{new_status} ({today}) |",
             updated
         )
-        roadmap.write_text(updated, encoding="utf-8")
+        _write_doc(roadmap, updated, batch)
         return True
     return False
 
 
-def _find_parent_ref(doc_path, field_name):
+def _find_parent_ref(doc_path, field_name, sd=None):
     """Extract a parent reference field (e.g., Implements: SPEC-001) from a doc."""
-    if not doc_path.exists():
+    sd = sd or SCAFFOLD_DIR
+    entry = doc_index.get_doc(doc_path, sd)
+    if not entry:
         return None
-    content = doc_path.read_text(encoding="utf-8")
-    match = re.search(rf">\s*\*\*{field_name}:\*\*\s*(\S+)", content)
-    if match:
-        val = match.group(1).strip()
-        if val != "—" and val != "None":
-            return val
+    val = entry["meta"].get(field_name.lower().replace(" ", "_"))
+    if val and val != "—" and val != "None":
+        return val
     return None
 
 
 def _find_parent_slice(spec_path, sd):
-    """Find which slice contains this spec by scanning slice files."""
+    """Find which slice contains this spec via the doc index."""
     spec_id = re.search(r"SPEC-\d+", spec_path.name)
     if not spec_id:
         return None
-    spec_id = spec_id.group()
-    for slice_file in sd.glob("slices/SLICE-*-*.md"):
-        content = slice_file.read_text(encoding="utf-8")
-        if spec_id in content:
-            return slice_file
+    for rel in doc_index.referencing(spec_id.group(), "slices", scaffold_dir=sd):
+        if Path(rel).name.startswith("SLICE-"):
+            return sd / rel
     return None
 
 
@@ -252,19 +372,14 @@ def _all_children_complete(sd, parent_path, child_dir, ref_field):
         return False
     parent_id = parent_id.group()
 
+    field = ref_field.lower().replace(" ", "_")
     found_any = False
-    for child_file in sd.glob(f"{child_dir}/*-*.md"):
-        if child_file.name.startswith("_"):
+    for rel, status in doc_index.child_statuses(parent_id, field, child_dir, sd).items():
+        if Path(rel).name.startswith("_"):
             continue
-        content = child_file.read_text(encoding="utf-8")
-        # Check if this child references our parent
-        if parent_id in content:
-            ref_match = re.search(rf">\s*\*\*{ref_field}:\*\*\s*{re.escape(parent_id)}", content)
-            if ref_match:
-                found_any = True
-                status_match = re.search(r">\s*\*\*Status:\*\*\s*(\w+)", content)
-                if status_match and status_match.group(1) != "Complete":
-                    return False
+        found_any = True
+        if status and status != "Complete":
+            return False
 
     return found_any  # False if no children exist
 
@@ -272,32 +387,19 @@ def _all_children_complete(sd, parent_path, child_dir, ref_field):
 def _all_specs_in_slice_complete(sd, slice_path):
     """Check if all specs listed in a slice's Specs Included table are Complete.
     Returns False if no specs found (empty slice can't be Complete)."""
-    content = slice_path.read_text(encoding="utf-8")
-    # Extract spec IDs only from the Specs Included section, not the whole file
-    specs_section = ""
-    in_section = False
-    for line in content.splitlines():
-        if "### Specs Included" in line:
-            in_section = True
-            continue
-        if in_section and line.strip().startswith("##"):
-            break
-        if in_section:
-            specs_section += line + "\n"
-
-    spec_ids = set(re.findall(r"SPEC-\d+", specs_section))
+    # Spec IDs only from the Specs Included section, not the whole file
+    spec_ids = [r for r in doc_index.section_refs(slice_path, "### Specs Included", sd)
+                if r.startswith("SPEC-")]
     if not spec_ids:
         return False  # no specs = not complete
 
     for spec_id in spec_ids:
-        spec_files = list(sd.glob(f"specs/{spec_id}-*.md"))
-        if spec_files:
-            spec_content = spec_files[0].read_text(encoding="utf-8")
-            status = re.search(r">\s*\*\*Status:\*\*\s*(\w+)", spec_content)
-            if status and status.group(1) != "Complete":
-                return False
-        else:
+        spec_file = doc_index.find_doc(spec_id, "specs", sd)
+        if not spec_file:
             return False  # spec file missing = not complete
+        status = doc_index.get_doc(spec_file, sd).get("status")
+        if status and status != "Complete":
+            return False
     return True
 
 
@@ -310,15 +412,12 @@ def _all_children_complete_by_phase(sd, phase_path):
     phase_id = phase_id.group()
 
     found_any = False
-    for slice_file in sd.glob("slices/SLICE-*-*.md"):
-        content = slice_file.read_text(encoding="utf-8")
-        if phase_id in content:
-            phase_ref = re.search(rf">\s*\*\*Phase:\*\*\s*{re.escape(phase_id)}", content)
-            if phase_ref:
-                found_any = True
-                status = re.search(r">\s*\*\*Status:\*\*\s*(\w+)", content)
-                if status and status.group(1) != "Complete":
-                    return False
+    for rel, status in doc_index.child_statuses(phase_id, "phase", "slices", sd).items():
+        if not Path(rel).name.startswith("SLICE-"):
+            continue
+        found_any = True
+        if status and status != "Complete":
+            return False
 
     return found_any  # False if no slices exist for this phase
 
@@ -388,6 +487,8 @@ def build_and_test(files=None, skip_unit=False, skip_lint=False, project_root=No
 
 def _run_cmd(cmd, cwd):
     """Run a shell command and return result."""
+    import subprocess
+
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=300, cwd=str(cwd))
         return {
@@ -404,25 +505,24 @@ def _run_cmd(cmd, cwd):
 # Reorder Tasks — Topological sort by dependency
 # ---------------------------------------------------------------------------
 
-def reorder_tasks(task_dir=None, scaffold_dir=None):
-    """Topological sort tasks by Depends on field. Returns ordered list."""
+def _task_graph(task_dir=None, scaffold_dir=None):
+    """Task entries by ID and their dependency analysis (dep_graph.analyze)."""
     sd = Path(scaffold_dir) if scaffold_dir else SCAFFOLD_DIR
     tdir = sd / (task_dir or "tasks")
 
     tasks = {}
-    for task_file in sorted(tdir.glob("TASK-*-*.md")):
-        content = task_file.read_text(encoding="utf-8")
+    task_glob = f"{tdir.relative_to(sd).as_posix()}/TASK-*-*.md"
+    for rel in doc_index.find_docs(task_glob, sd):
+        task_file = sd / rel
         task_id_match = re.search(r"TASK-\d+", task_file.name)
         if not task_id_match:
             continue
         task_id = task_id_match.group()
 
         deps = []
-        dep_match = re.search(r">\s*\*\*Depends on:\*\*\s*(.+)", content)
-        if dep_match:
-            dep_text = dep_match.group(1).strip()
-            if dep_text != "—" and dep_text != "None":
-                deps = re.findall(r"TASK-\d+", dep_text)
+        dep_text = doc_index.get_doc(rel, sd)["meta"].get("depends_on", "")
+        if dep_text and dep_text != "—" and dep_text != "None":
+            deps = re.findall(r"TASK-\d+", dep_text)
 
         tasks[task_id] = {
             "id": task_id,
@@ -430,36 +530,54 @@ def reorder_tasks(task_dir=None, scaffold_dir=None):
             "depends_on": deps,
         }
 
-    # Kahn's algorithm
-    in_degree = {tid: 0 for tid in tasks}
-    graph = {tid: [] for tid in tasks}
+    graph = dep_graph.analyze(sorted(tasks), {tid: t["depends_on"] for tid, t in tasks.items()})
+    return tasks, graph
 
-    for tid, task in tasks.items():
-        for dep in task["depends_on"]:
-            if dep in graph:
-                graph[dep].append(tid)
-                in_degree[tid] += 1
 
-    queue = sorted([tid for tid, deg in in_degree.items() if deg == 0])
-    ordered = []
+def reorder_tasks(task_dir=None, scaffold_dir=None):
+    """Topological sort tasks by Depends on field. Returns ordered list.
 
-    while queue:
-        node = queue.pop(0)
-        ordered.append(tasks[node])
-        for neighbor in sorted(graph.get(node, [])):
-            in_degree[neighbor] -= 1
-            if in_degree[neighbor] == 0:
-                queue.append(neighbor)
+    Each ordered task carries earliest (dependency depth), slack and
+    critical (slack 0). Tasks in or behind a cycle go last with _cycle;
+    actual cycle members also list their cycle."""
+    tasks, graph = _task_graph(task_dir, scaffold_dir)
 
-    # Cycle detection
-    remaining = [tasks[tid] for tid in tasks if tid not in [t["id"] for t in ordered]]
-    for r in remaining:
-        r["_cycle"] = True
-        ordered.append(r)
+    ordered = []
+    for tid in graph["order"]:
+        task = tasks[tid]
+        task["earliest"] = graph["earliest"][tid]
+        task["slack"] = graph["slack"][tid]
+        task["critical"] = graph["slack"][tid] == 0
+        ordered.append(task)
+
+    cycle_of = {tid: cycle for cycle in graph["cycles"] for tid in cycle}
+    for tid in graph["blocked"]:
+        task = tasks[tid]
+        task["_cycle"] = True
+        if tid in cycle_of:
+            task["cycle"] = cycle_of[tid]
+        ordered.append(task)
 
     return ordered
 
 
+def reorder_summary(task_dir=None, scaffold_dir=None):
+    """Which tasks gate throughput: the critical path, tasks with slack, and cycles."""
+    tasks, graph = _task_graph(task_dir, scaffold_dir)
+    slack = graph["slack"]
+    in_cycle = {tid for cycle in graph["cycles"] for tid in cycle}
+    return {
+        "total": len(tasks),
+        "order": graph["order"],
+        "critical_path": graph["critical_path"],
+        "critical_path_length": graph["length"],
+        "critical": [tid for tid in graph["order"] if slack[tid] == 0],
+        "slack": {tid: slack[tid] for tid in graph["order"] if slack[tid] > 0},
+        "cycles": graph["cycles"],
+        "blocked_by_cycle": [tid for tid in graph["blocked"] if tid not in in_cycle],
+    }
+
+
 # ---------------------------------------------------------------------------
 # Sync Reference Docs — Update refs from code/doc changes
 # ---------------------------------------------------------------------------
@@ -653,6 +771,9 @@ def approve_doc(doc_path, scaffold_dir=None):
     if new_name != old_name:
         new_path = abs_path.parent / new_name
         abs_path.rename(new_path)
+        doc_index.rename_doc(abs_path, new_path, sd)
+    else:
+        doc_index.update_doc(abs_path, sd)
 
     # Update index
     index_files = list(abs_path.parent.glob("_index.md"))
@@ -660,6 +781,7 @@ def approve_doc(doc_path, scaffold_dir=None):
         idx_content = index_files[0].read_text(encoding="utf-8")
         idx_content = idx_content.replace(old_name, new_name)
         index_files[0].write_text(idx_content, encoding="utf-8")
+        doc_index.update_doc(index_files[0], sd)
 
     return {"status": "ok", "file": new_name, "old_status": current_status}
 
@@ -668,13 +790,24 @@ def approve_doc(doc_path, scaffold_dir=None):
 # CLI
 # ---------------------------------------------------------------------------
 
+def _read_manifest(path):
+    """Read a completion manifest: a JSON list of paths, or one path per line
+    (blank lines and # comments ignored)."""
+    text = Path(path).read_text(encoding="utf-8")
+    if text.lstrip().startswith("["):
+        return [str(p) for p in json.loads(text)]
+    return [line.strip() for line in text.splitlines()
+            if line.strip() and not line.strip().startswith("#")]
+
+
 def main():
     parser = argparse.ArgumentParser(description="Scaffold utility functions")
     subparsers = parser.add_subparsers(dest="command")
 
     # complete
-    p_comp = subparsers.add_parser("complete", help="Mark a doc as Complete")
-    p_comp.add_argument("doc", help="Document path relative to scaffold/")
+    p_comp = subparsers.add_parser("complete", help="Mark one or more docs as Complete")
+    p_comp.add_argument("docs", nargs="*", help="Document paths relative to scaffold/")
+    p_comp.add_argument("--manifest", help="File listing docs to complete (one path per line, or a JSON list)")
 
     # build-test
     p_build = subparsers.add_parser("build-test", help="Run build and tests")
@@ -685,6 +818,8 @@ def main():
     # reorder
     p_reorder = subparsers.add_parser("reorder", help="Topological sort tasks")
     p_reorder.add_argument("--task-dir", default="tasks")
+    p_reorder.add_argument("--summary", action="store_true",
+                           help="Report the critical path, per-task slack and cycles instead of the list")
 
     # sync-refs
     p_sync = subparsers.add_parser("sync-refs", help="Sync reference docs with code changes")
@@ -704,13 +839,22 @@ def main():
         sys.exit(1)
 
     if args.command == "complete":
-        result = complete_doc(args.doc)
+        docs = list(args.docs)
+        if args.manifest:
+            docs.extend(_read_manifest(args.manifest))
+        if not docs:
+            print(json.dumps({"status": "error", "message": "No documents given."}, indent=2))
+            sys.exit(1)
+        if len(docs) == 1:
+            result = complete_doc(docs[0])
+        else:
+            result = complete_docs(docs)
         print(json.dumps(result, indent=2))
     elif args.command == "build-test":
         result = build_and_test(args.files, args.skip_unit, args.skip_lint)
         print(json.dumps(result, indent=2))
     elif args.command == "reorder":
-        result = reorder_tasks(args.task_dir)
+        result = reorder_summary(args.task_dir) if args.summary else reorder_tasks(args.task_dir)
         print(json.dumps(result, indent=2))
     elif args.command == "sync-refs":
         result = sync_reference_docs(args.files)
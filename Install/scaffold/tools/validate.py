@@ -10,16 +10,32 @@ Uses action.json/result.json for report output only (no adjudication or apply).
 Commands:
     preflight    Check if scope is ready for validation.
     run          Execute all checks for the given scope, write action.json with report data.
+                 Findings are cached per (check, file content, check config, glossary);
+                 --changed-since REF|TIME limits per-file checks to changed files.
 """
 
+import daemon
+import startup_profile
+
+if __name__ == "__main__":
+    # --profile-startup: re-run under -X importtime and report (startup_profile.py)
+    startup_profile.from_argv(__file__)
+    daemon.forward_cli("validate")
+
 import json
 import os
 import sys
 import argparse
+import hashlib
 import re
+import time
 from pathlib import Path
 from datetime import datetime
 
+import config_loader
+import doc_index
+import glossary_match
+
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -30,193 +46,343 @@ CONFIGS_DIR = TOOLS_DIR / "configs" / "validate"
 SCAFFOLD_DIR = TOOLS_DIR.parent
 REVIEWS_DIR = SCAFFOLD_DIR / ".reviews" / "validate"
 ACTION_FILE = REVIEWS_DIR / "action.json"
+CACHE_FILE = REVIEWS_DIR / "cache.json"
+CACHE_VERSION = 1
 
 
 # ---------------------------------------------------------------------------
-# YAML Parser (shared — minimal, no dependencies)
+# Config
 # ---------------------------------------------------------------------------
 
-def _parse_yaml_value(val):
-    val = val.strip()
-    if val == "" or val == "~" or val == "null":
-        return None
-    if val == "true" or val == "True":
-        return True
-    if val == "false" or val == "False":
-        return False
-    try:
-        return int(val)
-    except ValueError:
-        pass
-    try:
-        return float(val)
-    except ValueError:
-        pass
-    if (val.startswith('"') and val.endswith('"')) or \
-       (val.startswith("'") and val.endswith("'")):
-        return val[1:-1]
-    return val
+def load_scope_config(scope):
+    config_path = CONFIGS_DIR / f"{scope}.yaml"
+    return config_loader.load_config(config_path, "validate")
+
+
+# ---------------------------------------------------------------------------
+# Check Runners
+# ---------------------------------------------------------------------------
 
+def _run_checks(scope, config, target_range=None, run_ctx=None):
+    """Run all checks defined in config. Returns list of results.
 
-def _count_indent(line):
-    return len(line) - len(line.lstrip())
+    Checks are compiled into a plan (see _compile_plan) so each target file is
+    read and parsed once, however many checks apply to it. Pass the same
+    run_ctx across scopes to share parsed docs within one run."""
+    if run_ctx is None:
+        run_ctx = _new_run_ctx()
+    checks = config.get("checks", {})
 
+    ordered = []
+    for check in checks.get("deterministic", []):
+        if isinstance(check, dict):
+            ordered.append((check, False))
+    for check in checks.get("heuristic", []):
+        if isinstance(check, dict):
+            ordered.append((check, True))
 
-def load_yaml(path):
-    """Load a YAML file. Uses PyYAML if available, falls back to custom parser."""
-    path = Path(path)
-    if not path.exists():
-        return None
-    content = path.read_text(encoding="utf-8")
-    try:
-        import yaml
-        return yaml.safe_load(content)
-    except ImportError:
-        lines = content.splitlines()
-        return _parse_yaml_block(lines, 0, 0)[0]
-
-
-def _parse_yaml_block(lines, start, base_indent):
-    result = {}
-    i = start
-    is_list = False
-    result_list = []
-
-    while i < len(lines):
-        line = lines[i]
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            i += 1
+    plan = _compile_plan([c for c, _ in ordered], config, target_range)
+    findings = _execute_plan(plan, run_ctx)
+
+    # Emit in config order (deterministic, then heuristic) — same as a per-check run
+    results = []
+    for i, (check, heuristic) in enumerate(ordered):
+        result = findings[i]
+        if heuristic:
+            for r in result:
+                r["confidence"] = "Medium"
+                if check.get("label") == "[ADVISORY]":
+                    r["confidence"] = "Low"
+        results.extend(result)
+
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Validation Plan
+# ---------------------------------------------------------------------------
+
+# Detections evaluated per target file against the parsed doc
+_PER_FILE_DETECTIONS = {
+    "file_exists", "section_structure", "section_health", "status_filename_sync",
+    "glossary_not_column", "review_freshness", "pattern_absent", "pattern_present",
+}
+
+
+# Detections that only need the file's existence/mtime, not its content
+_STAT_ONLY_DETECTIONS = {"file_exists", "review_freshness"}
+
+# Detections whose findings depend only on the file's path and content, the
+# check's own config, and (for glossary checks) the glossary — safe to cache
+_CACHEABLE_DETECTIONS = {
+    "section_structure", "section_health", "status_filename_sync",
+    "glossary_not_column", "pattern_absent", "pattern_present",
+}
+
+
+def _new_run_ctx(use_cache=False, only_files=None):
+    """Per-run shared state: parsed docs by path, glossary loaded on first use,
+    the findings cache (if enabled) and an optional changed-files filter."""
+    return {
+        "docs": {},
+        "glossary": None,
+        "glossary_hash": None,
+        "reads": 0,
+        "cache": _load_cache() if use_cache else None,
+        "content_hashes": {},
+        "only": only_files,
+        "hits": 0,
+        "misses": 0,
+    }
+
+
+def _compile_plan(checks, config, target_range=None):
+    """Group per-file checks by their resolved target set.
+
+    Returns {"groups": [{"files": [...], "checks": [(index, check), ...]}],
+             "other": [(index, check), ...], "count": N, "config": config,
+             "target_range": target_range}
+    where index is the check's position in `checks`."""
+    groups = {}
+    other = []
+    for i, check in enumerate(checks):
+        if check.get("detection", "") not in _PER_FILE_DETECTIONS:
+            other.append((i, check))
             continue
-        indent = _count_indent(line)
-        if indent < base_indent:
-            break
-        if indent == base_indent:
-            if stripped.startswith("- "):
-                is_list = True
-                item_text = stripped[2:].strip()
-                if ":" in item_text and not item_text.startswith('"'):
-                    colon_pos = item_text.index(":")
-                    key = item_text[:colon_pos].strip()
-                    val_text = item_text[colon_pos + 1:].strip()
-                    item_dict = {key: _parse_yaml_value(val_text)} if val_text else {key: None}
-                    next_i = i + 1
-                    if next_i < len(lines):
-                        next_stripped = lines[next_i].strip()
-                        next_indent = _count_indent(lines[next_i]) if next_stripped else 0
-                        if next_stripped and next_indent > indent:
-                            child, next_i = _parse_yaml_block(lines, next_i, next_indent)
-                            if not val_text:
-                                item_dict[key] = child
-                            i = next_i
-                            result_list.append(item_dict)
-                            continue
-                    i += 1
-                    result_list.append(item_dict)
+        files = tuple(_resolve_target_files(check, config, target_range))
+        groups.setdefault(files, []).append((i, check))
+    return {
+        "groups": [{"files": list(files), "checks": members} for files, members in groups.items()],
+        "other": other,
+        "count": len(checks),
+        "config": config,
+        "target_range": target_range,
+    }
+
+
+def _execute_plan(plan, run_ctx):
+    """Run a compiled plan. Returns a list of findings lists, one per check."""
+    findings = [[] for _ in range(plan["count"])]
+    cache = run_ctx["cache"]
+    for group in plan["groups"]:
+        check_shas = {i: _check_hash(check) for i, check in group["checks"]} if cache else {}
+        for f in group["files"]:
+            if run_ctx["only"] is not None and f not in run_ctx["only"]:
+                continue
+            for i, check in group["checks"]:
+                key = _cache_key(check, check_shas.get(i), f, run_ctx)
+                if key and key in cache["findings"]:
+                    findings[i].extend(dict(r) for r in cache["findings"][key])
+                    cache["seen"].add(key)
+                    run_ctx["hits"] += 1
                     continue
+                if check.get("detection") in _STAT_ONLY_DETECTIONS:
+                    doc = _stat_doc(f, run_ctx)
                 else:
-                    result_list.append(_parse_yaml_value(item_text))
-                    i += 1
-                    continue
-            if ":" in stripped:
-                colon_pos = stripped.index(":")
-                key = stripped[:colon_pos].strip()
-                val_text = stripped[colon_pos + 1:].strip()
-                if val_text.startswith("[") and val_text.endswith("]"):
-                    inner = val_text[1:-1]
-                    items = [_parse_yaml_value(x.strip()) for x in inner.split(",")] if inner.strip() else []
-                    result[key] = items
-                    i += 1
-                    continue
-                if val_text:
-                    result[key] = _parse_yaml_value(val_text)
-                    i += 1
-                    continue
-                next_i = i + 1
-                while next_i < len(lines) and not lines[next_i].strip():
-                    next_i += 1
-                if next_i < len(lines):
-                    next_indent = _count_indent(lines[next_i])
-                    if next_indent > base_indent:
-                        child, next_i = _parse_yaml_block(lines, next_i, next_indent)
-                        result[key] = child
-                        i = next_i
-                        continue
-                result[key] = None
-                i += 1
-                continue
-        i += 1
-
-    if is_list:
-        return result_list, i
-    return result, i
+                    doc = _parsed_doc(f, run_ctx)
+                result = _check_doc(check, f, doc, run_ctx)
+                if key:
+                    cache["findings"][key] = [dict(r) for r in result]
+                    cache["seen"].add(key)
+                    run_ctx["misses"] += 1
+                findings[i].extend(result)
+    for i, check in plan["other"]:
+        findings[i].extend(_run_single_check(check, plan["config"], plan["target_range"], run_ctx))
+    return findings
+
+
+def _parsed_doc(f, run_ctx):
+    """Read and parse a target file once per run. Returns None if missing."""
+    docs = run_ctx["docs"]
+    if f not in docs:
+        abs_path = SCAFFOLD_DIR / f
+        if not abs_path.exists():
+            docs[f] = None
+        else:
+            content = abs_path.read_text(encoding="utf-8")
+            run_ctx["reads"] += 1
+            parsed = doc_index.parse_doc(content, abs_path.name)
+            docs[f] = {
+                "content": content,
+                "headings": parsed["headings"],
+                "heading_texts": [re.sub(r"^#+\s+", "", h) for h in parsed["headings"]],
+                "status": parsed["status"],
+                "meta": parsed["meta"],
+                "mtime": abs_path.stat().st_mtime,
+            }
+    return docs[f]
 
 
 # ---------------------------------------------------------------------------
-# Config
+# Findings Cache
 # ---------------------------------------------------------------------------
 
-def load_scope_config(scope):
-    config_path = CONFIGS_DIR / f"{scope}.yaml"
-    if not config_path.exists():
+def _load_cache():
+    """Load cached findings. Layout:
+    {"files": {path: {mtime, size, sha}}, "findings": {key: [finding, ...]}}"""
+    cache = {"files": {}, "findings": {}}
+    if CACHE_FILE.exists():
+        try:
+            data = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+            if data.get("version") == CACHE_VERSION:
+                cache["files"] = data.get("files", {})
+                cache["findings"] = data.get("findings", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+    cache["seen"] = set()
+    return cache
+
+
+def _save_cache(run_ctx, prune=False):
+    """Persist the findings cache. prune=True (full run) drops keys not used
+    this run, so stale entries don't accumulate."""
+    cache = run_ctx["cache"]
+    if cache is None:
+        return
+    findings = cache["findings"]
+    if prune:
+        findings = {k: v for k, v in findings.items() if k in cache["seen"]}
+        files = {f: st for f, st in cache["files"].items() if (SCAFFOLD_DIR / f).exists()}
+    else:
+        files = cache["files"]
+    REVIEWS_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE_FILE.with_suffix(f".tmp{os.getpid()}")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"version": CACHE_VERSION, "files": files, "findings": findings}, f,
+                  separators=(",", ":"))
+    os.replace(tmp, CACHE_FILE)
+
+
+def _content_hash(f, run_ctx):
+    """Content hash of a target file. Unchanged mtime/size reuses the stored
+    hash without reading the file. Returns None if the file is missing."""
+    if f in run_ctx["content_hashes"]:
+        return run_ctx["content_hashes"][f]
+    sha = None
+    try:
+        st = (SCAFFOLD_DIR / f).stat()
+    except OSError:
+        st = None
+    if st is not None:
+        stamps = run_ctx["cache"]["files"]
+        stamp = stamps.get(f)
+        if stamp and stamp.get("mtime") == st.st_mtime and stamp.get("size") == st.st_size:
+            sha = stamp["sha"]
+        else:
+            doc = _parsed_doc(f, run_ctx)
+            sha = hashlib.sha256(doc["content"].encode("utf-8")).hexdigest()
+            stamps[f] = {"mtime": st.st_mtime, "size": st.st_size, "sha": sha}
+    run_ctx["content_hashes"][f] = sha
+    return sha
+
+
+def _check_hash(check):
+    return hashlib.sha256(json.dumps(check, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _cache_key(check, check_sha, f, run_ctx):
+    """Cache key for (check config, file, content[, glossary]), or None if the
+    check isn't cacheable or caching is off."""
+    if run_ctx["cache"] is None or check.get("detection", "") not in _CACHEABLE_DETECTIONS:
         return None
-    return load_yaml(config_path)
+    content_sha = _content_hash(f, run_ctx)
+    if content_sha is None:
+        return None
+    parts = [check.get("id", ""), f, content_sha, check_sha]
+    if check.get("detection") == "glossary_not_column":
+        if run_ctx["glossary_hash"] is None:
+            run_ctx["glossary_hash"] = glossary_match.glossary_hash(SCAFFOLD_DIR)
+        parts.append(run_ctx["glossary_hash"])
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
 
 
 # ---------------------------------------------------------------------------
-# Check Runners
+# Changed Files
 # ---------------------------------------------------------------------------
 
-def _run_checks(scope, config, target_range=None):
-    """Run all checks defined in config. Returns list of results."""
-    results = []
-    checks = config.get("checks", {})
+def _changed_files(since, known_files=()):
+    """Scaffold-relative paths changed since a git ref or a timestamp
+    (ISO date/datetime or epoch seconds). Returns (set, error).
+
+    Deleted docs count as changed, and so do the docs that reference them.
+    An mtime can't show a deletion, so in timestamp mode any of known_files
+    (the findings cache's file set) that no longer exists is a change."""
+    changed, error = _modified_files(since)
+    if error:
+        return None, error
+    changed |= {f for f in known_files if not (SCAFFOLD_DIR / f).exists()}
+    for rel in [f for f in changed if not (SCAFFOLD_DIR / f).exists()]:
+        doc_id = doc_index.first_id(Path(rel).name)
+        if doc_id:
+            changed.update(doc_index.referencing(doc_id))
+    return changed, None
+
+
+def _modified_files(since):
+    """Paths whose mtime is after a timestamp, or that git reports as changed
+    since a ref. Returns (set, error)."""
+    ts = None
+    try:
+        ts = float(since)
+    except ValueError:
+        try:
+            ts = datetime.fromisoformat(since).timestamp()
+        except ValueError:
+            ts = None
+
+    if ts is not None:
+        changed = set()
+        for rel, entry in doc_index.get_index().items():
+            if entry.get("mtime", 0) > ts:
+                changed.add(rel)
+        return changed, None
+
+    import subprocess
+
+    changed = set()
+    for cmd in (["git", "diff", "--name-only", "--relative", since],
+                ["git", "ls-files", "--others", "--exclude-standard"]):
+        try:
+            proc = subprocess.run(cmd, capture_output=True, text=True, cwd=str(SCAFFOLD_DIR), timeout=30)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            return None, f"{' '.join(cmd)} failed: {e}"
+        if proc.returncode != 0:
+            detail = (proc.stderr.strip().splitlines() or [""])[0]
+            return None, f"'{since}' is not a timestamp or git ref: {detail}"
+        changed.update(line.strip() for line in proc.stdout.splitlines() if line.strip())
+    return changed, None
+
+
+def _stat_doc(f, run_ctx):
+    """Existence/mtime view of a target file, without reading it unless it was
+    already parsed this run. Returns None if missing."""
+    if f in run_ctx["docs"]:
+        return run_ctx["docs"][f]
+    try:
+        return {"mtime": (SCAFFOLD_DIR / f).stat().st_mtime}
+    except OSError:
+        return None
 
-    # Deterministic checks
-    deterministic = checks.get("deterministic", [])
-    for check in deterministic:
-        if not isinstance(check, dict):
-            continue
-        result = _run_single_check(check, config, target_range)
-        if result:
-            results.extend(result)
-
-    # Heuristic checks
-    heuristic = checks.get("heuristic", [])
-    for check in heuristic:
-        if not isinstance(check, dict):
-            continue
-        result = _run_single_check(check, config, target_range)
-        if result:
-            for r in result:
-                r["confidence"] = "Medium"
-                if check.get("label") == "[ADVISORY]":
-                    r["confidence"] = "Low"
-            results.extend(result)
 
-    return results
+def _doc_health(doc):
+    if "health" not in doc:
+        doc["health"] = _calculate_health(doc["content"])
+    return doc["health"]
 
 
-def _run_single_check(check, config, target_range=None):
+def _run_single_check(check, config, target_range=None, run_ctx=None):
     """Run a single check. Returns list of findings (may be empty)."""
+    if run_ctx is None:
+        run_ctx = _new_run_ctx()
     check_id = check.get("id", "")
     detection = check.get("detection", "")
     severity = check.get("severity", "WARN")
     description = check.get("description", check_id)
     findings = []
 
-    # File existence checks
-    if detection == "file_exists":
-        target_files = _resolve_target_files(check, config, target_range)
-        for f in target_files:
-            if not (SCAFFOLD_DIR / f).exists():
-                findings.append({
-                    "check_id": check_id,
-                    "status": severity,
-                    "description": description,
-                    "detail": f"File not found: {f}",
-                    "confidence": "High",
-                })
+    if detection in _PER_FILE_DETECTIONS:
+        for f in _resolve_target_files(check, config, target_range):
+            findings.extend(_check_doc(check, f, _parsed_doc(f, run_ctx), run_ctx))
 
     # Index registration checks
     elif detection == "index_registration":
@@ -224,7 +390,7 @@ def _run_single_check(check, config, target_range=None):
         glob_pattern = check.get("glob_pattern", "")
         if index_file.exists() and glob_pattern:
             index_content = index_file.read_text(encoding="utf-8")
-            for match in sorted(SCAFFOLD_DIR.glob(glob_pattern)):
+            for match in (SCAFFOLD_DIR / rel for rel in doc_index.find_docs(glob_pattern)):
                 # Extract ID from filename
                 id_match = re.search(check.get("id_pattern", r"(SYS|SPEC|TASK|SLICE|P)\S+"), match.name)
                 if id_match:
@@ -238,157 +404,153 @@ def _run_single_check(check, config, target_range=None):
                             "confidence": "High",
                         })
 
+    # If no specific handler, return empty
+    return findings
+
+
+def _check_doc(check, f, doc, run_ctx):
+    """Evaluate one per-file check against a parsed doc (None if missing)."""
+    check_id = check.get("id", "")
+    detection = check.get("detection", "")
+    severity = check.get("severity", "WARN")
+    description = check.get("description", check_id)
+    findings = []
+
+    # File existence checks
+    if detection == "file_exists":
+        if doc is None:
+            findings.append({
+                "check_id": check_id,
+                "status": severity,
+                "description": description,
+                "detail": f"File not found: {f}",
+                "confidence": "High",
+            })
+        return findings
+
+    if doc is None:
+        return findings
+
     # Section structure checks
-    elif detection == "section_structure":
-        target_files = _resolve_target_files(check, config, target_range)
-        required_sections = check.get("required_sections", [])
-        for f in target_files:
-            abs_path = SCAFFOLD_DIR / f
-            if abs_path.exists():
-                content = abs_path.read_text(encoding="utf-8")
-                headings = [line.strip() for line in content.splitlines() if line.strip().startswith("#")]
-                heading_texts = [re.sub(r"^#+\s+", "", h) for h in headings]
-                for req in required_sections:
-                    if req not in heading_texts:
-                        findings.append({
-                            "check_id": check_id,
-                            "status": severity,
-                            "description": description,
-                            "detail": f"Missing section '{req}' in {f}",
-                            "confidence": "High",
-                        })
+    if detection == "section_structure":
+        for req in check.get("required_sections", []):
+            if req not in doc["heading_texts"]:
+                findings.append({
+                    "check_id": check_id,
+                    "status": severity,
+                    "description": description,
+                    "detail": f"Missing section '{req}' in {f}",
+                    "confidence": "High",
+                })
 
     # Section health checks
     elif detection == "section_health":
-        target_files = _resolve_target_files(check, config, target_range)
         fail_threshold = check.get("fail_threshold", 0.4)
         warn_threshold = check.get("warn_threshold", 0.65)
-        for f in target_files:
-            abs_path = SCAFFOLD_DIR / f
-            if abs_path.exists():
-                content = abs_path.read_text(encoding="utf-8")
-                health = _calculate_health(content)
-                if health < fail_threshold:
-                    findings.append({
-                        "check_id": check_id,
-                        "status": "FAIL",
-                        "description": description,
-                        "detail": f"{f}: health {health:.0%} (< {fail_threshold:.0%} threshold)",
-                        "confidence": "High",
-                    })
-                elif health < warn_threshold:
-                    findings.append({
-                        "check_id": check_id,
-                        "status": "WARN",
-                        "description": description,
-                        "detail": f"{f}: health {health:.0%} (< {warn_threshold:.0%} threshold)",
-                        "confidence": "High",
-                    })
+        health = _doc_health(doc)
+        if health < fail_threshold:
+            findings.append({
+                "check_id": check_id,
+                "status": "FAIL",
+                "description": description,
+                "detail": f"{f}: health {health:.0%} (< {fail_threshold:.0%} threshold)",
+                "confidence": "High",
+            })
+        elif health < warn_threshold:
+            findings.append({
+                "check_id": check_id,
+                "status": "WARN",
+                "description": description,
+                "detail": f"{f}: health {health:.0%} (< {warn_threshold:.0%} threshold)",
+                "confidence": "High",
+            })
 
     # Status-filename sync
     elif detection == "status_filename_sync":
-        target_files = _resolve_target_files(check, config, target_range)
-        for f in target_files:
-            abs_path = SCAFFOLD_DIR / f
-            if abs_path.exists():
-                content = abs_path.read_text(encoding="utf-8")
-                status_match = re.search(r">\s*\*\*Status:\*\*\s*(\w+)", content)
-                if status_match:
-                    internal_status = status_match.group(1).lower()
-                    filename = Path(f).stem
-                    for suffix in ["_draft", "_review", "_approved", "_complete", "_deprecated"]:
-                        if filename.endswith(suffix):
-                            file_status = suffix[1:]  # strip leading _
-                            if file_status != internal_status:
-                                findings.append({
-                                    "check_id": check_id,
-                                    "status": severity,
-                                    "description": description,
-                                    "detail": f"{f}: filename says '{file_status}' but Status field says '{internal_status}'",
-                                    "confidence": "High",
-                                })
-                            break
-
-    # Glossary compliance
-    elif detection == "glossary_not_column":
-        not_terms = _load_glossary()
-        target_files = _resolve_target_files(check, config, target_range)
-        for f in target_files:
-            abs_path = SCAFFOLD_DIR / f
-            if abs_path.exists():
-                content = abs_path.read_text(encoding="utf-8")
-                for bad_term, canonical in not_terms.items():
-                    pattern = rf"\b{re.escape(bad_term)}\b"
-                    if re.search(pattern, content, re.IGNORECASE):
+        if doc["status"]:
+            internal_status = doc["status"].lower()
+            filename = Path(f).stem
+            for suffix in ["_draft", "_review", "_approved", "_complete", "_deprecated"]:
+                if filename.endswith(suffix):
+                    file_status = suffix[1:]  # strip leading _
+                    if file_status != internal_status:
                         findings.append({
                             "check_id": check_id,
                             "status": severity,
                             "description": description,
-                            "detail": f"{f}: uses '{bad_term}' (canonical: '{canonical}')",
-                            "confidence": "Medium" if check.get("label") == "[ADVISORY]" else "High",
+                            "detail": f"{f}: filename says '{file_status}' but Status field says '{internal_status}'",
+                            "confidence": "High",
                         })
+                    break
+
+    # Glossary compliance
+    elif detection == "glossary_not_column":
+        if run_ctx["glossary"] is None:
+            run_ctx["glossary"] = glossary_match.get_matcher(SCAFFOLD_DIR)
+        terms = run_ctx["glossary"]["terms"]
+        reported = set()
+        for idx, _, _ in glossary_match.scan(run_ctx["glossary"], doc["content"]):
+            if idx in reported:
+                continue
+            reported.add(idx)
+            bad_term, canonical = terms[idx]
+            findings.append({
+                "check_id": check_id,
+                "status": severity,
+                "description": description,
+                "detail": f"{f}: uses '{bad_term}' (canonical: '{canonical}')",
+                "confidence": "Medium" if check.get("label") == "[ADVISORY]" else "High",
+            })
 
     # Review freshness
     elif detection == "review_freshness":
-        target_files = _resolve_target_files(check, config, target_range)
         review_dir = SCAFFOLD_DIR / "decisions" / "review"
-        for f in target_files:
-            abs_path = SCAFFOLD_DIR / f
-            if abs_path.exists():
-                file_mtime = abs_path.stat().st_mtime
-                # Find matching review log
-                stem = Path(f).stem
-                review_pattern = check.get("review_pattern", f"ITERATE-*{stem}*")
-                reviews = sorted(review_dir.glob(review_pattern)) if review_dir.exists() else []
-                if not reviews:
-                    findings.append({
-                        "check_id": check_id,
-                        "status": severity,
-                        "description": description,
-                        "detail": f"{f}: no review log found",
-                        "confidence": "High",
-                    })
-                else:
-                    latest_review = reviews[-1]
-                    review_mtime = latest_review.stat().st_mtime
-                    if file_mtime > review_mtime:
-                        findings.append({
-                            "check_id": check_id,
-                            "status": severity,
-                            "description": description,
-                            "detail": f"{f}: modified after last review ({latest_review.name})",
-                            "confidence": "High",
-                        })
+        # Find matching review log
+        stem = Path(f).stem
+        review_pattern = check.get("review_pattern", f"ITERATE-*{stem}*")
+        reviews = sorted(review_dir.glob(review_pattern)) if review_dir.exists() else []
+        if not reviews:
+            findings.append({
+                "check_id": check_id,
+                "status": severity,
+                "description": description,
+                "detail": f"{f}: no review log found",
+                "confidence": "High",
+            })
+        else:
+            latest_review = reviews[-1]
+            if doc["mtime"] > latest_review.stat().st_mtime:
+                findings.append({
+                    "check_id": check_id,
+                    "status": severity,
+                    "description": description,
+                    "detail": f"{f}: modified after last review ({latest_review.name})",
+                    "confidence": "High",
+                })
 
     # Generic pattern check
     elif detection == "pattern_absent" or detection == "pattern_present":
-        target_files = _resolve_target_files(check, config, target_range)
         pattern = check.get("pattern", "")
         if pattern:
-            for f in target_files:
-                abs_path = SCAFFOLD_DIR / f
-                if abs_path.exists():
-                    content = abs_path.read_text(encoding="utf-8")
-                    found = bool(re.search(pattern, content, re.MULTILINE | re.IGNORECASE))
-                    if detection == "pattern_absent" and found:
-                        findings.append({
-                            "check_id": check_id,
-                            "status": severity,
-                            "description": description,
-                            "detail": f"{f}: pattern should be absent: {pattern}",
-                            "confidence": check.get("confidence", "High"),
-                        })
-                    elif detection == "pattern_present" and not found:
-                        findings.append({
-                            "check_id": check_id,
-                            "status": severity,
-                            "description": description,
-                            "detail": f"{f}: pattern not found: {pattern}",
-                            "confidence": check.get("confidence", "High"),
-                        })
+            found = bool(re.search(pattern, doc["content"], re.MULTILINE | re.IGNORECASE))
+            if detection == "pattern_absent" and found:
+                findings.append({
+                    "check_id": check_id,
+                    "status": severity,
+                    "description": description,
+                    "detail": f"{f}: pattern should be absent: {pattern}",
+                    "confidence": check.get("confidence", "High"),
+                })
+            elif detection == "pattern_present" and not found:
+                findings.append({
+                    "check_id": check_id,
+                    "status": severity,
+                    "description": description,
+                    "detail": f"{f}: pattern not found: {pattern}",
+                    "confidence": check.get("confidence", "High"),
+                })
 
-    # If no specific handler, return empty
-    return findings if findings else []
+    return findings
 
 
 # ---------------------------------------------------------------------------
@@ -404,8 +566,7 @@ def _resolve_target_files(check, config, target_range=None):
         return target_files
 
     if glob_pattern:
-        matches = sorted(SCAFFOLD_DIR.glob(glob_pattern))
-        files = [str(m.relative_to(SCAFFOLD_DIR)) for m in matches]
+        files = doc_index.find_docs(glob_pattern)
         # Apply range filter if specified
         if target_range:
             files = [f for f in files if _in_range(f, target_range)]
@@ -469,27 +630,6 @@ def _calculate_health(content):
     return total / len(sections)
 
 
-def _load_glossary():
-    """Load NOT-column terms from glossary."""
-    glossary_path = SCAFFOLD_DIR / "design" / "glossary.md"
-    if not glossary_path.exists():
-        return {}
-    content = glossary_path.read_text(encoding="utf-8")
-    not_terms = {}
-    for line in content.splitlines():
-        if "|" in line and line.count("|") >= 3:
-            cells = [c.strip() for c in line.split("|")]
-            for cell in cells:
-                if cell.lower().startswith("not:") or cell.lower().startswith("not "):
-                    canonical = cells[1].strip() if len(cells) > 1 else ""
-                    bad_terms = cell.split(":", 1)[-1].strip() if ":" in cell else ""
-                    for bt in bad_terms.split(","):
-                        bt = bt.strip()
-                        if bt and canonical:
-                            not_terms[bt.lower()] = canonical
-    return not_terms
-
-
 def _write_action(data):
     REVIEWS_DIR.mkdir(parents=True, exist_ok=True)
     with open(ACTION_FILE, "w", encoding="utf-8") as f:
@@ -534,18 +674,44 @@ def cmd_preflight(args):
 def cmd_run(args):
     """Execute all checks for the given scope."""
     # Handle --scope all by running all individual scopes
+    only_files = None
+    run_ctx = _new_run_ctx(use_cache=not args.no_cache)
+    if args.changed_since:
+        cache = run_ctx["cache"] or _load_cache()
+        only_files, error = _changed_files(args.changed_since, cache["files"])
+        if error:
+            _write_action({"action": "report", "status": "error", "scope": args.scope, "message": error})
+            return
+        run_ctx["only"] = only_files
+
     if args.scope == "all":
         all_results = []
-        scope_files = sorted(CONFIGS_DIR.glob("*.yaml"))
-        for sf in scope_files:
-            scope_name = sf.stem
-            if scope_name == "all":
-                continue
-            config = load_yaml(sf)
-            if config:
-                results = _run_checks(scope_name, config, args.range)
-                all_results.extend(results)
-        _write_report(args, all_results)
+        timings = {}
+        scope_names = [sf.stem for sf in sorted(CONFIGS_DIR.glob("*.yaml")) if sf.stem != "all"]
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        if jobs > 1:
+            # Scopes are read-only and independent — run them in worker processes,
+            # then merge in sorted scope order so the report matches a serial run
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=min(jobs, len(scope_names) or 1)) as pool:
+                futures = [pool.submit(_run_scope, name, args.range, not args.no_cache, only_files)
+                           for name in scope_names]
+                outcomes = [f.result() for f in futures]
+            for outcome in outcomes:
+                all_results.extend(outcome["results"])
+                timings[outcome["scope"]] = outcome["seconds"]
+                _merge_scope_outcome(run_ctx, outcome)
+        else:
+            for scope_name in scope_names:
+                start = time.perf_counter()
+                config = load_scope_config(scope_name)
+                if config:
+                    results = _run_checks(scope_name, config, args.range, run_ctx)
+                    all_results.extend(results)
+                timings[scope_name] = round(time.perf_counter() - start, 3)
+        _save_cache(run_ctx, prune=not args.range and only_files is None)
+        _write_report(args, all_results, run_ctx, timings)
         return
 
     config = load_scope_config(args.scope)
@@ -567,11 +733,47 @@ def cmd_run(args):
             })
             return
 
-    results = _run_checks(args.scope, config, args.range)
-    _write_report(args, results)
-
-
-def _write_report(args, results):
+    start = time.perf_counter()
+    results = _run_checks(args.scope, config, args.range, run_ctx)
+    timings = {args.scope: round(time.perf_counter() - start, 3)}
+    _save_cache(run_ctx)
+    _write_report(args, results, run_ctx, timings)
+
+
+def _run_scope(scope_name, target_range, use_cache, only_files):
+    """Process-pool worker: run one scope with its own run context.
+    Returns results, timing, counters and the cache entries it produced."""
+    start = time.perf_counter()
+    run_ctx = _new_run_ctx(use_cache=use_cache, only_files=only_files)
+    config = load_scope_config(scope_name)
+    results = _run_checks(scope_name, config, target_range, run_ctx) if config else []
+    cache = run_ctx["cache"]
+    return {
+        "scope": scope_name,
+        "results": results,
+        "seconds": round(time.perf_counter() - start, 3),
+        "reads": run_ctx["reads"],
+        "hits": run_ctx["hits"],
+        "misses": run_ctx["misses"],
+        "cache_files": {f: cache["files"][f] for f in run_ctx["content_hashes"]
+                        if f in cache["files"]} if cache else {},
+        "cache_findings": {k: cache["findings"][k] for k in cache["seen"]} if cache else {},
+    }
+
+
+def _merge_scope_outcome(run_ctx, outcome):
+    """Fold a worker's counters and cache entries into the parent run context."""
+    run_ctx["reads"] += outcome["reads"]
+    run_ctx["hits"] += outcome["hits"]
+    run_ctx["misses"] += outcome["misses"]
+    cache = run_ctx["cache"]
+    if cache is not None:
+        cache["files"].update(outcome["cache_files"])
+        cache["findings"].update(outcome["cache_findings"])
+        cache["seen"].update(outcome["cache_findings"])
+
+
+def _write_report(args, results, run_ctx=None, timings=None):
     """Write the validation report as action.json."""
     # Classify results
     fails = [r for r in results if r.get("status") == "FAIL"]
@@ -598,7 +800,7 @@ def _write_report(args, results):
 
     today = datetime.now().strftime("%Y-%m-%d")
 
-    _write_action({
+    report = {
         "action": "report",
         "scope": args.scope,
         "date": today,
@@ -617,7 +819,17 @@ def _write_report(args, results):
             "low": low,
         },
         "next_step": _suggest_next(args.scope, verdict, results),
-    })
+    }
+    if timings is not None:
+        report["timings"] = timings
+    if run_ctx is not None:
+        report["files_read"] = run_ctx["reads"]
+        if run_ctx["cache"] is not None:
+            report["cache"] = {"hits": run_ctx["hits"], "misses": run_ctx["misses"]}
+        if run_ctx["only"] is not None:
+            report["changed_since"] = getattr(args, "changed_since", "")
+            report["changed_files"] = len(run_ctx["only"])
+    _write_action(report)
 
 
 def _suggest_next(scope, verdict, results):
@@ -648,7 +860,14 @@ def main():
     p_run = subparsers.add_parser("run")
     p_run.add_argument("--scope", required=True)
     p_run.add_argument("--range", default="")
-    p_run.add_argument("--incremental", action="store_true")
+    p_run.add_argument("--incremental", action="store_true",
+                       help="Reuse cached findings for unchanged files (the default; kept for compatibility)")
+    p_run.add_argument("--no-cache", action="store_true",
+                       help="Re-evaluate every check, ignoring and not updating the findings cache")
+    p_run.add_argument("--jobs", type=int, default=1,
+                       help="Worker processes for --scope all (0 = one per CPU; default 1 = serial)")
+    p_run.add_argument("--changed-since", default="",
+                       help="Only check files changed since a git ref or timestamp (ISO or epoch)")
 
     args = parser.parse_args()
     if not args.command: